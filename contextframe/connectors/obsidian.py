@@ -1,7 +1,14 @@
 """Obsidian connector for importing vault content into ContextFrame."""
 
 import json
+import logging
+import mmap
+import multiprocessing
+import os
 import re
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from contextframe import FrameRecord
 from contextframe.connectors.base import (
     AuthType,
@@ -10,9 +17,316 @@ from contextframe.connectors.base import (
     SyncResult,
 )
 from contextframe.schema import RecordType
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        # Compact separators: the cache is machine-read only
+        return json.dumps(obj, default=str, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
+
+try:
+    import yaml
+
+    try:
+        # libyaml-backed loader; same semantics as SafeLoader, much faster
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+except ImportError:
+    yaml = None
+    _YamlLoader = None
+
+logger = logging.getLogger(__name__)
+
+# Compiled once; these run on every note and per-call re.* cache lookups
+# add measurable overhead across large vaults
+_TAG_RE = re.compile(r'#[\w\-\/]+')
+_WIKILINK_RE = re.compile(r'\[\[([^\]]+)\]\]')
+
+# Bytes-level twins used when scanning large notes via mmap, skipping
+# the full utf-8 decode; only the matches get decoded
+_TAG_RE_B = re.compile(rb'#[\w\-\/]+')
+_WIKILINK_RE_B = re.compile(rb'\[\[([^\]]+)\]\]')
+
+# Notes at least this large are scanned through mmap instead of read()
+_MMAP_THRESHOLD = mmap.ALLOCATIONGRANULARITY
+
+# Pending dataset appends are flushed in batches of this many frames
+_WRITE_BATCH_SIZE = 256
+
+# In-process parse memo keyed by (path, st_mtime_ns): repeated mapping of
+# an unchanged note within one process skips frontmatter/tag/backlink
+# work entirely. LRU-bounded via OrderedDict.
+_PARSE_CACHE: OrderedDict[
+    tuple[str, int], tuple[dict, int, "list[str] | None", "list[str] | None"]
+] = OrderedDict()
+_PARSE_CACHE_MAX = 4096
+
+# Human-readable descriptions per attachment suffix; also defines the
+# set of recognized attachment extensions
+_ATTACHMENT_DESCRIPTIONS = {
+    '.png': 'Image attachment',
+    '.jpg': 'Image attachment',
+    '.jpeg': 'Image attachment',
+    '.gif': 'Image attachment',
+    '.svg': 'Image attachment',
+    '.pdf': 'PDF document',
+    '.mp4': 'Video file',
+    '.webm': 'Video file',
+    '.mov': 'Video file',
+    '.mp3': 'Audio file',
+    '.wav': 'Audio file',
+}
+
+_ATTACHMENT_EXTENSIONS = frozenset(_ATTACHMENT_DESCRIPTIONS)
+
+
+@dataclass
+class _VaultListing:
+    """Vault entries classified in a single traversal."""
+
+    notes: list
+    attachments: list
+    others: list
+    folders: list[str]
+
+
+# How long a memoized vault listing stays fresh. Root mtime is not a
+# reliable invalidation signal (it only changes when the root's direct
+# children change), so the memo expires on a short wall-clock window
+# instead: repeated consumers within one operation share the walk, while
+# a later sync sees subfolder additions and modifications.
+_VAULT_LISTING_TTL = 5.0
+
+
+@dataclass(frozen=True)
+class _NoteMapOptions:
+    """Picklable per-sync options for mapping notes in worker processes."""
+
+    vault_path: str
+    collection_id: str
+    extract_frontmatter: bool
+    extract_tags: bool
+    extract_backlinks: bool
+    parse_cache: dict[str, dict]
+    """Cached parse results keyed by vault-relative path (read-only in workers)."""
+
+
+def _map_note(
+    note_path: str,
+    stat_result: os.stat_result | None = None,
+    *,
+    options: _NoteMapOptions,
+) -> tuple["FrameRecord | None", list[str], dict | None]:
+    """Map a single Obsidian note to a FrameRecord.
+
+    Module-level pure function (no connector state) so it can run in a
+    ProcessPoolExecutor worker. A stat result from traversal can be
+    passed in to avoid re-statting the file. Returns the mapped frame
+    (or None on failure), the raw wiki-link names (alias-stripped, still
+    unresolved - resolution against the vault index happens in bulk on
+    the main process), and a fresh parse-cache entry when the note had
+    to be parsed from scratch.
+    """
+    vault_path = Path(options.vault_path)
+    note_path = Path(note_path)
+    linked_notes: list[str] = []
+    cache_entry: dict | None = None
+    try:
+        # Read note content
+        content = note_path.read_text(encoding='utf-8', errors='replace')
+
+        # Get file stats (reusing the traversal's cached stat when given)
+        stat = stat_result if stat_result is not None else note_path.stat()
+        rel_path = note_path.relative_to(vault_path)
+
+        # Fast path: in-process memo for an unchanged note
+        mem_key = (str(note_path), stat.st_mtime_ns)
+        mem_hit = _PARSE_CACHE.get(mem_key)
+        cached = options.parse_cache.get(str(rel_path)) if mem_hit is None else mem_hit
+        if mem_hit is not None:
+            _PARSE_CACHE.move_to_end(mem_key)
+            frontmatter, body_start, cached_tags, cached_links = mem_hit
+            main_content = content[body_start:].strip() if body_start else content
+        # Next, the persisted parse cache from earlier runs
+        elif (
+            cached is not None
+            and "body_start" in cached
+            and cached.get("mtime") == stat.st_mtime
+            and cached.get("size") == stat.st_size
+        ):
+            frontmatter = cached.get("frontmatter") or {}
+            body_start = cached.get("body_start") or 0
+            main_content = content[body_start:].strip() if body_start else content
+            cached_tags = cached.get("tags")
+            cached_links = cached.get("backlinks")
+        else:
+            cached = None
+            cached_tags = None
+            cached_links = None
+
+            # Extract frontmatter
+            frontmatter = {}
+            main_content = content
+            body_start = 0
+
+            if options.extract_frontmatter and content.startswith("---"):
+                try:
+                    # Locate the closing fence with find + slice: O(header)
+                    # instead of scanning the whole note
+                    frontmatter_text = None
+                    if content.startswith("---\n"):
+                        fence_end = content.find("\n---\n", 3)
+                        if fence_end != -1:
+                            frontmatter_text = content[4:fence_end].strip()
+                            body_start = fence_end + 5
+                    elif content.startswith("---\r\n"):
+                        fence_end = content.find("\r\n---\r\n", 4)
+                        if fence_end != -1:
+                            frontmatter_text = content[5:fence_end].strip()
+                            body_start = fence_end + 7
+
+                    if frontmatter_text is not None:
+                        main_content = content[body_start:].strip()
+
+                        # Parse YAML frontmatter
+                        if yaml is not None:
+                            try:
+                                frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader) or {}
+                            except Exception as e:
+                                logger.warning(f"Failed to parse frontmatter in {note_path}: {e}")
+                        else:
+                            # Parse simple key-value pairs if PyYAML not available
+                            for line in frontmatter_text.split('\n'):
+                                if ':' in line:
+                                    key, value = line.split(':', 1)
+                                    frontmatter[key.strip()] = value.strip()
+
+                except Exception as e:
+                    logger.warning(f"Failed to extract frontmatter from {note_path}: {e}")
+
+        # Extract title (from frontmatter or filename)
+        title = frontmatter.get("title", note_path.stem)
+
+        # Build metadata
+        metadata = {
+            "title": title,
+            "record_type": RecordType.DOCUMENT,
+            "source_type": "obsidian_note",
+            "source_file": str(rel_path),
+            "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+            "updated_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "collection": options.collection_id,
+            "collection_id": options.collection_id,
+            "custom_metadata": {
+                "x_obsidian_vault": vault_path.name,
+                "x_obsidian_folder": str(rel_path.parent) if rel_path.parent != Path(".") else "",
+                "x_obsidian_basename": note_path.stem,
+            }
+        }
+
+        # Add frontmatter to metadata
+        if frontmatter:
+            metadata["custom_metadata"]["x_obsidian_frontmatter"] = frontmatter
+
+            # Extract common frontmatter fields
+            if "tags" in frontmatter:
+                metadata["tags"] = frontmatter["tags"] if isinstance(frontmatter["tags"], list) else [frontmatter["tags"]]
+            if "author" in frontmatter:
+                metadata["author"] = frontmatter["author"]
+            if "created" in frontmatter:
+                metadata["created_at"] = frontmatter["created"]
+            if "modified" in frontmatter:
+                metadata["updated_at"] = frontmatter["modified"]
+
+        # Extract tags from content
+        content_tags: list[str] = []
+        if options.extract_tags:
+            content_tags = cached_tags if cached_tags is not None else _TAG_RE.findall(main_content)
+            if content_tags:
+                existing_tags = metadata.get("tags", [])
+                all_tags = list(set(existing_tags + content_tags))
+                metadata["tags"] = all_tags
+
+        # Extract and store backlinks, rewriting wiki-links to markdown
+        # links in the same pass over the content
+        backlinks: list[str] = []
+        if options.extract_backlinks:
+            if cached_links is not None:
+                backlinks = cached_links
+                main_content = _WIKILINK_RE.sub(r'[\1]', main_content)
+            else:
+                def _collect_and_rewrite(match: re.Match) -> str:
+                    backlinks.append(match.group(1))
+                    return f"[{match.group(1)}]"
+
+                main_content = _WIKILINK_RE.sub(_collect_and_rewrite, main_content)
+
+            # Strip alias syntax [[Note Name|Display Text]]; resolution
+            # happens later against the vault index
+            linked_notes = [
+                link.split('|')[0] if '|' in link else link for link in backlinks
+            ]
+
+        # Build full content with a single join instead of repeated
+        # str concatenation over the frontmatter items
+        parts = [f"# {title}\n\n"]
+        if frontmatter:
+            parts.append("## Metadata\n\n")
+            parts.extend(f"**{key}**: {value}\n" for key, value in frontmatter.items())
+            parts.append("\n")
+        parts.append(main_content)
+        full_content = "".join(parts)
+
+        # Remember the parse in the in-process memo
+        if mem_hit is None:
+            _PARSE_CACHE[mem_key] = (
+                frontmatter,
+                body_start,
+                content_tags if options.extract_tags else None,
+                backlinks if options.extract_backlinks else None,
+            )
+            while len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+                _PARSE_CACHE.popitem(last=False)
+
+        # Emit a cache entry when the note was parsed from scratch
+        if cached is None:
+            cache_entry = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "has_frontmatter": bool(frontmatter),
+                "frontmatter": frontmatter,
+                "body_start": body_start,
+                "content_preview": main_content[:500],
+            }
+            if options.extract_tags:
+                cache_entry["tags"] = content_tags
+            if options.extract_backlinks:
+                cache_entry["backlinks"] = backlinks
+
+        frame = FrameRecord(
+            text_content=full_content,
+            metadata=metadata,
+            context=main_content[:500],  # First 500 chars as context
+        )
+        return frame, linked_notes, cache_entry
+
+    except Exception as e:
+        logger.error(f"Failed to map note {note_path}: {e}")
+        return None, linked_notes, cache_entry
 
 
 class ObsidianConnector(SourceConnector):
@@ -33,10 +347,21 @@ class ObsidianConnector(SourceConnector):
         self.include_daily_notes = config.sync_config.get("include_daily_notes", True)
         self.include_templates = config.sync_config.get("include_templates", False)
         self.folders_to_include = config.sync_config.get("folders_to_include", [])
+        # Normalized prefixes let str.startswith do the include scan in C
+        self._include_prefixes: tuple[str, ...] | None = (
+            tuple(f.rstrip("/\\") + os.sep for f in self.folders_to_include) or None
+        )
         self.folders_to_exclude = config.sync_config.get("folders_to_exclude", [".obsidian", ".trash"])
+        self._exclude_set: frozenset[str] = frozenset(self.folders_to_exclude)
         self.extract_frontmatter = config.sync_config.get("extract_frontmatter", True)
         self.extract_tags = config.sync_config.get("extract_tags", True)
         self.extract_backlinks = config.sync_config.get("extract_backlinks", True)
+        self.workers = config.sync_config.get("workers", os.cpu_count() or 1)
+        self.cache_parsed = config.sync_config.get("cache_parsed", True)
+        self._note_index: dict[str, str] | None = None
+        self._uuid_by_source: dict[str, str] = {}
+        self._vault_listing: _VaultListing | None = None
+        self._vault_listing_expires: float = 0.0
         
         # Validate vault path
         if not self.vault_path.exists():
@@ -49,6 +374,37 @@ class ObsidianConnector(SourceConnector):
         if not obsidian_config.exists():
             self.logger.warning(f"No .obsidian folder found in {self.vault_path}. Are you sure this is an Obsidian vault?")
 
+        # Parse results cached by (mtime, size) so unchanged notes skip
+        # the read + YAML + regex work on subsequent runs
+        self._parse_cache_path = obsidian_config / ".cf_cache.json"
+        self._parse_cache: dict[str, dict] = self._load_parse_cache()
+
+    def _load_parse_cache(self) -> dict[str, dict]:
+        """Load the on-disk parse cache, if enabled and present."""
+        if not self.cache_parsed:
+            return {}
+        try:
+            with open(self._parse_cache_path, "rb") as f:
+                cache = _json_loads(f.read())
+            if isinstance(cache, dict):
+                return cache
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Failed to load parse cache: {e}")
+        return {}
+
+    def _save_parse_cache(self) -> None:
+        """Flush the in-memory parse cache to disk, if enabled."""
+        if not self.cache_parsed:
+            return
+        try:
+            self._parse_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._parse_cache_path, "wb") as f:
+                f.write(_json_dumps(self._parse_cache))
+        except Exception as e:
+            self.logger.warning(f"Failed to save parse cache: {e}")
+
     def validate_connection(self) -> bool:
         """Validate Obsidian vault access."""
         try:
@@ -64,6 +420,66 @@ class ObsidianConnector(SourceConnector):
             self.logger.error(f"Failed to validate Obsidian vault access: {e}")
             return False
 
+    def _scandir_recursive(self, path: str | Path) -> Iterator[os.DirEntry]:
+        """Recursively yield DirEntry objects under path.
+
+        Excluded folders are pruned before descent so their subtrees are
+        never listed. Symlinks are skipped. Directory entries are yielded
+        before being descended into so callers can inspect the folder
+        structure; DirEntry caches is_file/is_dir/stat results, avoiding
+        the extra stat() syscalls a pathlib-based walk would issue.
+        """
+        try:
+            entries = os.scandir(path)
+        except OSError as e:
+            self.logger.warning(f"Failed to scan {path}: {e}")
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.name in self._exclude_set:
+                    continue
+                try:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        yield entry
+                        yield from self._scandir_recursive(entry.path)
+                    else:
+                        yield entry
+                except OSError as e:
+                    self.logger.warning(f"Failed to inspect {entry.path}: {e}")
+
+    def _enumerate_vault(self) -> _VaultListing:
+        """Walk the vault once and classify entries for all consumers.
+
+        discover_content, note indexing, and both sync passes all need the
+        same listing, so the result is memoized for a short monotonic TTL
+        to avoid repeated traversals within one operation while still
+        picking up filesystem changes between operations.
+        """
+        now = time.monotonic()
+        if self._vault_listing is not None and now < self._vault_listing_expires:
+            return self._vault_listing
+
+        listing = _VaultListing(notes=[], attachments=[], others=[], folders=[])
+        for entry in self._scandir_recursive(self.vault_path):
+            if entry.is_dir(follow_symlinks=False):
+                listing.folders.append(str(Path(entry.path).relative_to(self.vault_path)))
+            elif entry.name.endswith(".md"):
+                listing.notes.append(entry)
+            elif (
+                self.include_attachments
+                and os.path.splitext(entry.name)[1].lower() in _ATTACHMENT_EXTENSIONS
+            ):
+                listing.attachments.append(entry)
+            else:
+                listing.others.append(entry)
+
+        self._vault_listing = listing
+        self._vault_listing_expires = now + _VAULT_LISTING_TTL
+        return listing
+
     def discover_content(self) -> dict[str, Any]:
         """Discover Obsidian vault structure."""
         discovery = {
@@ -84,51 +500,91 @@ class ObsidianConnector(SourceConnector):
         }
 
         try:
-            # Walk through vault
-            for file_path in self.vault_path.rglob("*"):
-                if file_path.is_file():
-                    # Skip excluded folders
-                    if any(excluded in file_path.parts for excluded in self.folders_to_exclude):
-                        continue
-                    
-                    file_size = file_path.stat().st_size
-                    discovery["file_stats"]["total_size"] += file_size
-                    
-                    # Track file types
-                    ext = file_path.suffix.lower()
-                    discovery["file_stats"]["file_types"][ext] = \
-                        discovery["file_stats"]["file_types"].get(ext, 0) + 1
-                    
-                    if ext == ".md":
-                        discovery["file_stats"]["total_notes"] += 1
-                        
-                        # Analyze note content
-                        try:
-                            content = file_path.read_text(encoding='utf-8')
-                            
-                            # Check for frontmatter
-                            if content.startswith("---"):
-                                discovery["metadata"]["has_frontmatter"] += 1
-                            
-                            # Extract tags
-                            tags = re.findall(r'#[\w\-\/]+', content)
-                            discovery["metadata"]["tags_found"].update(tags)
-                            
-                            # Count backlinks
-                            backlinks = re.findall(r'\[\[([^\]]+)\]\]', content)
-                            discovery["metadata"]["backlinks_count"] += len(backlinks)
-                            
-                        except Exception as e:
-                            self.logger.warning(f"Failed to analyze {file_path}: {e}")
-                    
-                    elif ext in ['.png', '.jpg', '.jpeg', '.gif', '.pdf', '.mp4', '.webm']:
-                        discovery["file_stats"]["total_attachments"] += 1
-                
-                elif file_path.is_dir():
-                    # Skip excluded folders
-                    if file_path.name not in self.folders_to_exclude:
-                        rel_path = file_path.relative_to(self.vault_path)
-                        discovery["folders"].append(str(rel_path))
+            # Single classified walk, shared with sync via memoization
+            listing = self._enumerate_vault()
+            discovery["folders"] = list(listing.folders)
+            discovery["file_stats"]["total_notes"] = len(listing.notes)
+            discovery["file_stats"]["total_attachments"] = len(listing.attachments)
+
+            file_types: Counter[str] = Counter()
+            total_size = 0
+            for entry in (*listing.notes, *listing.attachments, *listing.others):
+                total_size += entry.stat().st_size
+                file_types[os.path.splitext(entry.name)[1].lower()] += 1
+            discovery["file_stats"]["total_size"] = total_size
+            discovery["file_stats"]["file_types"] = dict(file_types)
+
+            # Analyze note content
+            for entry in listing.notes:
+                # Reuse cached analysis when the file is unchanged
+                rel = str(Path(entry.path).relative_to(self.vault_path))
+                st = entry.stat()
+                cached = self._parse_cache.get(rel)
+                if (
+                    cached is not None
+                    and (not self.extract_tags or "tags" in cached)
+                    and (not self.extract_backlinks or "backlinks" in cached)
+                    and cached.get("mtime") == st.st_mtime
+                    and cached.get("size") == st.st_size
+                ):
+                    if cached.get("has_frontmatter"):
+                        discovery["metadata"]["has_frontmatter"] += 1
+                    discovery["metadata"]["tags_found"].update(cached.get("tags") or [])
+                    discovery["metadata"]["backlinks_count"] += len(cached.get("backlinks") or [])
+                    continue
+
+                try:
+                    # The frontmatter check only needs the first few bytes;
+                    # touch the rest of the file only when tag or backlink
+                    # extraction actually requires the full body. Large
+                    # notes are scanned via mmap with bytes regexes so the
+                    # whole body never gets decoded - only the matches.
+                    need_body = self.extract_tags or self.extract_backlinks
+                    with open(entry.path, "rb") as f:
+                        if need_body and st.st_size >= _MMAP_THRESHOLD:
+                            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                                has_frontmatter = mm[:3] == b"---"
+                                tags = (
+                                    [m.decode("utf-8", "replace") for m in _TAG_RE_B.findall(mm)]
+                                    if self.extract_tags
+                                    else None
+                                )
+                                backlinks = (
+                                    [m.decode("utf-8", "replace") for m in _WIKILINK_RE_B.findall(mm)]
+                                    if self.extract_backlinks
+                                    else None
+                                )
+                        else:
+                            head = f.read(4096)
+                            has_frontmatter = head.startswith(b"---")
+                            tags = backlinks = None
+                            if need_body:
+                                content = (head + f.read()).decode("utf-8", "replace")
+                                if self.extract_tags:
+                                    tags = _TAG_RE.findall(content)
+                                if self.extract_backlinks:
+                                    backlinks = _WIKILINK_RE.findall(content)
+
+                    if has_frontmatter:
+                        discovery["metadata"]["has_frontmatter"] += 1
+
+                    entry_cache = {
+                        "mtime": st.st_mtime,
+                        "size": st.st_size,
+                        "has_frontmatter": has_frontmatter,
+                    }
+                    if tags is not None:
+                        discovery["metadata"]["tags_found"].update(tags)
+                        entry_cache["tags"] = tags
+                    if backlinks is not None:
+                        discovery["metadata"]["backlinks_count"] += len(backlinks)
+                        entry_cache["backlinks"] = backlinks
+
+                    if self.cache_parsed:
+                        self._parse_cache[rel] = entry_cache
+
+                except Exception as e:
+                    self.logger.warning(f"Failed to analyze {entry.path}: {e}")
 
             # Convert set to list for JSON serialization
             discovery["metadata"]["tags_found"] = list(discovery["metadata"]["tags_found"])
@@ -158,6 +614,10 @@ class ObsidianConnector(SourceConnector):
         processed_files: set[str] = set()
         note_relationships: dict[str, list[str]] = {}  # note_path -> [linked_notes]
 
+        # Prefetch existing record uuids once so per-file existence checks
+        # and backlink lookups are dict gets instead of dataset searches
+        self._uuid_by_source = self._load_existing_uuids()
+
         # Process markdown files
         self._sync_notes(
             collection_id,
@@ -188,6 +648,9 @@ class ObsidianConnector(SourceConnector):
             }
             self.save_sync_state(new_state)
 
+        # Persist parse results for the next run
+        self._save_parse_cache()
+
         result.complete()
         return result
 
@@ -201,58 +664,198 @@ class ObsidianConnector(SourceConnector):
     ):
         """Sync Obsidian notes (.md files)."""
         try:
-            # Find all markdown files
-            for note_path in self.vault_path.rglob("*.md"):
-                # Skip excluded folders
-                if any(excluded in note_path.parts for excluded in self.folders_to_exclude):
-                    continue
+            # When folder filters are set and no shared listing exists yet,
+            # descend only into the included roots instead of walking the
+            # whole vault and prefix-filtering every path
+            if self.folders_to_include and self._vault_listing is None:
+                candidates = []
+                for folder in self.folders_to_include:
+                    root = self.vault_path / folder
+                    if not root.is_dir():
+                        continue
+                    candidates.extend(
+                        entry
+                        for entry in self._scandir_recursive(root)
+                        if entry.name.endswith(".md")
+                        and not entry.is_dir(follow_symlinks=False)
+                    )
+            else:
+                candidates = self._enumerate_vault().notes
 
+            # Filter the candidates down to syncable notes
+            vault_prefix_len = len(str(self.vault_path)) + 1
+            note_paths: list[str] = []
+            note_stats: list[os.stat_result] = []
+            for entry in candidates:
                 # Skip templates unless included
-                if not self.include_templates and "template" in note_path.name.lower():
+                if not self.include_templates and "template" in entry.name.lower():
                     continue
 
-                # Check folder filters
-                rel_path = note_path.relative_to(self.vault_path)
-                if self.folders_to_include:
-                    if not any(str(rel_path).startswith(folder) for folder in self.folders_to_include):
+                # Check folder filters (single C-level scan over all prefixes)
+                if self._include_prefixes is not None:
+                    rel_str = entry.path[vault_prefix_len:]
+                    if not rel_str.startswith(self._include_prefixes):
                         continue
 
                 # Check if needs update
-                if incremental and last_sync_state:
+                if last_sync_state:
                     last_sync = datetime.fromisoformat(last_sync_state["last_sync"])
-                    modified = datetime.fromtimestamp(note_path.stat().st_mtime)
+                    modified = datetime.fromtimestamp(entry.stat().st_mtime)
                     if modified <= last_sync:
                         continue
 
-                # Process note
-                frame = self._map_note_to_frame(note_path, collection_id, note_relationships)
-                if frame:
-                    try:
-                        # Use relative path as unique identifier
-                        file_id = str(rel_path)
-                        
-                        existing = self.dataset.search(
-                            f"source_file:'{file_id}'",
-                            limit=1
-                        )
-
-                        if existing:
-                            self.dataset.update(existing[0].metadata["uuid"], frame)
-                            result.frames_updated += 1
-                        else:
-                            self.dataset.add(frame)
-                            result.frames_created += 1
+                note_paths.append(entry.path)
+                note_stats.append(entry.stat())
 
-                        processed_files.add(file_id)
-
-                    except Exception as e:
-                        result.frames_failed += 1
-                        result.add_error(f"Failed to sync note {rel_path}: {e}")
+            # Map notes to frames, in parallel when configured. Each note is
+            # independent and the work is CPU-bound (regex + YAML), so worker
+            # processes map while the main process keeps exclusive ownership
+            # of the dataset.
+            options = self._note_map_options(collection_id)
+            mapper = partial(_map_note, options=options)
+            if self.workers > 1 and len(note_paths) > 1:
+                # lance is not fork-safe, so spawn worker processes
+                mp_context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=self.workers, mp_context=mp_context) as executor:
+                    mapped = executor.map(mapper, note_paths, note_stats, chunksize=16)
+                    self._store_mapped_notes(
+                        note_paths, mapped, result, processed_files, note_relationships
+                    )
+            else:
+                self._store_mapped_notes(
+                    note_paths,
+                    map(mapper, note_paths, note_stats),
+                    result,
+                    processed_files,
+                    note_relationships,
+                )
 
         except Exception as e:
             result.add_error(f"Failed to sync notes: {e}")
             result.success = False
 
+    def _load_existing_uuids(self) -> dict[str, str]:
+        """Map source_file -> uuid for records already in the dataset.
+
+        One columnar scan replaces the per-file dataset search previously
+        issued for every note, attachment, and backlink endpoint.
+        """
+        try:
+            tbl = self.dataset.scanner(
+                filter="source_file IS NOT NULL",
+                columns=["uuid", "source_file"],
+            ).to_table()
+            data = tbl.to_pydict()
+            return dict(zip(data["source_file"], data["uuid"]))
+        except Exception as e:
+            self.logger.warning(f"Failed to prefetch existing records: {e}")
+            return {}
+
+    def _build_note_index(self) -> dict[str, str]:
+        """Index note basenames (lowercased) to vault-relative paths.
+
+        Built in a single vault walk; first match wins for duplicate
+        basenames, mirroring the previous first-match rglob behavior.
+        """
+        index: dict[str, str] = {}
+        for entry in self._enumerate_vault().notes:
+            rel_path = str(Path(entry.path).relative_to(self.vault_path))
+            index.setdefault(entry.name.lower(), rel_path)
+        return index
+
+    def _note_map_options(self, collection_id: str) -> _NoteMapOptions:
+        """Build the picklable option set passed to note-mapping workers."""
+        return _NoteMapOptions(
+            vault_path=str(self.vault_path),
+            collection_id=collection_id,
+            extract_frontmatter=self.extract_frontmatter,
+            extract_tags=self.extract_tags,
+            extract_backlinks=self.extract_backlinks,
+            parse_cache=self._parse_cache if self.cache_parsed else {},
+        )
+
+    def _store_mapped_notes(
+        self,
+        note_paths: list[str],
+        mapped,
+        result: SyncResult,
+        processed_files: set[str],
+        note_relationships: dict[str, list[str]],
+    ):
+        """Write mapped note frames to the dataset on the main process."""
+        adds: list[tuple[str, FrameRecord]] = []
+        for note_path, (frame, linked_notes, cache_entry) in zip(note_paths, mapped):
+            rel_path = Path(note_path).relative_to(self.vault_path)
+            file_id = str(rel_path)
+
+            if cache_entry is not None:
+                self._parse_cache[file_id] = cache_entry
+
+            if self.extract_backlinks:
+                note_relationships[file_id] = linked_notes
+
+            if not frame:
+                continue
+
+            existing_uuid = self._uuid_by_source.get(file_id)
+            if existing_uuid:
+                try:
+                    # Carry the existing UUID so update_record replaces
+                    # the stored row rather than missing the fresh frame's
+                    frame.metadata["uuid"] = existing_uuid
+                    self.dataset.update_record(frame)
+                    result.frames_updated += 1
+                    processed_files.add(file_id)
+                except Exception as e:
+                    result.frames_failed += 1
+                    result.add_error(f"Failed to sync note {rel_path}: {e}")
+            else:
+                adds.append((file_id, frame))
+                if len(adds) >= _WRITE_BATCH_SIZE:
+                    self._flush_adds(adds, result, processed_files, "note")
+
+        self._flush_adds(adds, result, processed_files, "note")
+
+    def _flush_adds(
+        self,
+        adds: list[tuple[str, FrameRecord]],
+        result: SyncResult,
+        processed_files: set[str],
+        kind: str,
+    ) -> None:
+        """Append pending frames in one batch, isolating failures per row.
+
+        Per-row appends make write overhead dominate on large vaults;
+        batching lets the dataset insert one combined table. If the batch
+        fails, fall back to single adds so one bad frame doesn't sink the
+        rest.
+        """
+        if not adds:
+            return
+
+        def _record_success(file_id: str, frame: FrameRecord) -> None:
+            processed_files.add(file_id)
+            new_uuid = frame.metadata.get("uuid")
+            if new_uuid:
+                self._uuid_by_source[file_id] = new_uuid
+
+        try:
+            self.dataset.add_many([frame for _, frame in adds])
+            result.frames_created += len(adds)
+            for file_id, frame in adds:
+                _record_success(file_id, frame)
+        except Exception:
+            for file_id, frame in adds:
+                try:
+                    self.dataset.add(frame)
+                    result.frames_created += 1
+                    _record_success(file_id, frame)
+                except Exception as e:
+                    result.frames_failed += 1
+                    result.add_error(f"Failed to sync {kind} {file_id}: {e}")
+        finally:
+            adds.clear()
+
     def _sync_attachments(
         self,
         collection_id: str,
@@ -261,51 +864,44 @@ class ObsidianConnector(SourceConnector):
         processed_files: set[str]
     ):
         """Sync Obsidian attachments (images, PDFs, etc.)."""
-        try:
-            attachment_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.pdf', '.mp4', '.webm', '.mov', '.mp3', '.wav'}
-            
-            for file_path in self.vault_path.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                    
-                if file_path.suffix.lower() not in attachment_extensions:
-                    continue
-
-                # Skip excluded folders
-                if any(excluded in file_path.parts for excluded in self.folders_to_exclude):
-                    continue
+        if not self.include_attachments:
+            return
 
+        try:
+            adds: list[tuple[str, FrameRecord]] = []
+            for entry in self._enumerate_vault().attachments:
                 # Check if needs update
-                if incremental and last_sync_state:
+                if last_sync_state:
                     last_sync = datetime.fromisoformat(last_sync_state["last_sync"])
-                    modified = datetime.fromtimestamp(file_path.stat().st_mtime)
+                    modified = datetime.fromtimestamp(entry.stat().st_mtime)
                     if modified <= last_sync:
                         continue
 
-                # Process attachment
-                frame = self._map_attachment_to_frame(file_path, collection_id)
+                # Process attachment (reuse the traversal's cached stat)
+                file_path = Path(entry.path)
+                frame = self._map_attachment_to_frame(
+                    file_path, collection_id, stat_result=entry.stat()
+                )
                 if frame:
-                    try:
-                        rel_path = file_path.relative_to(self.vault_path)
-                        file_id = str(rel_path)
-                        
-                        existing = self.dataset.search(
-                            f"source_file:'{file_id}'",
-                            limit=1
-                        )
+                    rel_path = file_path.relative_to(self.vault_path)
+                    file_id = str(rel_path)
 
-                        if existing:
-                            self.dataset.update(existing[0].metadata["uuid"], frame)
+                    existing_uuid = self._uuid_by_source.get(file_id)
+                    if existing_uuid:
+                        try:
+                            frame.metadata["uuid"] = existing_uuid
+                            self.dataset.update_record(frame)
                             result.frames_updated += 1
-                        else:
-                            self.dataset.add(frame)
-                            result.frames_created += 1
-
-                        processed_files.add(file_id)
+                            processed_files.add(file_id)
+                        except Exception as e:
+                            result.frames_failed += 1
+                            result.add_error(f"Failed to sync attachment {rel_path}: {e}")
+                    else:
+                        adds.append((file_id, frame))
+                        if len(adds) >= _WRITE_BATCH_SIZE:
+                            self._flush_adds(adds, result, processed_files, "attachment")
 
-                    except Exception as e:
-                        result.frames_failed += 1
-                        result.add_error(f"Failed to sync attachment {rel_path}: {e}")
+            self._flush_adds(adds, result, processed_files, "attachment")
 
         except Exception as e:
             result.add_warning(f"Failed to sync attachments: {e}")
@@ -315,40 +911,56 @@ class ObsidianConnector(SourceConnector):
         note_relationships: dict[str, list[str]],
         result: SyncResult
     ):
-        """Create backlink relationships between notes."""
+        """Create backlink relationships between notes.
+
+        note_relationships holds raw, alias-stripped wiki-link names;
+        they are resolved here in one pass against the vault note index.
+        """
         if not self.extract_backlinks:
             return
 
         try:
-            for source_path, linked_notes in note_relationships.items():
-                # Find the source frame
-                source_results = self.dataset.search(
-                    f"source_file:'{source_path}'",
-                    limit=1
-                )
-                
-                if not source_results:
+            if self._note_index is None:
+                self._note_index = self._build_note_index()
+            index = self._note_index
+
+            resolved = {
+                source: [
+                    index[key]
+                    for link in raw_links
+                    if (key := f"{link}.md".lower()) in index
+                ]
+                for source, raw_links in note_relationships.items()
+            }
+
+            for source_path, linked_notes in resolved.items():
+                # Resolve the source frame via the prefetched uuid map
+                source_uuid = self._uuid_by_source.get(source_path)
+                if not source_uuid:
                     continue
-                    
-                source_frame = source_results[0]
-                
+
+                source_frame = self.dataset.get_by_uuid(source_uuid)
+                if not source_frame:
+                    continue
+
+                linked = False
                 for linked_note in linked_notes:
-                    # Find the target frame
-                    target_results = self.dataset.search(
-                        f"source_file:'{linked_note}'",
-                        limit=1
-                    )
-                    
-                    if target_results:
-                        target_frame = target_results[0]
+                    # Targets only need a uuid, not a full record fetch
+                    target_uuid = self._uuid_by_source.get(linked_note)
+
+                    if target_uuid:
                         # Add relationship
                         source_frame.add_relationship(
-                            "links_to",
-                            id=target_frame.metadata["uuid"]
+                            target_uuid,
+                            relationship_type="related",
+                            title=linked_note,
                         )
-                        
-                        # Update the source frame
-                        self.dataset.update(source_frame.metadata["uuid"], source_frame)
+                        linked = True
+
+                # Write the source frame once with all its relationships
+                # instead of once per backlink
+                if linked:
+                    self.dataset.update_record(source_frame)
 
         except Exception as e:
             result.add_warning(f"Failed to create backlink relationships: {e}")
@@ -368,137 +980,25 @@ class ObsidianConnector(SourceConnector):
         note_relationships: dict[str, list[str]]
     ) -> FrameRecord | None:
         """Map Obsidian note to FrameRecord."""
-        try:
-            # Read note content
-            content = note_path.read_text(encoding='utf-8', errors='replace')
-            
-            # Extract frontmatter
-            frontmatter = {}
-            main_content = content
-            
-            if self.extract_frontmatter and content.startswith("---"):
-                try:
-                    parts = content.split("---", 2)
-                    if len(parts) >= 3:
-                        frontmatter_text = parts[1].strip()
-                        main_content = parts[2].strip()
-                        
-                        # Parse YAML frontmatter
-                        try:
-                            import yaml
-                            frontmatter = yaml.safe_load(frontmatter_text) or {}
-                        except ImportError:
-                            # Parse simple key-value pairs if PyYAML not available
-                            for line in frontmatter_text.split('\n'):
-                                if ':' in line:
-                                    key, value = line.split(':', 1)
-                                    frontmatter[key.strip()] = value.strip()
-                        except Exception as e:
-                            self.logger.warning(f"Failed to parse frontmatter in {note_path}: {e}")
-                            
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract frontmatter from {note_path}: {e}")
-
-            # Extract title (from frontmatter or filename)
-            title = frontmatter.get("title", note_path.stem)
-            
-            # Get file stats
-            stat = note_path.stat()
-            rel_path = note_path.relative_to(self.vault_path)
-            
-            # Build metadata
-            metadata = {
-                "title": title,
-                "record_type": RecordType.DOCUMENT,
-                "source_type": "obsidian_note",
-                "source_file": str(rel_path),
-                "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "updated_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "collection": collection_id,
-                "collection_id": collection_id,
-                "custom_metadata": {
-                    "x_obsidian_vault": self.vault_path.name,
-                    "x_obsidian_folder": str(rel_path.parent) if rel_path.parent != Path(".") else "",
-                    "x_obsidian_basename": note_path.stem,
-                }
-            }
-
-            # Add frontmatter to metadata
-            if frontmatter:
-                metadata["custom_metadata"]["x_obsidian_frontmatter"] = frontmatter
-                
-                # Extract common frontmatter fields
-                if "tags" in frontmatter:
-                    metadata["tags"] = frontmatter["tags"] if isinstance(frontmatter["tags"], list) else [frontmatter["tags"]]
-                if "author" in frontmatter:
-                    metadata["author"] = frontmatter["author"]
-                if "created" in frontmatter:
-                    metadata["created_at"] = frontmatter["created"]
-                if "modified" in frontmatter:
-                    metadata["updated_at"] = frontmatter["modified"]
-
-            # Extract tags from content
-            if self.extract_tags:
-                content_tags = re.findall(r'#[\w\-\/]+', main_content)
-                if content_tags:
-                    existing_tags = metadata.get("tags", [])
-                    all_tags = list(set(existing_tags + content_tags))
-                    metadata["tags"] = all_tags
-
-            # Extract and store backlinks
-            linked_notes = []
-            if self.extract_backlinks:
-                # Find [[Note Name]] style links
-                backlinks = re.findall(r'\[\[([^\]]+)\]\]', main_content)
-                for link in backlinks:
-                    # Handle alias syntax [[Note Name|Display Text]]
-                    if '|' in link:
-                        link = link.split('|')[0]
-                    
-                    # Convert to potential file path
-                    linked_file = f"{link}.md"
-                    
-                    # Try to find the actual file (case-insensitive)
-                    for potential_path in self.vault_path.rglob("*.md"):
-                        if potential_path.name.lower() == linked_file.lower():
-                            linked_rel_path = str(potential_path.relative_to(self.vault_path))
-                            linked_notes.append(linked_rel_path)
-                            break
-                
-                # Store for relationship creation later
-                note_relationships[str(rel_path)] = linked_notes
-                
-                # Replace wiki-links with markdown links for better readability
-                main_content = re.sub(r'\[\[([^\]]+)\]\]', r'[\1]', main_content)
-
-            # Build full content
-            full_content = f"# {title}\n\n"
-            if frontmatter:
-                full_content += "## Metadata\n\n"
-                for key, value in frontmatter.items():
-                    full_content += f"**{key}**: {value}\n"
-                full_content += "\n"
-            
-            full_content += main_content
-
-            return FrameRecord(
-                text_content=full_content,
-                metadata=metadata,
-                context=main_content[:500],  # First 500 chars as context
-            )
-
-        except Exception as e:
-            self.logger.error(f"Failed to map note {note_path}: {e}")
-            return None
+        frame, linked_notes, cache_entry = _map_note(
+            str(note_path), options=self._note_map_options(collection_id)
+        )
+        rel_path = note_path.relative_to(self.vault_path)
+        if cache_entry is not None:
+            self._parse_cache[str(rel_path)] = cache_entry
+        if self.extract_backlinks:
+            note_relationships[str(rel_path)] = linked_notes
+        return frame
 
     def _map_attachment_to_frame(
         self,
         file_path: Path,
-        collection_id: str
+        collection_id: str,
+        stat_result: os.stat_result | None = None,
     ) -> FrameRecord | None:
         """Map Obsidian attachment to FrameRecord."""
         try:
-            stat = file_path.stat()
+            stat = stat_result if stat_result is not None else file_path.stat()
             rel_path = file_path.relative_to(self.vault_path)
             
             metadata = {
@@ -519,22 +1019,11 @@ class ObsidianConnector(SourceConnector):
             }
 
             # Determine content based on file type
-            if file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.svg']:
-                text_content = f"# {file_path.name}\n\nImage attachment from Obsidian vault.\n\n**File**: {rel_path}\n**Size**: {stat.st_size} bytes"
-                
-                # Could read image data here if needed
-                # raw_data = file_path.read_bytes()
-                # raw_data_type = f"image/{file_path.suffix[1:]}"
-                
-            elif file_path.suffix.lower() == '.pdf':
-                text_content = f"# {file_path.name}\n\nPDF document from Obsidian vault.\n\n**File**: {rel_path}\n**Size**: {stat.st_size} bytes"
-                
-            elif file_path.suffix.lower() in ['.mp4', '.webm', '.mov']:
-                text_content = f"# {file_path.name}\n\nVideo file from Obsidian vault.\n\n**File**: {rel_path}\n**Size**: {stat.st_size} bytes"
-                
-            elif file_path.suffix.lower() in ['.mp3', '.wav']:
-                text_content = f"# {file_path.name}\n\nAudio file from Obsidian vault.\n\n**File**: {rel_path}\n**Size**: {stat.st_size} bytes"
-                
+            # (raw_data could be read here for binary files if needed)
+            suffix = file_path.suffix.lower()
+            description = _ATTACHMENT_DESCRIPTIONS.get(suffix)
+            if description:
+                text_content = f"# {file_path.name}\n\n{description} from Obsidian vault.\n\n**File**: {rel_path}\n**Size**: {stat.st_size} bytes"
             else:
                 text_content = f"# {file_path.name}\n\nAttachment from Obsidian vault.\n\n**File**: {rel_path}\n**Type**: {file_path.suffix}\n**Size**: {stat.st_size} bytes"
 
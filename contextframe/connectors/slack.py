@@ -1,16 +1,104 @@
 """Slack connector for importing channel messages into ContextFrame."""
 
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
 import json
-from contextframe import FrameRecord
+import time
+import zlib
+from array import array
 from contextframe.connectors.base import (
     AuthType,
     ConnectorConfig,
     SourceConnector,
     SyncResult,
 )
-from contextframe.schema import RecordType
 from datetime import UTC, datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from contextframe import FrameRecord
+
+# Slack Web API rate-limit tiers, in requests per minute
+_TIER_RATES = {1: 1, 2: 20, 3: 50, 4: 100}
+
+# Documented page-size caps; always passed explicitly since Slack
+# rate-limits paginated calls without a limit more aggressively
+_PAGE_LIMITS = {
+    "conversations_list": 1000,
+    "users_list": 1000,
+    "conversations_history": 200,
+    "conversations_replies": 200,
+}
+
+# Rate-limit tier for each method the connector calls
+_METHOD_TIERS = {
+    "conversations_list": 2,
+    "users_list": 2,
+    "conversations_info": 3,
+    "conversations_history": 3,
+    "conversations_replies": 3,
+    "users_info": 4,
+}
+
+
+@lru_cache(maxsize=86400)
+def _fmt_ts_seconds(seconds: int) -> str:
+    """Format whole seconds as an ISO timestamp, cached per second."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _fmt_ts(ts: float) -> str:
+    """Format a Slack epoch timestamp as ISO-8601 UTC.
+
+    Equivalent to datetime.fromtimestamp(ts, tz=UTC).isoformat() but
+    reuses a cached per-second prefix, since messages in a sync cluster
+    within the same seconds.
+    """
+    seconds = int(ts)
+    micros = round((ts - seconds) * 1_000_000)
+    if micros:
+        return f"{_fmt_ts_seconds(seconds)}.{micros:06d}+00:00"
+    return _fmt_ts_seconds(seconds) + "+00:00"
+
+
+def _message_fingerprint(message_id: str) -> int:
+    """Stable 64-bit fingerprint for a "channel:ts" message ID."""
+    return int.from_bytes(
+        hashlib.blake2b(message_id.encode(), digest_size=8).digest(), "little"
+    )
+
+
+def _serialize_fingerprints(fingerprints: set[int]) -> str:
+    """Pack fingerprints into a compressed base64 blob for the sync state."""
+    packed = array("Q", sorted(fingerprints)).tobytes()
+    return base64.b64encode(zlib.compress(packed)).decode("ascii")
+
+
+def _deserialize_fingerprints(blob: str) -> set[int]:
+    """Restore a fingerprint set from its serialized sync-state form."""
+    return set(array("Q", zlib.decompress(base64.b64decode(blob))))
+
+
+class _TokenBucket:
+    """Minimal asyncio token bucket pacing calls to a fixed rate."""
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self._interval = time_period / max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
 
 
 class SlackConnector(SourceConnector):
@@ -34,16 +122,25 @@ class SlackConnector(SourceConnector):
         self.include_reactions = config.sync_config.get("include_reactions", True)
         self.days_to_sync = config.sync_config.get("days_to_sync", 30)  # Default 30 days
         self.user_ids = config.sync_config.get("user_ids", [])  # Filter by user
-        
+        self.max_concurrency = config.sync_config.get("max_concurrency", 8)
+        self.write_batch_size = config.sync_config.get("write_batch_size", 500)
+
+        # Per-channel message_id -> uuid maps prefetched on first use
+        self._existing_by_channel: dict[str, dict[str, str]] = {}
+        # Serializes dataset commits across channel tasks; recreated per
+        # sync so it is bound to that sync's event loop
+        self._write_lock = asyncio.Lock()
+
         # Set up Slack API client
         self._setup_client()
 
     def _setup_client(self):
-        """Set up Slack API client."""
+        """Set up Slack API clients."""
         try:
             from slack_sdk import WebClient
             from slack_sdk.errors import SlackApiError
-            
+            from slack_sdk.web.async_client import AsyncWebClient
+
             self.SlackApiError = SlackApiError
         except ImportError:
             raise ImportError(
@@ -51,23 +148,33 @@ class SlackConnector(SourceConnector):
                 "Install with: pip install slack-sdk"
             )
 
-        # Initialize client based on auth type
+        # Resolve token based on auth type
         if self.config.auth_type == AuthType.TOKEN:
             token = self.config.auth_config.get("token")
             if not token:
                 raise ValueError("Slack bot token required for authentication")
-            self.client = WebClient(token=token)
         elif self.config.auth_type == AuthType.OAUTH:
             # OAuth token from OAuth flow
             token = self.config.auth_config.get("access_token")
             if not token:
                 raise ValueError("Slack OAuth access token required")
-            self.client = WebClient(token=token)
         else:
             raise ValueError("Slack connector requires token or OAuth authentication")
 
+        # Sync client for validation and simple lookups, async client for
+        # the concurrent sync paths
+        self.client = WebClient(token=token)
+        self.async_client = AsyncWebClient(token=token)
+
         # Cache for user info
         self.user_cache: dict[str, Any] = {}
+        self._user_cache_complete = False
+
+        # Per-tier rate buckets, rebuilt per event loop by _make_buckets
+        self._buckets: dict[int, _TokenBucket] = {}
+
+        # Workspace slug for archive URLs, refined by validate_connection
+        self._team = "slack"
 
     def validate_connection(self) -> bool:
         """Validate Slack connection."""
@@ -75,6 +182,7 @@ class SlackConnector(SourceConnector):
             # Test authentication
             auth_test = self.client.auth_test()
             self.workspace_info = auth_test
+            self._team = auth_test.get("team", "slack")
             self.logger.info(
                 f"Connected to Slack workspace: {auth_test['team']} as {auth_test['user']}"
             )
@@ -104,23 +212,9 @@ class SlackConnector(SourceConnector):
         }
 
         try:
-            # Get channels
-            channels = []
-            cursor = None
-            
-            while True:
-                result = self.client.conversations_list(
-                    exclude_archived=not self.include_archived,
-                    types="public_channel,private_channel" if self.include_private else "public_channel",
-                    cursor=cursor,
-                    limit=1000
-                )
-                
-                channels.extend(result["channels"])
-                
-                if not result.get("response_metadata", {}).get("next_cursor"):
-                    break
-                cursor = result["response_metadata"]["next_cursor"]
+            # Channel and user listings are independent round trips; fetch
+            # them concurrently
+            channels, members = asyncio.run(self._discover_async())
 
             # Process channels
             for channel in channels:
@@ -134,16 +228,15 @@ class SlackConnector(SourceConnector):
                     "num_members": channel.get("num_members", 0),
                 }
                 discovery["channels"].append(channel_info)
-                
+
                 discovery["stats"]["total_channels"] += 1
                 if channel.get("is_private"):
                     discovery["stats"]["private_channels"] += 1
                 else:
                     discovery["stats"]["public_channels"] += 1
 
-            # Get users
-            users = self.client.users_list()
-            for user in users["members"]:
+            # Process users
+            for user in members:
                 if not user.get("deleted", False) and not user.get("is_bot", False):
                     user_info = {
                         "id": user["id"],
@@ -162,8 +255,95 @@ class SlackConnector(SourceConnector):
 
         return discovery
 
+    async def _discover_async(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Fetch channel and user listings concurrently."""
+        self._make_buckets()
+        channels, users = await asyncio.gather(
+            self._list_channels_async(),
+            self._call("users_list", limit=_PAGE_LIMITS["users_list"]),
+        )
+        return channels, users["members"]
+
+    def _make_buckets(self) -> None:
+        """Create per-tier rate buckets bound to the current event loop."""
+        self._buckets = {
+            tier: _TokenBucket(max_rate=rate) for tier, rate in _TIER_RATES.items()
+        }
+
+    async def _call(self, method_name: str, **kwargs) -> Any:
+        """Call a Slack API method under its tier's rate bucket.
+
+        Retries 429 responses honoring the Retry-After header with
+        exponential backoff, up to the configured retry count.
+        """
+        bucket = self._buckets.get(_METHOD_TIERS.get(method_name))
+        method = getattr(self.async_client, method_name)
+
+        for attempt in range(self.config.retry_count + 1):
+            if bucket:
+                await bucket.acquire()
+            try:
+                return await method(**kwargs)
+            except self.SlackApiError as e:
+                status = getattr(e.response, "status_code", None)
+                if status == 429 and attempt < self.config.retry_count:
+                    retry_after = float(e.response.headers.get("Retry-After", 1))
+                    await asyncio.sleep(retry_after * (2**attempt))
+                else:
+                    raise
+
+    async def _paginate(
+        self, method_name: str, key: str, **kwargs
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield successive pages of items from a cursor-paginated method.
+
+        Centralizes the cursor plumbing (and the rate limiting via _call)
+        that was previously hand-rolled at every call site.
+
+        Args:
+            method_name: Slack API method to page through
+            key: Response key holding the page's items
+        """
+        cursor = None
+        while True:
+            resp = await self._call(
+                method_name,
+                cursor=cursor,
+                limit=_PAGE_LIMITS[method_name],
+                **kwargs,
+            )
+            yield resp.get(key, [])
+
+            cursor = resp.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+
+    async def _list_channels_async(self) -> list[dict[str, Any]]:
+        """Paginate conversations_list and return all channels."""
+        channels: list[dict[str, Any]] = []
+        async for page in self._paginate(
+            "conversations_list",
+            "channels",
+            exclude_archived=not self.include_archived,
+            types="public_channel,private_channel" if self.include_private else "public_channel",
+        ):
+            channels.extend(page)
+        return channels
+
     def sync(self, incremental: bool = True) -> SyncResult:
         """Sync Slack content to ContextFrame."""
+        return asyncio.run(self._sync_async(incremental))
+
+    async def _sync_async(self, incremental: bool = True) -> SyncResult:
+        """Sync channels concurrently under a bounded semaphore."""
+        self._make_buckets()
+        # Memoized existence maps are only valid for one sync: rows written
+        # by a previous sync on this instance must be re-scanned
+        self._existing_by_channel.clear()
+        # One writer at a time: concurrent channel tasks would otherwise
+        # race Lance commits (and SyncResult counters) from their flush
+        # threads, while fetches stay free to overlap
+        self._write_lock = asyncio.Lock()
         result = SyncResult(success=True)
 
         # Get last sync state if incremental
@@ -177,30 +357,54 @@ class SlackConnector(SourceConnector):
             "Messages and threads from Slack workspace"
         )
 
-        # Track processed items
-        processed_messages: set[str] = set()
+        # Track processed items as 64-bit fingerprints; the raw
+        # "channel:ts" strings are only ever used for membership tests.
+        # Seeded from the previous sync's state so already-processed
+        # messages (e.g. thread replies refetched with their whole thread)
+        # are skipped instead of remapped, and the saved set stays
+        # cumulative across incremental syncs
+        processed_messages: set[int] = set()
+        if last_sync_state and last_sync_state.get("processed_fp"):
+            try:
+                processed_messages |= _deserialize_fingerprints(
+                    last_sync_state["processed_fp"]
+                )
+            except Exception as e:
+                self.logger.warning(f"Ignoring invalid processed_fp state: {e}")
         synced_channels: dict[str, str] = {}
 
+        # Load all workspace users up front so message mapping never makes
+        # per-user users_info round trips
+        await self._prewarm_user_cache()
+
         # Get channels to sync
-        channels_to_sync = self._get_channels_to_sync()
-
-        # Sync each channel
-        for channel in channels_to_sync:
-            channel_collection_id = self._sync_channel(
-                channel,
-                collection_id,
-                result,
-                last_sync_state,
-                processed_messages
-            )
+        channels_to_sync = await self._get_channels_to_sync()
+
+        # Sync channels concurrently; each channel's history is independent
+        # I/O, so wall time approaches the slowest channel rather than the sum
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def sync_one(channel: dict[str, Any]) -> tuple[str, str | None]:
+            async with semaphore:
+                channel_collection_id = await self._sync_channel(
+                    channel,
+                    collection_id,
+                    result,
+                    last_sync_state,
+                    processed_messages
+                )
+                return channel["id"], channel_collection_id
+
+        tasks = [asyncio.create_task(sync_one(ch)) for ch in channels_to_sync]
+        for channel_id, channel_collection_id in await asyncio.gather(*tasks):
             if channel_collection_id:
-                synced_channels[channel["id"]] = channel_collection_id
+                synced_channels[channel_id] = channel_collection_id
 
         # Save sync state
         if result.success:
             new_state = {
-                "last_sync": datetime.now().isoformat(),
-                "processed_messages": list(processed_messages),
+                "last_sync": int(time.time()),
+                "processed_fp": _serialize_fingerprints(processed_messages),
                 "synced_channels": synced_channels,
             }
             self.save_sync_state(new_state)
@@ -208,134 +412,169 @@ class SlackConnector(SourceConnector):
         result.complete()
         return result
 
-    def _get_channels_to_sync(self) -> list[dict[str, Any]]:
+    async def _prewarm_user_cache(self) -> None:
+        """Populate the user cache with a paginated users_list sweep.
+
+        One users_list page covers up to 1000 members, replacing the O(users)
+        users_info round trips that the message-mapping loop would otherwise
+        issue one at a time.
+        """
+        try:
+            async for members in self._paginate("users_list", "members"):
+                for member in members:
+                    self.user_cache[member["id"]] = member
+
+            self._user_cache_complete = True
+        except Exception as e:
+            self.logger.warning(f"Failed to prewarm user cache: {e}")
+
+    async def _get_channels_to_sync(self) -> list[dict[str, Any]]:
         """Get list of channels to sync based on configuration."""
         channels = []
-        
-        # Get channels by ID
-        for channel_id in self.channel_ids:
-            try:
-                info = self.client.conversations_info(channel=channel_id)
-                channels.append(info["channel"])
-            except Exception as e:
-                self.logger.warning(f"Failed to get channel {channel_id}: {e}")
+
+        # Get channels by ID; lookups are independent, so fire them together
+        if self.channel_ids:
+            infos = await asyncio.gather(
+                *(
+                    self._call("conversations_info", channel=channel_id)
+                    for channel_id in self.channel_ids
+                ),
+                return_exceptions=True,
+            )
+            for channel_id, info in zip(self.channel_ids, infos):
+                if isinstance(info, Exception):
+                    self.logger.warning(f"Failed to get channel {channel_id}: {info}")
+                else:
+                    channels.append(info["channel"])
 
         # Get channels by name
         if self.channel_names:
-            cursor = None
-            while True:
-                result = self.client.conversations_list(
-                    exclude_archived=not self.include_archived,
-                    types="public_channel,private_channel" if self.include_private else "public_channel",
-                    cursor=cursor
-                )
-                
-                for channel in result["channels"]:
-                    if channel["name"] in self.channel_names:
-                        channels.append(channel)
-                
-                if not result.get("response_metadata", {}).get("next_cursor"):
-                    break
-                cursor = result["response_metadata"]["next_cursor"]
+            for channel in await self._list_channels_async():
+                if channel["name"] in self.channel_names:
+                    channels.append(channel)
 
         # If no specific channels requested, get all
         if not self.channel_ids and not self.channel_names:
-            cursor = None
-            while True:
-                result = self.client.conversations_list(
-                    exclude_archived=not self.include_archived,
-                    types="public_channel,private_channel" if self.include_private else "public_channel",
-                    cursor=cursor,
-                    limit=100
-                )
-                
-                channels.extend(result["channels"])
-                
-                if not result.get("response_metadata", {}).get("next_cursor"):
-                    break
-                cursor = result["response_metadata"]["next_cursor"]
+            channels.extend(await self._list_channels_async())
 
         return channels
 
-    def _sync_channel(
+    async def _sync_channel(
         self,
         channel: dict[str, Any],
         parent_collection_id: str,
         result: SyncResult,
         last_sync_state: dict[str, Any] | None,
-        processed_messages: set[str]
+        processed_messages: set[int]
     ) -> str | None:
         """Sync a specific Slack channel."""
         try:
             # Create collection for channel
-            channel_collection_id = self.create_collection(
-                f"#{channel['name']}",
-                channel.get("topic", {}).get("value", "") or 
-                channel.get("purpose", {}).get("value", "") or
-                f"Slack channel #{channel['name']}"
-            )
+            async with self._write_lock:
+                channel_collection_id = await asyncio.to_thread(
+                    self.create_collection,
+                    f"#{channel['name']}",
+                    channel.get("topic", {}).get("value", "") or
+                    channel.get("purpose", {}).get("value", "") or
+                    f"Slack channel #{channel['name']}"
+                )
 
-            # Calculate time range
+            # Calculate time range with plain integer epoch math
             oldest = None
             if self.days_to_sync > 0:
-                oldest = int(
-                    (datetime.now(UTC) - 
-                     datetime.timedelta(days=self.days_to_sync)).timestamp()
-                )
-            
-            if incremental and last_sync_state:
+                oldest = int(time.time()) - self.days_to_sync * 86400
+
+            if last_sync_state:
                 # Use last sync time as oldest
-                last_sync = datetime.fromisoformat(last_sync_state["last_sync"])
-                oldest = int(last_sync.timestamp())
+                last_sync = last_sync_state["last_sync"]
+                if isinstance(last_sync, str):
+                    # Older sync states stored an ISO timestamp
+                    last_sync = datetime.fromisoformat(last_sync).timestamp()
+                oldest = int(last_sync)
+
+            # Buffer writes so each flush lands one Lance commit instead of
+            # one tiny fragment per message
+            pending_add: list[FrameRecord] = []
+            pending_update: list[tuple[str, FrameRecord]] = []
+
+            include_bots = self.config.sync_config.get("include_bots", False)
+            channel_id = channel["id"]
+
+            # Per-channel invariants computed once instead of per message
+            channel_ctx = {
+                "id": channel_id,
+                "name": channel["name"],
+                "url_prefix": f"https://{self._team}.slack.com/archives/{channel_id}/p",
+            }
 
-            # Get messages
-            cursor = None
-            while True:
+            # Pipeline fetching and writing through a bounded queue so the
+            # next page downloads while the previous batch is written
+            queue: asyncio.Queue[list[dict[str, Any]] | None] = asyncio.Queue(maxsize=4)
+
+            async def produce() -> None:
                 try:
-                    result = self.client.conversations_history(
-                        channel=channel["id"],
+                    async for messages in self._paginate(
+                        "conversations_history",
+                        "messages",
+                        channel=channel_id,
                         oldest=str(oldest) if oldest else None,
-                        cursor=cursor,
-                        limit=1000
+                    ):
+                        await queue.put(messages)
+                finally:
+                    await queue.put(None)
+
+            async def consume() -> None:
+                while True:
+                    messages = await queue.get()
+                    if messages is None:
+                        break
+
+                    # Resolve existing frames for the whole page at once
+                    # instead of one dataset search per message; off the
+                    # loop so the producer can fetch during the scan
+                    existing_map = await asyncio.to_thread(
+                        self._find_existing_messages,
+                        channel_id,
+                        [m["ts"] for m in messages],
                     )
-                    
-                    messages = result.get("messages", [])
-                    
+
                     for message in messages:
+                        # Hoist repeated lookups off the hot path
+                        user = message.get("user")
+                        ts = message["ts"]
+
+                        # Skip messages recorded as processed by an earlier
+                        # sync (or earlier in this one) before mapping them
+                        message_id = f"{channel_id}:{ts}"
+                        fingerprint = _message_fingerprint(message_id)
+                        if fingerprint in processed_messages:
+                            continue
+
                         # Filter by user if specified
-                        if self.user_ids and message.get("user") not in self.user_ids:
+                        if self.user_ids and user not in self.user_ids:
                             continue
 
                         # Skip bot messages unless specifically included
-                        if message.get("subtype") == "bot_message" and not self.config.sync_config.get("include_bots", False):
+                        if message.get("subtype") == "bot_message" and not include_bots:
                             continue
 
                         # Process message
-                        frame = self._map_message_to_frame(message, channel, channel_collection_id)
+                        frame = self._map_message_to_frame(message, channel_ctx, channel_collection_id)
                         if frame:
                             try:
-                                # Create unique ID for message
-                                message_id = f"{channel['id']}:{message['ts']}"
-                                
-                                existing = self.dataset.search(
-                                    f"custom_metadata.x_slack_message_id:'{message_id}'",
-                                    limit=1
-                                )
-
-                                if existing:
-                                    self.dataset.update(existing[0].metadata["uuid"], frame)
-                                    result.frames_updated += 1
+                                existing_uuid = existing_map.get(message_id)
+                                if existing_uuid:
+                                    pending_update.append((existing_uuid, frame))
                                 else:
-                                    self.dataset.add(frame)
-                                    result.frames_created += 1
+                                    pending_add.append(frame)
 
-                                processed_messages.add(message_id)
+                                processed_messages.add(fingerprint)
 
                                 # Sync thread if it exists
-                                if self.include_threads and message.get("thread_ts") == message.get("ts"):
-                                    self._sync_thread(
-                                        channel["id"],
-                                        message["ts"],
+                                if self.include_threads and message.get("thread_ts") == ts:
+                                    await self._sync_thread(
+                                        channel_id,
+                                        ts,
                                         channel_collection_id,
                                         result,
                                         processed_messages
@@ -344,17 +583,28 @@ class SlackConnector(SourceConnector):
                             except Exception as e:
                                 result.frames_failed += 1
                                 result.add_error(f"Failed to sync message: {e}")
-                    
-                    if not result.get("has_more"):
-                        break
-                    cursor = result.get("response_metadata", {}).get("next_cursor")
-                    
-                except self.SlackApiError as e:
-                    if e.response["error"] == "not_in_channel":
-                        result.add_warning(f"Bot not in channel #{channel['name']}")
-                    else:
-                        result.add_error(f"Failed to get messages from #{channel['name']}: {e}")
-                    break
+
+                    if len(pending_add) + len(pending_update) >= self.write_batch_size:
+                        # Blocking Lance writes run in a worker thread so
+                        # the next page downloads while this batch lands;
+                        # the lock serializes commits across channel tasks
+                        async with self._write_lock:
+                            await asyncio.to_thread(
+                                self._flush_writes, pending_add, pending_update, result
+                            )
+
+            try:
+                await asyncio.gather(produce(), consume())
+            except self.SlackApiError as e:
+                if e.response["error"] == "not_in_channel":
+                    result.add_warning(f"Bot not in channel #{channel['name']}")
+                else:
+                    result.add_error(f"Failed to get messages from #{channel['name']}: {e}")
+
+            async with self._write_lock:
+                await asyncio.to_thread(
+                    self._flush_writes, pending_add, pending_update, result
+                )
 
             return channel_collection_id
 
@@ -362,60 +612,197 @@ class SlackConnector(SourceConnector):
             result.add_error(f"Failed to sync channel #{channel['name']}: {e}")
             return None
 
-    def _sync_thread(
+    async def _sync_thread(
         self,
         channel_id: str,
         thread_ts: str,
         collection_id: str,
         result: SyncResult,
-        processed_messages: set[str]
+        processed_messages: set[int]
     ):
         """Sync thread replies."""
         try:
-            cursor = None
-            while True:
-                thread_result = self.client.conversations_replies(
-                    channel=channel_id,
-                    ts=thread_ts,
-                    cursor=cursor,
-                    limit=1000
+            pending_add: list[FrameRecord] = []
+            pending_update: list[tuple[str, FrameRecord]] = []
+
+            channel_ctx = {
+                "id": channel_id,
+                "url_prefix": f"https://{self._team}.slack.com/archives/{channel_id}/p",
+            }
+
+            first_page = True
+            async for replies in self._paginate(
+                "conversations_replies",
+                "messages",
+                channel=channel_id,
+                ts=thread_ts,
+            ):
+                if first_page:
+                    replies = replies[1:]  # Skip parent message
+                    first_page = False
+
+                existing_map = await asyncio.to_thread(
+                    self._find_existing_messages, channel_id, [r["ts"] for r in replies]
                 )
-                
-                replies = thread_result.get("messages", [])[1:]  # Skip parent message
-                
+
                 for reply in replies:
-                    frame = self._map_message_to_frame(reply, {"id": channel_id}, collection_id, is_thread_reply=True)
+                    # Replies already processed (by a previous sync, or via
+                    # thread_broadcast in the channel history) are skipped
+                    # before mapping
+                    message_id = f"{channel_id}:{reply['ts']}"
+                    fingerprint = _message_fingerprint(message_id)
+                    if fingerprint in processed_messages:
+                        continue
+
+                    frame = self._map_message_to_frame(reply, channel_ctx, collection_id, is_thread_reply=True)
                     if frame:
                         try:
-                            message_id = f"{channel_id}:{reply['ts']}"
-                            
                             # Add thread relationship
                             frame.add_relationship("reply_to", id=f"{channel_id}:{thread_ts}")
-                            
-                            existing = self.dataset.search(
-                                f"custom_metadata.x_slack_message_id:'{message_id}'",
-                                limit=1
-                            )
 
-                            if existing:
-                                self.dataset.update(existing[0].metadata["uuid"], frame)
-                                result.frames_updated += 1
+                            existing_uuid = existing_map.get(message_id)
+                            if existing_uuid:
+                                pending_update.append((existing_uuid, frame))
                             else:
-                                self.dataset.add(frame)
-                                result.frames_created += 1
+                                pending_add.append(frame)
 
-                            processed_messages.add(message_id)
+                            processed_messages.add(fingerprint)
 
                         except Exception as e:
                             result.add_warning(f"Failed to sync thread reply: {e}")
-                
-                if not thread_result.get("has_more"):
-                    break
-                cursor = thread_result.get("response_metadata", {}).get("next_cursor")
+
+            async with self._write_lock:
+                await asyncio.to_thread(
+                    self._flush_writes, pending_add, pending_update, result
+                )
 
         except Exception as e:
             result.add_warning(f"Failed to sync thread {thread_ts}: {e}")
 
+    def _flush_writes(
+        self,
+        pending_add: list[FrameRecord],
+        pending_update: list[tuple[str, FrameRecord]],
+        result: SyncResult,
+    ) -> None:
+        """Flush buffered writes, falling back to per-frame adds on failure."""
+        if pending_add:
+            try:
+                self.dataset.add_many(pending_add)
+                result.frames_created += len(pending_add)
+                for frame in pending_add:
+                    self._record_written(frame)
+            except Exception:
+                # Retry individually so one bad frame doesn't sink the batch
+                for frame in pending_add:
+                    try:
+                        self.dataset.add(frame)
+                        result.frames_created += 1
+                        self._record_written(frame)
+                    except Exception as e:
+                        result.frames_failed += 1
+                        result.add_error(f"Failed to sync message: {e}")
+            pending_add.clear()
+
+        for existing_uuid, frame in pending_update:
+            try:
+                # Carry the existing UUID so update_record replaces the
+                # stored row instead of failing to find the fresh frame's
+                frame.metadata["uuid"] = existing_uuid
+                self.dataset.update_record(frame)
+                result.frames_updated += 1
+            except Exception as e:
+                result.frames_failed += 1
+                result.add_error(f"Failed to update message: {e}")
+        pending_update.clear()
+
+    def _record_written(self, frame: FrameRecord) -> None:
+        """Note a newly added frame in the per-channel existence memo.
+
+        Keeps the memo coherent within one sync: thread_broadcast replies
+        that show up in both conversations_history and conversations_replies
+        resolve to an update on the second sighting instead of a duplicate
+        add. Channels whose memo was never loaded are left alone so their
+        first lookup still does the full scan.
+        """
+        meta = frame.metadata.get("custom_metadata") or {}
+        channel_id = meta.get("x_slack_channel_id")
+        message_id = meta.get("x_slack_message_id")
+        if not channel_id or not message_id:
+            return
+        existing = self._existing_by_channel.get(channel_id)
+        if existing is not None:
+            existing[message_id] = frame.metadata["uuid"]
+
+    def _find_existing_messages(
+        self, channel_id: str, ts_values: list[str]
+    ) -> dict[str, str]:
+        """Look up already-synced messages for a page of timestamps.
+
+        The per-channel message_id -> uuid map is prefetched once per sync
+        with a single columnar scan, so resolving a page is pure dict
+        lookups instead of a dataset query per message.
+
+        Args:
+            channel_id: Channel whose page is being checked
+            ts_values: Message timestamps for the current page
+
+        Returns:
+            Mapping of "channel:ts" message_id to existing frame UUID
+        """
+        existing_map: dict[str, str] = {}
+        if not ts_values:
+            return existing_map
+
+        existing = self._existing_messages(channel_id)
+        for ts in ts_values:
+            message_id = f"{channel_id}:{ts}"
+            existing_uuid = existing.get(message_id)
+            if existing_uuid is not None:
+                existing_map[message_id] = existing_uuid
+
+        return existing_map
+
+    def _existing_messages(self, channel_id: str) -> dict[str, str]:
+        """Map x_slack_message_id -> uuid for frames already in the dataset.
+
+        One columnar scan per channel replaces a dataset query per page.
+        custom_metadata is stored as a list of key/value structs, so the
+        channel and message-id entries are unpacked in Python rather than
+        filtered in SQL.
+        """
+        cached = self._existing_by_channel.get(channel_id)
+        if cached is not None:
+            return cached
+
+        existing: dict[str, str] = {}
+        try:
+            tbl = self.dataset.scanner(
+                filter="source_type = 'slack_message'",
+                columns=["uuid", "custom_metadata"],
+            ).to_table()
+        except AttributeError:
+            # API misuse, not a transient dataset failure; surface it
+            raise
+        except Exception as e:
+            # Leave the memo unset so the next page retries the scan
+            self.logger.warning(f"Failed to prefetch existing messages: {e}")
+            return existing
+
+        data = tbl.to_pydict()
+        for existing_uuid, pairs in zip(data["uuid"], data["custom_metadata"]):
+            if not pairs:
+                continue
+            meta = {pair["key"]: pair["value"] for pair in pairs}
+            if meta.get("x_slack_channel_id") != channel_id:
+                continue
+            message_id = meta.get("x_slack_message_id")
+            if message_id:
+                existing[message_id] = existing_uuid
+
+        self._existing_by_channel[channel_id] = existing
+        return existing
+
     def map_to_frame(self, source_data: dict[str, Any]) -> FrameRecord | None:
         """Map Slack data to FrameRecord."""
         return self._map_message_to_frame(source_data, {}, "")
@@ -423,72 +810,89 @@ class SlackConnector(SourceConnector):
     def _map_message_to_frame(
         self,
         message: dict[str, Any],
-        channel: dict[str, Any],
+        channel_ctx: dict[str, Any],
         collection_id: str,
         is_thread_reply: bool = False
     ) -> FrameRecord | None:
-        """Map Slack message to FrameRecord."""
+        """Map Slack message to FrameRecord.
+
+        Args:
+            message: Raw Slack message payload
+            channel_ctx: Per-channel invariants ("id", optional "url_prefix")
+            collection_id: Collection the frame belongs to
+            is_thread_reply: Whether this message is a thread reply
+        """
+        # Deferred so importing the connector module doesn't pull the full
+        # Arrow/Lance stack; resolved from sys.modules after the first call
+        from contextframe import FrameRecord
+        from contextframe.schema import RecordType
+
         try:
             # Get user info
-            user_info = self._get_user_info(message.get("user", ""))
+            user = message.get("user", "")
+            user_info = self._get_user_info(user)
             author = user_info.get("real_name", user_info.get("name", "Unknown"))
-            
+
             # Create timestamp
-            ts = float(message["ts"])
-            created_at = datetime.fromtimestamp(ts, tz=UTC).isoformat()
-            
+            ts_raw = message["ts"]
+            created_at = _fmt_ts(float(ts_raw))
+
             # Build title
-            title = f"Message from {author}"
-            if is_thread_reply:
-                title = f"Reply from {author}"
-            
+            title = f"Reply from {author}" if is_thread_reply else f"Message from {author}"
+
+            channel_id = channel_ctx.get("id", "")
+            url_prefix = channel_ctx.get("url_prefix")
+            if url_prefix is None:
+                url_prefix = f"https://{self._team}.slack.com/archives/{channel_id}/p"
+
             metadata = {
                 "title": title,
                 "record_type": RecordType.DOCUMENT,
                 "source_type": "slack_message",
-                "source_url": f"https://{self.workspace_info.get('team', 'slack')}.slack.com/archives/{channel.get('id', '')}/p{message['ts'].replace('.', '')}",
+                "source_url": url_prefix + ts_raw.replace(".", ""),
                 "collection": collection_id,
                 "collection_id": collection_id,
                 "author": author,
                 "created_at": created_at,
                 "custom_metadata": {
-                    "x_slack_message_id": f"{channel.get('id', '')}:{message['ts']}",
-                    "x_slack_channel_id": channel.get("id", ""),
-                    "x_slack_user_id": message.get("user", ""),
-                    "x_slack_ts": message["ts"],
+                    "x_slack_message_id": f"{channel_id}:{ts_raw}",
+                    "x_slack_channel_id": channel_id,
+                    "x_slack_user_id": user,
+                    "x_slack_ts": ts_raw,
                 }
             }
 
-            # Build content
-            content = f"**{author}** - {created_at}\n\n"
-            content += message.get("text", "")
-            
+            # Build content as parts; a final join avoids quadratic
+            # concatenation on messages with many reactions or files
+            text = message.get("text", "")
+            parts = [f"**{author}** - {created_at}\n\n", text]
+
             # Add reactions if present
             if self.include_reactions and message.get("reactions"):
-                content += "\n\n**Reactions:**\n"
+                parts.append("\n\n**Reactions:**\n")
                 for reaction in message["reactions"]:
-                    content += f":{reaction['name']}: ({reaction['count']}) "
-                content += "\n"
+                    parts.append(f":{reaction['name']}: ({reaction['count']}) ")
+                parts.append("\n")
 
             # Add attachments info
             if message.get("attachments"):
-                content += "\n\n**Attachments:**\n"
+                parts.append("\n\n**Attachments:**\n")
                 for attachment in message["attachments"]:
                     if attachment.get("title"):
-                        content += f"- {attachment['title']}\n"
+                        parts.append(f"- {attachment['title']}\n")
                     if attachment.get("text"):
-                        content += f"  {attachment['text']}\n"
+                        parts.append(f"  {attachment['text']}\n")
 
             # Add files info
             if message.get("files"):
-                content += "\n\n**Files:**\n"
+                parts.append("\n\n**Files:**\n")
                 for file in message["files"]:
-                    content += f"- {file.get('name', 'Unnamed')} ({file.get('mimetype', 'unknown')})\n"
+                    parts.append(f"- {file.get('name', 'Unnamed')} ({file.get('mimetype', 'unknown')})\n")
 
             return FrameRecord(
-                text_content=content,
+                text_content="".join(parts),
                 metadata=metadata,
-                context=message.get("text", "")[:200],  # First 200 chars as context
+                context=text[:200],  # First 200 chars as context
             )
 
         except Exception as e:
@@ -499,10 +903,15 @@ class SlackConnector(SourceConnector):
         """Get user info with caching."""
         if not user_id:
             return {}
-            
+
         if user_id in self.user_cache:
             return self.user_cache[user_id]
-        
+
+        # When the cache was fully prewarmed, an unknown ID means a deleted
+        # or external user; skip the network call rather than risk a 429 storm
+        if self._user_cache_complete:
+            return {"name": user_id}
+
         try:
             result = self.client.users_info(user=user_id)
             user_info = result["user"]
@@ -510,4 +919,4 @@ class SlackConnector(SourceConnector):
             return user_info
         except Exception as e:
             self.logger.warning(f"Failed to get user info for {user_id}: {e}")
-            return {"name": user_id}
\ No newline at end of file
+            return {"name": user_id}
@@ -3,7 +3,6 @@
 from .base import EmbeddingProvider, EmbeddingResult
 from .batch import BatchEmbedder, create_embedder
 from .integration import create_frame_records_with_embeddings, embed_extraction_results
-from .litellm_provider import LiteLLMProvider
 
 # Import TEI provider if httpx is available
 try:
@@ -26,3 +25,12 @@ __all__ = [
 # Only export TEIProvider if available
 if _TEI_AVAILABLE:
     __all__.append("TEIProvider")
+
+
+def __getattr__(name: str):
+    """Lazy-load LiteLLMProvider so importing the package stays cheap."""
+    if name == "LiteLLMProvider":
+        from .litellm_provider import LiteLLMProvider
+
+        return LiteLLMProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
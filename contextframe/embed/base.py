@@ -4,20 +4,29 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, List, Optional, Union
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class EmbeddingResult:
     """Result of an embedding operation from an encoding model.
 
+    Declared with slots since callers embedding millions of chunks hold
+    one instance per batch; dropping the per-instance __dict__ halves the
+    memory of the wrapper and speeds up attribute access.
+
     Attributes:
-        embeddings: The generated embeddings as a list of float lists
+        embeddings: The generated embeddings, either a list of float lists
+            or a packed (N, D) float ndarray from providers that parse
+            straight into numpy; consumers needing plain lists should use
+            :attr:`embeddings_list`
         model: The encoding model used (e.g., "text-embedding-ada-002")
         dimension: The dimension of the embeddings
         usage: Token usage information (if available)
         metadata: Additional metadata from the encoding model
     """
 
-    embeddings: list[list[float]]
+    embeddings: list[list[float]] | np.ndarray
     model: str
     dimension: int
     usage: dict[str, int] | None = None
@@ -28,8 +37,9 @@ class EmbeddingResult:
         if self.metadata is None:
             self.metadata = {}
 
-        # Validate all embeddings have same dimension
-        if self.embeddings:
+        # Validate all embeddings have same dimension; len() instead of a
+        # truth test so ndarray batches are accepted too
+        if len(self.embeddings):
             first_dim = len(self.embeddings[0])
             if not all(len(emb) == first_dim for emb in self.embeddings):
                 raise ValueError("All embeddings must have the same dimension")
@@ -43,6 +53,13 @@ class EmbeddingResult:
                     f"specified dimension {self.dimension}"
                 )
 
+    @property
+    def embeddings_list(self) -> list[list[float]]:
+        """Embeddings as plain Python lists, converting lazily from ndarray."""
+        if isinstance(self.embeddings, np.ndarray):
+            return self.embeddings.tolist()
+        return self.embeddings
+
 
 class EmbeddingProvider(ABC):
     """Abstract base class for encoding model providers.
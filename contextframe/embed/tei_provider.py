@@ -1,15 +1,167 @@
 """Text Embeddings Inference (TEI) provider for Hugging Face's embedding server."""
 
+import asyncio
+import atexit
+import hashlib
+import json
 import os
-from typing import Any, Optional, Union
+import random
+import threading
+import time
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, Optional, Union
 
 try:
     import httpx
 except ImportError:
     httpx = None
-    
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 from .base import EmbeddingProvider, EmbeddingResult
 
+# Process-wide client cache so every provider pointed at the same endpoint
+# shares one connection pool. Establishing a fresh TCP+TLS session per
+# provider instance costs multiple round-trips, which dominates latency for
+# short texts when workflows create a provider per call.
+_CLIENT_CACHE: dict[tuple[str, str | None, float], "httpx.Client"] = {}
+
+
+def _get_client(api_base: str, api_key: str | None, timeout: float) -> "httpx.Client":
+    """Return a pooled, keep-alive client shared across provider instances."""
+    key = (api_base, api_key, timeout)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        headers = {}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        client = httpx.Client(
+            # Pre-parsed URL object; httpx joins request paths against it
+            # without re-parsing the base string per request
+            base_url=httpx.URL(api_base),
+            headers=headers,
+            timeout=timeout,
+            # Transport-level retries cover DNS/connect blips cheaply
+            # without re-entering the app-level retry loop; they never
+            # mask 5xx responses
+            transport=httpx.HTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=60.0,
+                ),
+            ),
+        )
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+def _close_all() -> None:
+    """Close every cached client at interpreter shutdown."""
+    for client in _CLIENT_CACHE.values():
+        client.close()
+    _CLIENT_CACHE.clear()
+
+
+atexit.register(_close_all)
+
+# Ask TEI for raw float32 tensors where supported; JSON inflates a 4 KB
+# FP32 vector into ~20 KB of ASCII plus parse cost on both sides. Servers
+# without binary support ignore the header and answer with JSON. The
+# Content-Type is set explicitly because request bodies are pre-serialized
+# bytes rather than httpx's json= path.
+_EMBED_HEADERS = {
+    "Accept": "application/octet-stream",
+    "Content-Type": "application/json",
+}
+
+# TTLs for the /health and /info response caches, in seconds
+_HEALTH_TTL = 5.0
+_MODEL_INFO_TTL = 300.0
+
+
+def _handle_connect_error(e: Exception, provider: "TEIProvider") -> tuple[bool, str]:
+    return True, f"Cannot connect to TEI server at {provider.api_base}: {e}"
+
+
+def _handle_timeout(e: Exception, provider: "TEIProvider") -> tuple[bool, str]:
+    return True, f"TEI request timed out after {provider.timeout}s: {e}"
+
+
+def _handle_status_error(e: Exception, provider: "TEIProvider") -> tuple[bool, str]:
+    status = e.response.status_code
+    if status == 413:
+        return False, f"Input too large for TEI server: {e.response.text}"
+    if status == 503:
+        return True, f"TEI server overloaded: {e.response.text}"
+    retry = status in (408, 429) or status >= 500
+    return retry, f"TEI request failed ({status}): {e.response.text}"
+
+
+def _default_handler(e: Exception, provider: "TEIProvider") -> tuple[bool, str]:
+    return False, f"Unexpected error: {e}"
+
+
+# Maps exception type -> (should_retry, message) handler. Dispatch keyed on
+# type replaces an isinstance cascade in the retry loop and lets tests (or
+# subclasses) install their own policies.
+_ERROR_HANDLERS: dict[type, Any] = {}
+if httpx is not None:
+    _ERROR_HANDLERS = {
+        httpx.ConnectError: _handle_connect_error,
+        httpx.TimeoutException: _handle_timeout,
+        httpx.HTTPStatusError: _handle_status_error,
+    }
+
+
+def _classify_error(e: Exception, provider: "TEIProvider") -> tuple[bool, str]:
+    """Resolve the handler for an exception, honoring subclasses via MRO."""
+    for cls in type(e).__mro__:
+        handler = _ERROR_HANDLERS.get(cls)
+        if handler is not None:
+            return handler(e, provider)
+    return _default_handler(e, provider)
+
+
+def _cache_key(model: str, normalize: bool, text: str) -> bytes:
+    """Content-addressed cache key for one embedded text."""
+    return hashlib.blake2b(
+        f"{model}|{normalize}|{text}".encode(), digest_size=16
+    ).digest()
+
+
+class _LRUCache:
+    """Minimal LRU mapping cache key -> embedding row."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[bytes, np.ndarray] = OrderedDict()
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        row = self._data.get(key)
+        if row is not None:
+            self._data.move_to_end(key)
+        return row
+
+    def put(self, key: bytes, row: np.ndarray) -> None:
+        self._data[key] = row
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
 
 class TEIProvider(EmbeddingProvider):
     """Embedding provider for Text Embeddings Inference (TEI) server.
@@ -45,12 +197,16 @@ class TEIProvider(EmbeddingProvider):
         api_key: str | None = None,
         api_base: str | None = None,
         timeout: float = 30.0,
-        max_retries: int = 3,
+        max_retries: int = 2,
         truncate: bool = True,
         normalize: bool = True,
+        cache_size: int = 100_000,
+        client_normalize: bool = False,
+        dtype: Literal["float32", "float16"] = "float32",
+        warm_up: bool = False,
     ):
         """Initialize TEI provider.
-        
+
         Args:
             model: Model name (used for identification, actual model is set on TEI server)
             api_key: Optional bearer token for authentication
@@ -59,6 +215,14 @@ class TEIProvider(EmbeddingProvider):
             max_retries: Maximum number of retries
             truncate: Whether to truncate inputs to model's max length
             normalize: Whether to normalize embeddings
+            cache_size: Entries kept in the in-memory embedding cache
+                (0 disables caching)
+            client_normalize: L2-normalize locally instead of trusting the
+                server, for TEI versions without normalize support
+            dtype: Output dtype for embeddings; float16 halves downstream
+                bandwidth and storage with negligible recall loss
+            warm_up: Open the keep-alive connection in the background at
+                init so the first embed call skips the TCP/TLS handshake
         """
         if httpx is None:
             raise ImportError(
@@ -73,23 +237,192 @@ class TEIProvider(EmbeddingProvider):
         self.max_retries = max_retries
         self.truncate = truncate
         self.normalize = normalize
+        self.client_normalize = client_normalize
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        self.dtype = dtype
         self._model_info = None
+        self._model_info_expires = 0.0
+        self._health = None
+        self._health_expires = 0.0
         self._client = None
+        self._cache = _LRUCache(cache_size) if cache_size else None
+        # Payload skeleton reused by every embed call without kwargs
+        self._default_payload = {"truncate": truncate, "normalize": normalize}
+        # Merged /embed URL and headers, resolved once on first use
+        self._embed_url = None
+        self._embed_headers = None
+        if warm_up:
+            threading.Thread(target=self._warm_up, daemon=True).start()
         
     @property
     def client(self) -> httpx.Client:
-        """Get or create HTTP client."""
+        """Get the shared HTTP client for this endpoint."""
         if self._client is None:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-            self._client = httpx.Client(
-                base_url=self.api_base,
-                headers=headers,
-                timeout=self.timeout,
-            )
+            self._client = _get_client(self.api_base, self.api_key, self.timeout)
         return self._client
+
+    def _warm_up(self) -> None:
+        """Touch /health to establish the pooled connection ahead of use.
+
+        Cold embed calls otherwise pay the TCP (and TLS) handshake before
+        the first request, which is user-visible for query embedding.
+        Failures are ignored; the first real call will surface them.
+        """
+        try:
+            self.client.get("/health")
+        except Exception:
+            pass
         
+    def _parse_embeddings(self, response: "httpx.Response", n_texts: int) -> np.ndarray:
+        """Decode an /embed response into a (N, D) float32 array.
+
+        Binary responses are viewed zero-copy with np.frombuffer; JSON
+        responses (the fallback for servers without binary support) go
+        through the regular parse path.
+        """
+        content_type = response.headers.get("content-type", "")
+        if "application/octet-stream" in content_type:
+            return np.frombuffer(response.content, dtype=np.float32).reshape(
+                n_texts, -1
+            )
+        return np.asarray(_json_loads(response.content), dtype=np.float32)
+
+    def _maybe_normalize(self, arr: np.ndarray, payload: dict) -> np.ndarray:
+        """L2-normalize rows client-side when configured.
+
+        One vectorized np.linalg.norm over the contiguous batch is
+        memory-bandwidth-bound and far cheaper than normalizing row by row
+        downstream; float32 is kept throughout to avoid an FP64 upcast.
+        """
+        if not (self.client_normalize and payload["normalize"]):
+            return arr
+        if not arr.flags.writeable:
+            # Binary responses are read-only views over the HTTP body
+            arr = arr.copy()
+        arr /= np.linalg.norm(arr, axis=1, keepdims=True).clip(min=1e-12)
+        return arr
+
+    def _post_embed(self, inputs: list[str], payload: dict) -> np.ndarray:
+        """POST one sub-batch to /embed and parse the response.
+
+        The body is pre-serialized and passed via content= to bypass
+        httpx's stdlib json encoder on the hot path.
+        """
+        body = _json_dumps(
+            {
+                "inputs": inputs,
+                "truncate": payload["truncate"],
+                "normalize": payload["normalize"],
+            }
+        )
+        if self._embed_url is None:
+            # Resolve the merged URL and client+embed headers once; every
+            # later call skips httpx's per-request URL parse and header merge
+            template = self.client.build_request(
+                "POST", "/embed", headers=_EMBED_HEADERS
+            )
+            self._embed_url = template.url
+            self._embed_headers = dict(template.headers)
+        request = httpx.Request(
+            "POST", self._embed_url, headers=self._embed_headers, content=body
+        )
+        response = self.client.send(request)
+        response.raise_for_status()
+        return self._maybe_normalize(self._parse_embeddings(response, len(inputs)), payload)
+
+    def _pack_token_batches(self, texts: list[str]) -> list[list[str]]:
+        """Greedily pack texts into sub-batches under the server token budget.
+
+        TEI batches by tokens (--max-batch-tokens), not by request count, so
+        a handful of long documents can 413 while short strings under-fill
+        the GPU. Uses the cheap len(text) // 4 token estimate against 90% of
+        the advertised budget; servers that don't report max_batch_tokens
+        fall back to splitting on max_batch_size alone.
+        """
+        max_texts = self.max_batch_size or len(texts)
+        limit = self.get_model_info().get("max_batch_tokens")
+        if not isinstance(limit, int) or limit <= 0:
+            if len(texts) <= max_texts:
+                return [texts]
+            return [
+                texts[i : i + max_texts] for i in range(0, len(texts), max_texts)
+            ]
+        budget = max(1, int(limit * 0.9))
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for text in texts:
+            estimate = max(1, len(text) // 4)
+            if current and (
+                current_tokens + estimate > budget or len(current) >= max_texts
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(text)
+            current_tokens += estimate
+        if current:
+            batches.append(current)
+        return batches
+
+    def _build_result(self, embeddings: np.ndarray, payload: dict) -> EmbeddingResult:
+        """Package a parsed embedding array into an EmbeddingResult."""
+        if self.dtype != "float32":
+            embeddings = embeddings.astype(self.dtype)
+        dimension = int(embeddings.shape[1]) if embeddings.ndim == 2 else None
+        return EmbeddingResult(
+            embeddings=embeddings,
+            model=self.model,
+            dimension=dimension,
+            usage=None,  # TEI doesn't provide token usage
+            metadata={
+                "provider": "tei",
+                "api_base": self.api_base,
+                "truncate": payload["truncate"],
+                "normalize": payload["normalize"],
+                "dtype": self.dtype,
+            },
+        )
+
+    def _merge_cached(
+        self,
+        fetched: np.ndarray,
+        cached: list,
+        miss_indices: list[int],
+        keys: list[bytes],
+    ) -> np.ndarray:
+        """Scatter fetched rows and cache hits into one (N, D) array."""
+        out = np.empty((len(cached), fetched.shape[1]), dtype=np.float32)
+        for row, i in zip(fetched, miss_indices):
+            out[i] = row
+            self._cache.put(keys[i], out[i].copy())
+        for i, row in enumerate(cached):
+            if row is not None:
+                out[i] = row
+        return out
+
+    def retry_on(self, error: Exception) -> bool:
+        """Classify whether a failed attempt is worth retrying.
+
+        Connection and timeout errors are transient, as are 408/429/503 and
+        other 5xx responses. Anything else (e.g. 413 input-too-large) will
+        fail identically on a retry, so it is surfaced immediately. Policy
+        lives in the module-level _ERROR_HANDLERS dispatch table.
+        """
+        return _classify_error(error, self)[0]
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff with jitter, honoring Retry-After when sent."""
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = error.response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(30.0, float(retry_after))
+                except ValueError:
+                    pass
+        return min(30.0, 1.0 * (2**attempt) * (1 + random.uniform(0, 0.5)))
+
     def embed(self, texts: str | list[str], **kwargs) -> EmbeddingResult:
         """Generate embeddings using TEI server.
         
@@ -106,78 +439,181 @@ class TEIProvider(EmbeddingProvider):
             RuntimeError: If embedding generation fails after retries
         """
         texts = self.validate_texts(texts)
-        
-        # Prepare request payload
-        payload = {
-            "inputs": texts,
-            "truncate": kwargs.get("truncate", self.truncate),
-            "normalize": kwargs.get("normalize", self.normalize),
-        }
-        
+
+        # Prepare request payload from the precomputed skeleton
+        if kwargs:
+            payload = {
+                "inputs": texts,
+                **self._default_payload,
+                **{k: kwargs[k] for k in ("truncate", "normalize") if k in kwargs},
+            }
+        else:
+            payload = {"inputs": texts, **self._default_payload}
+
+        # Probe the cache only under the instance defaults so overridden
+        # calls never mix with entries computed under different settings
+        cache = self._cache
+        if cache is not None and (
+            payload["truncate"] != self.truncate
+            or payload["normalize"] != self.normalize
+        ):
+            cache = None
+        keys = cached = miss_indices = None
+        if cache is not None:
+            keys = [_cache_key(self.model, payload["normalize"], t) for t in texts]
+            cached = [cache.get(k) for k in keys]
+            miss_indices = [i for i, row in enumerate(cached) if row is None]
+            if not miss_indices:
+                return self._build_result(np.stack(cached), payload)
+            payload["inputs"] = [texts[i] for i in miss_indices]
+
+        # Duplicate texts (boilerplate headers, repeated titles) are embedded
+        # once and fanned back out by index after the fetch
+        seen: dict[str, int] = {}
+        dup_map = [seen.setdefault(t, len(seen)) for t in payload["inputs"]]
+        if len(seen) < len(payload["inputs"]):
+            payload["inputs"] = list(seen)
+        else:
+            dup_map = None
+
         # Make request with retries
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                response = self.client.post("/embed", json=payload)
-                response.raise_for_status()
-                
-                embeddings = response.json()
-                
-                # TEI returns list of embeddings directly
-                dimension = len(embeddings[0]) if embeddings else None
-                
-                return EmbeddingResult(
-                    embeddings=embeddings,
-                    model=self.model,
-                    dimension=dimension,
-                    usage=None,  # TEI doesn't provide token usage
-                    metadata={
-                        "provider": "tei",
-                        "api_base": self.api_base,
-                        "truncate": payload["truncate"],
-                        "normalize": payload["normalize"],
-                    },
-                )
-                
-            except httpx.ConnectError as e:
-                last_error = f"Cannot connect to TEI server at {self.api_base}: {str(e)}"
-            except httpx.TimeoutException as e:
-                last_error = f"TEI request timed out after {self.timeout}s: {str(e)}"
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 413:
-                    last_error = f"Input too large for TEI server: {e.response.text}"
-                elif e.response.status_code == 503:
-                    last_error = f"TEI server overloaded: {e.response.text}"
+                batches = self._pack_token_batches(payload["inputs"])
+                if len(batches) == 1:
+                    embeddings = self._post_embed(batches[0], payload)
                 else:
-                    last_error = f"TEI request failed ({e.response.status_code}): {e.response.text}"
+                    # Concurrent sub-batches multiplex on the pooled client,
+                    # overlapping round-trips; ex.map preserves order
+                    with ThreadPoolExecutor(
+                        max_workers=min(8, len(batches))
+                    ) as executor:
+                        parts = list(
+                            executor.map(
+                                lambda sub: self._post_embed(sub, payload), batches
+                            )
+                        )
+                    embeddings = np.concatenate(parts)
+                if dup_map is not None:
+                    embeddings = embeddings[dup_map]
+                if cache is not None:
+                    embeddings = self._merge_cached(
+                        embeddings, cached, miss_indices, keys
+                    )
+                return self._build_result(embeddings, payload)
+
             except Exception as e:
-                last_error = f"Unexpected error: {str(e)}"
-                
+                # Errors like 4xx are not transient; retrying only wastes time
+                retry, last_error = _classify_error(e, self)
+                if not retry:
+                    break
+                if attempt + 1 < self.max_retries:
+                    time.sleep(self._retry_delay(attempt, e))
+
         # All retries failed
         raise RuntimeError(
             f"Failed to generate embeddings with TEI after {self.max_retries} attempts. "
             f"Last error: {last_error}"
         )
-                    
+
+    async def aembed(self, texts: str | list[str], **kwargs) -> EmbeddingResult:
+        """Generate embeddings asynchronously, fanning out oversize batches.
+
+        Lists longer than ``max_batch_size`` are sharded and the shards are
+        posted concurrently, overlapping network round-trips with the
+        server's dynamic batching. Results keep the input order.
+
+        Args:
+            texts: Single text or list of texts to embed
+            **kwargs: Same overrides as :meth:`embed`
+
+        Returns:
+            EmbeddingResult with embeddings and metadata
+
+        Raises:
+            RuntimeError: If any shard fails
+        """
+        texts = self.validate_texts(texts)
+
+        payload = {
+            **self._default_payload,
+            **{k: kwargs[k] for k in ("truncate", "normalize") if k in kwargs},
+        }
+
+        batch = self.max_batch_size or len(texts)
+        chunks = [texts[i : i + batch] for i in range(0, len(texts), batch)]
+
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        try:
+            async with httpx.AsyncClient(
+                base_url=self.api_base,
+                headers=headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=16),
+            ) as client:
+                responses = await asyncio.gather(
+                    *[
+                        client.post(
+                            "/embed",
+                            content=_json_dumps({**payload, "inputs": chunk}),
+                            headers=_EMBED_HEADERS,
+                        )
+                        for chunk in chunks
+                    ]
+                )
+            for response in responses:
+                response.raise_for_status()
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate embeddings with TEI: {e}") from e
+
+        embeddings = np.concatenate(
+            [
+                self._maybe_normalize(self._parse_embeddings(response, len(chunk)), payload)
+                for response, chunk in zip(responses, chunks)
+            ]
+        )
+        return self._build_result(embeddings, payload)
+
+    def embed_batch_parallel(self, texts: str | list[str], **kwargs) -> EmbeddingResult:
+        """Synchronous wrapper around :meth:`aembed` for callers without a loop."""
+        return asyncio.run(self.aembed(texts, **kwargs))
+
+    def invalidate_cache(self) -> None:
+        """Drop cached /info and /health responses to force fresh reads."""
+        self._model_info = None
+        self._model_info_expires = 0.0
+        self._health = None
+        self._health_expires = 0.0
+
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the model from TEI server.
-        
+
+        The response is cached for five minutes so hot paths consulting it
+        (e.g. token-budget batching) don't hammer /info, while server
+        upgrades are still picked up eventually.
+
         Returns:
             Dictionary with model information including dimension and capabilities
         """
-        if self._model_info is None:
+        if self._model_info is None or time.monotonic() >= self._model_info_expires:
+            self._model_info_expires = time.monotonic() + _MODEL_INFO_TTL
             try:
                 # Query TEI info endpoint
                 response = self.client.get("/info")
                 response.raise_for_status()
-                
-                info = response.json()
-                
+
+                info = _json_loads(response.content)
+
                 self._model_info = {
                     "model": info.get("model_id", self.model),
                     "provider": "tei",
                     "dimension": info.get("max_input_length"),  # TEI provides this
                     "max_tokens": info.get("max_input_length"),
+                    "max_batch_tokens": info.get("max_batch_tokens"),
                     "supports_batch": True,
                     "capabilities": ["text-embedding"],
                     "api_base": self.api_base,
@@ -209,26 +645,28 @@ class TEIProvider(EmbeddingProvider):
         
     def health_check(self) -> dict[str, Any]:
         """Check if TEI server is healthy.
-        
+
+        The result is cached briefly so orchestration layers polling for
+        liveness don't turn every probe into a network round-trip.
+
         Returns:
             Dictionary with health status information
         """
+        if self._health is not None and time.monotonic() < self._health_expires:
+            return self._health
         try:
             response = self.client.get("/health")
             response.raise_for_status()
-            return {
+            self._health = {
                 "status": "healthy",
                 "api_base": self.api_base,
-                "response": response.json() if response.headers.get("content-type") == "application/json" else response.text
+                "response": _json_loads(response.content) if response.headers.get("content-type") == "application/json" else response.text
             }
         except Exception as e:
-            return {
-                "status": "unhealthy", 
+            self._health = {
+                "status": "unhealthy",
                 "api_base": self.api_base,
                 "error": str(e)
             }
-            
-    def __del__(self):
-        """Clean up HTTP client on deletion."""
-        if self._client is not None:
-            self._client.close()
\ No newline at end of file
+        self._health_expires = time.monotonic() + _HEALTH_TTL
+        return self._health
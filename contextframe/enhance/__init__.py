@@ -16,10 +16,12 @@ from contextframe.enhance.base import (
     ContextEnhancer,
     EnhancementResult,
 )
+from contextframe.enhance.cache import LLMCache
 from contextframe.enhance.prompts import (
     build_enhancement_prompt,
     get_prompt_template,
     list_available_prompts,
+    render_prompt,
 )
 from contextframe.enhance.tools import (
     ENHANCEMENT_TOOLS,
@@ -33,6 +35,7 @@ __all__ = [
     # Core enhancer
     "ContextEnhancer",
     "EnhancementResult",
+    "LLMCache",
     # MCP tools
     "EnhancementTools",
     "create_enhancement_tool",
@@ -42,5 +45,6 @@ __all__ = [
     # Prompt templates
     "get_prompt_template",
     "list_available_prompts",
+    "render_prompt",
     "build_enhancement_prompt",
 ]
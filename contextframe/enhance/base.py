@@ -1,15 +1,33 @@
 """Base enhancer for LLM-powered document enhancement using Mirascope."""
 
+import asyncio
 import datetime
+import functools
+import hashlib
+import inspect
+import logging
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextframe import FrameDataset, FrameRecord
+from contextframe.enhance.cache import LLMCache
 from dataclasses import dataclass
 from enum import Enum
 from mirascope import llm
 from mirascope.core import BaseMessageParam
 from pathlib import Path
-from pydantic import BaseModel, Field
+import pyarrow as pa
+import pyarrow.compute as pc
+from pydantic import BaseModel, Field, create_model
 from typing import Any, Optional
 
+logger = logging.getLogger(__name__)
+
+# Rows between progress-bar refreshes on the dataset pipeline; batching
+# keeps tqdm's lock out of the per-window hot path
+_PROGRESS_EVERY = 64
+
 
 @dataclass
 class EnhancementResult:
@@ -85,6 +103,108 @@ class RelationshipsResponse(BaseModel):
     )
 
 
+# Transient provider errors worth retrying, matched by class name so no
+# provider SDK has to be imported just to reference its exception types
+_RETRYABLE_ERRORS = frozenset(
+    {"RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError"}
+)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether an LLM call failure is transient and worth retrying."""
+    return any(base.__name__ in _RETRYABLE_ERRORS for base in type(error).__mro__)
+
+
+# Invariant system prompts, shared across every call so the provider-side
+# prompt cache sees byte-identical prefixes and can skip prefill for them
+_SYSTEM_PROMPTS = {
+    "context": "You are a helpful assistant that enhances documents with meaningful context.",
+    "tags": "You are a helpful assistant that extracts relevant tags from documents.",
+    "custom_metadata": "You are a helpful assistant that extracts structured metadata from documents.",
+    "relationships": "You are a helpful assistant that identifies relationships between documents.",
+    "batch": "You are a helpful assistant that enhances documents with structured metadata.",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _field_system_prompt(field_name: str) -> str:
+    """Stable per-field system prompt (one interned string per field)."""
+    return f"You are a helpful assistant that enhances documents by extracting {field_name}."
+
+
+# Matches {content}, {title}, etc. so prompts are filled in one pass
+# instead of one full string scan per template variable
+_TEMPLATE_VAR_RE = re.compile(r"\{(\w+)\}")
+
+# Sentence boundaries for cheap extractive candidate summaries
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+# Per-field value extractors, dispatched by dict lookup on the hot path
+# instead of an if/elif chain run once per enhancement call
+_FIELD_EXTRACTORS = {
+    "context": lambda response: response.context,
+    "tags": lambda response: response.tags,
+    "title": lambda response: response.title,
+    "status": lambda response: response.status,
+    "custom_metadata": lambda response: response.metadata,
+    "relationships": lambda response: [
+        rel.model_dump(exclude_none=True) for rel in response.relationships
+    ],
+}
+
+
+def _set_custom_metadata(frame: "FrameRecord", value: Any) -> None:
+    if not isinstance(value, dict):
+        frame.metadata["custom_metadata"] = value
+        return
+    # Convert all values to strings as required by schema, merging with
+    # any existing custom metadata
+    string_metadata = {k: str(v) for k, v in value.items()}
+    existing = frame.metadata.get("custom_metadata", {})
+    if existing:
+        existing.update(string_metadata)
+        frame.metadata["custom_metadata"] = existing
+    else:
+        frame.metadata["custom_metadata"] = string_metadata
+
+
+# Per-field frame setters; fields without an entry land in frame.metadata
+_FIELD_SETTERS = {
+    "text_content": lambda frame, value: setattr(frame, "text_content", value),
+    "vector": lambda frame, value: setattr(frame, "vector", value),
+    "raw_data": lambda frame, value: setattr(frame, "raw_data", value),
+    "raw_data_type": lambda frame, value: setattr(frame, "raw_data_type", value),
+    "custom_metadata": _set_custom_metadata,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _batch_response_model(fields: tuple[str, ...]) -> type[BaseModel]:
+    """Build (and memoize) a response model covering several fields at once.
+
+    The dynamic model nests one field-specific response model per requested
+    field so a single structured LLM call can populate all of them together.
+    """
+    return create_model(
+        "DocumentEnhancementResponse",
+        **{name: (ContextEnhancer.FIELD_MODELS[name], ...) for name in fields},
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _rows_response_model(field_name: str) -> type[BaseModel]:
+    """Build (and memoize) a list-of-responses model for row-marshaled calls."""
+    model = ContextEnhancer.FIELD_MODELS[field_name]
+    return create_model(
+        f"{model.__name__}Rows",
+        results=(
+            list[model],
+            Field(description="One response per input document, in order"),
+        ),
+    )
+
+
 class ContextEnhancer:
     """LLM-powered enhancer using Mirascope for structured outputs.
 
@@ -109,37 +229,198 @@ class ContextEnhancer:
         "relationships": RelationshipsResponse,
     }
 
-    def __init__(self, provider: str = "openai", model: str = "gpt-4o-mini", **kwargs):
+    # JSON Schemas compiled once at class definition; pydantic reflection
+    # per request is pure overhead since the models never change
+    _SCHEMA_CACHE = {
+        name: model.model_json_schema() for name, model in FIELD_MODELS.items()
+    }
+
+    def __init__(
+        self,
+        provider: str = "openai",
+        model: str = "gpt-4o-mini",
+        max_concurrency: int = 8,
+        row_marshal_size: int = 4,
+        cache: LLMCache | None = None,
+        max_retries: int = 4,
+        **kwargs,
+    ):
         """Initialize the enhancer.
 
         Args:
             provider: LLM provider (openai, anthropic, etc.)
             model: Model name
-            **kwargs: Additional provider-specific arguments
+            max_concurrency: Maximum number of concurrent LLM calls on the
+                async paths; keep below the provider's requests-per-minute
+                limit
+            row_marshal_size: How many dataset rows to marshal into one LLM
+                call during dataset enhancement; returns diminish quickly
+                past 4-8
+            cache: Optional :class:`LLMCache` so repeated enhancement of
+                identical content skips the LLM call entirely
+            max_retries: Total attempts per LLM call before giving up on
+                transient provider errors (rate limits, timeouts)
+            **kwargs: Additional provider-specific arguments. Pass
+                ``client=`` with a provider SDK client (e.g. an
+                ``AsyncOpenAI`` built on a pooled HTTP client) to reuse one
+                connection pool across every call; use the enhancer as a
+                (sync or async) context manager to close it afterwards
         """
         self.provider = provider
         self.model = model
+        self.max_concurrency = max_concurrency
+        self.row_marshal_size = max(1, row_marshal_size)
+        self.cache = cache
+        self.max_retries = max(1, max_retries)
         self.kwargs = kwargs
+        # Route all calls to the same provider-side prompt-cache shard so
+        # the shared system-prompt prefix is prefillable from cache
+        if provider == "openai" and "call_params" not in kwargs:
+            cache_key = hashlib.sha256(
+                f"contextframe-enhance:{model}".encode()
+            ).hexdigest()
+            self.kwargs["call_params"] = {
+                "extra_headers": {"prompt-cache-key": cache_key}
+            }
+        # Decorated call functions memoized per (response model, sync/async);
+        # llm.call does signature inspection and schema compilation, so pay
+        # that once per enhancer instead of once per call
+        self._generators: dict[tuple[type[BaseModel], bool], Any] = {}
+        # Candidate payloads for find_relationships, keyed by (uuid, content
+        # length) so the same document is summarized once per scan loop
+        self._candidate_payloads: dict[tuple[str, int], dict[str, str]] = {}
+
+    def _generator_for_model(
+        self, response_model: type[BaseModel], is_async: bool = False
+    ) -> Any:
+        """Return the cached llm.call-decorated function for a response model."""
+        key = (response_model, is_async)
+        generator = self._generators.get(key)
+        if generator is None:
+            decorator = llm.call(
+                provider=self.provider,
+                model=self.model,
+                response_model=response_model,
+                **self.kwargs,
+            )
+            if is_async:
 
-    def enhance_context(
+                async def acall(
+                    messages: list[BaseMessageParam],
+                ) -> list[BaseMessageParam]:
+                    return messages
+
+                generator = decorator(acall)
+            else:
+
+                def call(
+                    messages: list[BaseMessageParam],
+                ) -> list[BaseMessageParam]:
+                    return messages
+
+                generator = decorator(call)
+            self._generators[key] = generator
+        return generator
+
+    def _generator(self, field_name: str, is_async: bool = False) -> Any:
+        """Return the cached call function for a schema field."""
+        return self._generator_for_model(self.FIELD_MODELS[field_name], is_async)
+
+    def _system_message(self, text: str) -> BaseMessageParam:
+        """Build the system message, marking it cacheable where supported.
+
+        Anthropic only reuses the prompt-cache for prefixes carrying an
+        explicit cache_control block; OpenAI caching is steered through the
+        prompt-cache-key header set at construction time.
+        """
+        if self.provider == "anthropic":
+            return {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": text,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+        return {"role": "system", "content": text}
+
+    def _invoke(self, generator: Any, messages: list[BaseMessageParam]) -> Any:
+        """Invoke a call function with bounded, jittered retries.
+
+        Only transient provider errors (rate limits, timeouts, connection
+        drops) are retried; everything else fails fast so the surrounding
+        loop can move on to the remaining work.
+        """
+        for attempt in range(self.max_retries):
+            try:
+                return generator(messages)
+            except Exception as e:
+                if not _is_retryable(e) or attempt + 1 >= self.max_retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+
+    async def _ainvoke(self, generator: Any, messages: list[BaseMessageParam]) -> Any:
+        """Async variant of :meth:`_invoke`; tolerates sync call doubles."""
+        for attempt in range(self.max_retries):
+            try:
+                result = generator(messages)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except Exception as e:
+                if not _is_retryable(e) or attempt + 1 >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Jittered exponential backoff, capped at 30 seconds."""
+        return min(30.0, 2**attempt * (1 + random.random()))
+
+    # ------------------------------------------------------------------
+    # Shared-client lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Close an injected provider client, if one was passed via kwargs."""
+        client = self.kwargs.get("client")
+        close = getattr(client, "close", None)
+        if callable(close):
+            close()
+
+    async def aclose(self) -> None:
+        """Async variant of :meth:`close` for async provider clients."""
+        client = self.kwargs.get("client")
+        close = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if callable(close):
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+    def __enter__(self) -> "ContextEnhancer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "ContextEnhancer":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Message builders shared by the sync and async call paths
+    # ------------------------------------------------------------------
+
+    def _context_messages(
         self,
         content: str,
         purpose: str | None = None,
         current_context: str | None = None,
-    ) -> str:
-        """Enhance the context field with a description."""
-
-        @llm.call(
-            provider=self.provider,
-            model=self.model,
-            response_model=ContextResponse,
-            **self.kwargs,
-        )
-        def generate_context(
-            messages: list[BaseMessageParam],
-        ) -> list[BaseMessageParam]:
-            return messages
-
+    ) -> list[BaseMessageParam]:
         prompt = f"""Analyze this document and write a brief context description (2-3 sentences).
 {f'Focus on: {purpose}' if purpose else 'Explain what this document is about and why it matters.'}
 {f'Current context: {current_context}' if current_context else ''}
@@ -147,104 +428,46 @@ class ContextEnhancer:
 Document content:
 {content}"""
 
-        response = generate_context(
-            [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that enhances documents with meaningful context.",
-                },
-                {"role": "user", "content": prompt},
-            ]
-        )
-
-        return response.context
+        return [
+            self._system_message(_SYSTEM_PROMPTS["context"]),
+            {"role": "user", "content": prompt},
+        ]
 
-    def enhance_tags(
+    def _tags_messages(
         self, content: str, tag_types: str | None = None, max_tags: int = 5
-    ) -> list[str]:
-        """Extract tags from document content."""
-
-        @llm.call(
-            provider=self.provider,
-            model=self.model,
-            response_model=TagsResponse,
-            **self.kwargs,
-        )
-        def extract_tags(messages: list[BaseMessageParam]) -> list[BaseMessageParam]:
-            return messages
-
+    ) -> list[BaseMessageParam]:
         prompt = f"""Extract up to {max_tags} relevant tags from this document.
 {f'Focus on: {tag_types}' if tag_types else 'Include topics, technologies, concepts, and categories.'}
 
 Document content:
 {content}"""
 
-        response = extract_tags(
-            [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that extracts relevant tags from documents.",
-                },
-                {"role": "user", "content": prompt},
-            ]
-        )
-
-        return response.tags[:max_tags]
+        return [
+            self._system_message(_SYSTEM_PROMPTS["tags"]),
+            {"role": "user", "content": prompt},
+        ]
 
-    def enhance_custom_metadata(
+    def _custom_metadata_messages(
         self, content: str, schema_prompt: str
-    ) -> dict[str, Any]:
-        """Extract custom metadata based on user prompt."""
-
-        @llm.call(
-            provider=self.provider,
-            model=self.model,
-            response_model=CustomMetadataResponse,
-            **self.kwargs,
-        )
-        def extract_metadata(
-            messages: list[BaseMessageParam],
-        ) -> list[BaseMessageParam]:
-            return messages
-
+    ) -> list[BaseMessageParam]:
         prompt = f"""Extract the following metadata from the document:
 {schema_prompt}
 
 Document content:
 {content}"""
 
-        response = extract_metadata(
-            [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that extracts structured metadata from documents.",
-                },
-                {"role": "user", "content": prompt},
-            ]
-        )
-
-        return response.metadata
+        return [
+            self._system_message(_SYSTEM_PROMPTS["custom_metadata"]),
+            {"role": "user", "content": prompt},
+        ]
 
-    def enhance_relationships(
+    def _relationships_messages(
         self,
         source_content: str,
         source_title: str,
         candidates: list[dict[str, str]],
         max_relationships: int = 5,
-    ) -> list[dict[str, Any]]:
-        """Find relationships between documents."""
-
-        @llm.call(
-            provider=self.provider,
-            model=self.model,
-            response_model=RelationshipsResponse,
-            **self.kwargs,
-        )
-        def find_relationships(
-            messages: list[BaseMessageParam],
-        ) -> list[BaseMessageParam]:
-            return messages
-
+    ) -> list[BaseMessageParam]:
         candidates_text = "\n".join(
             [
                 f"{i + 1}. {c.get('title', 'Untitled')}: {c.get('summary', '')}"
@@ -264,17 +487,16 @@ Candidate documents:
 
 Return up to {max_relationships} relationships."""
 
-        response = find_relationships(
-            [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that identifies relationships between documents.",
-                },
-                {"role": "user", "content": prompt},
-            ]
-        )
+        return [
+            self._system_message(_SYSTEM_PROMPTS["relationships"]),
+            {"role": "user", "content": prompt},
+        ]
 
-        # Convert to schema format
+    @staticmethod
+    def _relationships_to_schema(
+        response: RelationshipsResponse, max_relationships: int
+    ) -> list[dict[str, Any]]:
+        """Convert a relationships response to schema-format dicts."""
         relationships = []
         for rel in response.relationships[:max_relationships]:
             rel_dict = {
@@ -289,6 +511,112 @@ Return up to {max_relationships} relationships."""
 
         return relationships
 
+    def enhance_context(
+        self,
+        content: str,
+        purpose: str | None = None,
+        current_context: str | None = None,
+    ) -> str:
+        """Enhance the context field with a description."""
+        response = self._invoke(
+            self._generator("context"),
+            self._context_messages(content, purpose, current_context),
+        )
+
+        return response.context
+
+    async def aenhance_context(
+        self,
+        content: str,
+        purpose: str | None = None,
+        current_context: str | None = None,
+    ) -> str:
+        """Async variant of :meth:`enhance_context`."""
+        response = await self._ainvoke(
+            self._generator("context", is_async=True),
+            self._context_messages(content, purpose, current_context),
+        )
+
+        return response.context
+
+    def enhance_tags(
+        self, content: str, tag_types: str | None = None, max_tags: int = 5
+    ) -> list[str]:
+        """Extract tags from document content."""
+        response = self._invoke(
+            self._generator("tags"),
+            self._tags_messages(content, tag_types, max_tags),
+        )
+
+        return response.tags[:max_tags]
+
+    async def aenhance_tags(
+        self, content: str, tag_types: str | None = None, max_tags: int = 5
+    ) -> list[str]:
+        """Async variant of :meth:`enhance_tags`."""
+        response = await self._ainvoke(
+            self._generator("tags", is_async=True),
+            self._tags_messages(content, tag_types, max_tags),
+        )
+
+        return response.tags[:max_tags]
+
+    def enhance_custom_metadata(
+        self, content: str, schema_prompt: str
+    ) -> dict[str, Any]:
+        """Extract custom metadata based on user prompt."""
+        response = self._invoke(
+            self._generator("custom_metadata"),
+            self._custom_metadata_messages(content, schema_prompt),
+        )
+
+        return response.metadata
+
+    async def aenhance_custom_metadata(
+        self, content: str, schema_prompt: str
+    ) -> dict[str, Any]:
+        """Async variant of :meth:`enhance_custom_metadata`."""
+        response = await self._ainvoke(
+            self._generator("custom_metadata", is_async=True),
+            self._custom_metadata_messages(content, schema_prompt),
+        )
+
+        return response.metadata
+
+    def enhance_relationships(
+        self,
+        source_content: str,
+        source_title: str,
+        candidates: list[dict[str, str]],
+        max_relationships: int = 5,
+    ) -> list[dict[str, Any]]:
+        """Find relationships between documents."""
+        response = self._invoke(
+            self._generator("relationships"),
+            self._relationships_messages(
+                source_content, source_title, candidates, max_relationships
+            )
+        )
+
+        return self._relationships_to_schema(response, max_relationships)
+
+    async def aenhance_relationships(
+        self,
+        source_content: str,
+        source_title: str,
+        candidates: list[dict[str, str]],
+        max_relationships: int = 5,
+    ) -> list[dict[str, Any]]:
+        """Async variant of :meth:`enhance_relationships`."""
+        response = await self._ainvoke(
+            self._generator("relationships", is_async=True),
+            self._relationships_messages(
+                source_content, source_title, candidates, max_relationships
+            )
+        )
+
+        return self._relationships_to_schema(response, max_relationships)
+
     def enhance_field(
         self,
         content: str,
@@ -308,43 +636,194 @@ Return up to {max_relationships} relationships."""
                 f"Unknown field: {field_name}. Valid fields: {list(self.FIELD_MODELS.keys())}"
             )
 
-        # Build dynamic enhancement function
-        @llm.call(
-            provider=self.provider,
+        cache_key = self._cache_key(field_name, content, prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._extract_field_value(
+                    field_name, response_model.model_validate_json(cached)
+                )
+
+        response = self._invoke(
+            self._generator(field_name),
+            self._field_messages(content, field_name, prompt, current_metadata),
+        )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response.model_dump_json())
+
+        return self._extract_field_value(field_name, response)
+
+    def _cache_key(self, field_name: str, content: str, prompt: str) -> str | None:
+        """Build the cache key for a single-field call, or None if uncached."""
+        if self.cache is None:
+            return None
+        return self.cache.make_key(
             model=self.model,
-            response_model=response_model,
-            **self.kwargs,
+            provider=self.provider,
+            field=field_name,
+            content=content,
+            prompt=prompt,
         )
-        def enhance(messages: list[BaseMessageParam]) -> list[BaseMessageParam]:
-            return messages
 
-        # Build full prompt with template variables
-        full_prompt = self._build_prompt(content, prompt, current_metadata)
+    async def aenhance_field(
+        self,
+        content: str,
+        field_name: str,
+        prompt: str,
+        current_metadata: dict[str, Any] | None = None,
+    ) -> Any:
+        """Async variant of :meth:`enhance_field`."""
+        response_model = self.FIELD_MODELS.get(field_name)
+        if not response_model:
+            raise ValueError(
+                f"Unknown field: {field_name}. Valid fields: {list(self.FIELD_MODELS.keys())}"
+            )
 
-        response = enhance(
-            [
-                {
-                    "role": "system",
-                    "content": f"You are a helpful assistant that enhances documents by extracting {field_name}.",
-                },
-                {"role": "user", "content": full_prompt},
-            ]
+        cache_key = self._cache_key(field_name, content, prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._extract_field_value(
+                    field_name, response_model.model_validate_json(cached)
+                )
+
+        response = await self._ainvoke(
+            self._generator(field_name, is_async=True),
+            self._field_messages(content, field_name, prompt, current_metadata),
+        )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response.model_dump_json())
+
+        return self._extract_field_value(field_name, response)
+
+    def enhance_fields(
+        self,
+        content: str,
+        prompts: dict[str, str],
+    ) -> dict[str, Any]:
+        """Enhance several fields of one document in a single LLM call.
+
+        Multi-field counterpart to :meth:`enhance_field`: the combined
+        response model covers every requested field, so the document is
+        sent (and prefilled by the model) once instead of once per field.
+
+        Args:
+            content: Document content
+            prompts: Map of field_name -> instruction prompt; prompts should
+                describe the field only, the document is appended separately
+
+        Returns:
+            Map of field_name -> extracted field value
+        """
+        fields, response_model, cache_key, messages = self._prepare_fields_call(
+            content, prompts
+        )
+
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._fields_values(
+                    fields, response_model.model_validate_json(cached)
+                )
+
+        response = self._invoke(self._generator_for_model(response_model), messages)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response.model_dump_json())
+
+        return self._fields_values(fields, response)
+
+    async def aenhance_fields(
+        self,
+        content: str,
+        prompts: dict[str, str],
+    ) -> dict[str, Any]:
+        """Async variant of :meth:`enhance_fields`."""
+        fields, response_model, cache_key, messages = self._prepare_fields_call(
+            content, prompts
+        )
+
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._fields_values(
+                    fields, response_model.model_validate_json(cached)
+                )
+
+        response = await self._ainvoke(
+            self._generator_for_model(response_model, is_async=True), messages
         )
 
-        # Extract the field value from response
-        if field_name == "context":
-            return response.context
-        elif field_name == "tags":
-            return response.tags
-        elif field_name == "title":
-            return response.title
-        elif field_name == "status":
-            return response.status
-        elif field_name == "custom_metadata":
-            return response.metadata
-        elif field_name == "relationships":
-            return [rel.model_dump(exclude_none=True) for rel in response.relationships]
+        if cache_key is not None:
+            self.cache.set(cache_key, response.model_dump_json())
+
+        return self._fields_values(fields, response)
+
+    def _prepare_fields_call(
+        self, content: str, prompts: dict[str, str]
+    ) -> tuple[tuple[str, ...], type[BaseModel], str | None, list[BaseMessageParam]]:
+        """Validate and assemble a multi-field enhancement call."""
+        fields = tuple(prompts)
+        unknown = [name for name in fields if name not in self.FIELD_MODELS]
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {unknown}. Valid fields: {list(self.FIELD_MODELS.keys())}"
+            )
+
+        instructions = "\n".join(
+            f"- {field_name}: {prompt}" for field_name, prompt in prompts.items()
+        )
+        user_prompt = f"""Enhance this document by producing every requested field in one JSON response.
+
+Requested fields:
+{instructions}
+
+Document content:
+{content}"""
+
+        messages = [
+            self._system_message(_SYSTEM_PROMPTS["batch"]),
+            {"role": "user", "content": user_prompt},
+        ]
+
+        return (
+            fields,
+            _batch_response_model(fields),
+            self._cache_key(",".join(fields), content, instructions),
+            messages,
+        )
+
+    def _fields_values(
+        self, fields: tuple[str, ...], response: Any
+    ) -> dict[str, Any]:
+        """Extract per-field values from a combined structured response."""
+        return {
+            name: self._extract_field_value(name, getattr(response, name))
+            for name in fields
+        }
+
+    def _field_messages(
+        self,
+        content: str,
+        field_name: str,
+        prompt: str,
+        current_metadata: dict[str, Any] | None = None,
+    ) -> list[BaseMessageParam]:
+        """Build the message list for a single-field enhancement call."""
+        full_prompt = self._build_prompt(content, prompt, current_metadata)
+
+        return [
+            self._system_message(_field_system_prompt(field_name)),
+            {"role": "user", "content": full_prompt},
+        ]
 
+    def _extract_field_value(self, field_name: str, response: Any) -> Any:
+        """Pull the typed field value out of a structured response."""
+        extractor = _FIELD_EXTRACTORS.get(field_name)
+        if extractor is not None:
+            return extractor(response)
         return response
 
     def enhance_document(
@@ -363,10 +842,69 @@ Return up to {max_relationships} relationships."""
         Returns:
             Updated FrameRecord with enhanced fields
         """
-        for field_name, config in enhancements.items():
-            # Skip if field already has value and skip_existing is True
-            if skip_existing and self._field_has_value(frame, field_name):
-                continue
+        pending = [
+            field_name
+            for field_name in enhancements
+            if not (skip_existing and self._field_has_value(frame, field_name))
+        ]
+
+        # Collapse multi-field enhancement into one structured call; a single
+        # response covering all fields saves N-1 network round-trips
+        if len(pending) > 1:
+            try:
+                return self._enhance_document_batched(frame, pending, enhancements)
+            except Exception as e:
+                logger.warning("Batched enhancement failed, retrying per field: %s", e)
+
+        return self._enhance_fields_individually(frame, pending, enhancements)
+
+    def _enhance_document_batched(
+        self,
+        frame: FrameRecord,
+        pending: list[str],
+        enhancements: dict[str, str | dict[str, Any]],
+    ) -> FrameRecord:
+        """Populate all pending fields with a single structured LLM call."""
+        enhance_all = self._generator_for_model(_batch_response_model(tuple(pending)))
+
+        instruction_lines = []
+        for field_name in pending:
+            config = enhancements[field_name]
+            prompt = config if isinstance(config, str) else config.get("prompt", "")
+            instruction_lines.append(f"- {field_name}: {prompt}")
+        instructions = "\n".join(instruction_lines)
+
+        prompt = f"""Enhance this document by producing every requested field in one JSON response.
+
+Requested fields:
+{instructions}
+
+Document content:
+{frame.text_content or ''}"""
+
+        response = self._invoke(
+            enhance_all,
+            [
+                self._system_message(_SYSTEM_PROMPTS["batch"]),
+                {"role": "user", "content": prompt},
+            ],
+        )
+
+        for field_name in pending:
+            value = self._extract_field_value(field_name, getattr(response, field_name))
+            self._update_frame_field(frame, field_name, value)
+
+        return frame
+
+    def _enhance_fields_individually(
+        self,
+        frame: FrameRecord,
+        pending: list[str],
+        enhancements: dict[str, str | dict[str, Any]],
+    ) -> FrameRecord:
+        """Enhance fields one call at a time (fallback for the batched path)."""
+        for field_name in pending:
+            config = enhancements[field_name]
 
             # Parse enhancement config
             prompt = config if isinstance(config, str) else config.get("prompt", "")
@@ -393,10 +931,184 @@ Return up to {max_relationships} relationships."""
 
             except Exception as e:
                 # Log error but continue with other fields
-                print(f"Failed to enhance {field_name}: {e}")
+                logger.warning("Failed to enhance %s: %s", field_name, e)
 
         return frame
 
+    async def aenhance_document(
+        self,
+        frame: FrameRecord,
+        enhancements: dict[str, str | dict[str, Any]],
+        skip_existing: bool = True,
+    ) -> FrameRecord:
+        """Async variant of :meth:`enhance_document`.
+
+        All requested fields are enhanced concurrently with
+        :func:`asyncio.gather`, bounded by ``max_concurrency``, so total
+        wall-clock time approaches the slowest single call rather than the
+        sum of all calls.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def enhance_one(field_name: str, config: str | dict[str, Any]) -> Any:
+            async with semaphore:
+                if field_name == "context" and isinstance(config, str):
+                    return await self.aenhance_context(
+                        frame.text_content or "", purpose=config
+                    )
+                if field_name == "tags" and isinstance(config, str):
+                    return await self.aenhance_tags(frame.text_content or "")
+                prompt = config if isinstance(config, str) else config.get("prompt", "")
+                return await self.aenhance_field(
+                    content=frame.text_content or "",
+                    field_name=field_name,
+                    prompt=prompt,
+                    current_metadata=self._get_frame_metadata(frame),
+                )
+
+        pending = [
+            field_name
+            for field_name in enhancements
+            if not (skip_existing and self._field_has_value(frame, field_name))
+        ]
+        values = await asyncio.gather(
+            *(enhance_one(field, enhancements[field]) for field in pending),
+            return_exceptions=True,
+        )
+
+        # Apply updates serially once all calls have settled
+        for field_name, value in zip(pending, values):
+            if isinstance(value, Exception):
+                logger.warning("Failed to enhance %s: %s", field_name, value)
+                continue
+            self._update_frame_field(frame, field_name, value)
+
+        return frame
+
+    def enhance_rows_batch(
+        self, contents: list[str], field_name: str, prompt: str
+    ) -> list[Any]:
+        """Enhance the same field for several documents with one LLM call.
+
+        Marshaling multiple rows into a single prompt amortizes the network
+        round-trip and prefill cost across the batch, which also stretches
+        provider requests-per-minute limits further than plain
+        parallelization can.
+
+        Args:
+            contents: Document contents, one per row
+            field_name: Schema field to enhance
+            prompt: Enhancement instruction applied to every document
+
+        Returns:
+            One extracted field value per document, in input order
+
+        Raises:
+            ValueError: If the field is unknown or the response row count
+                does not match the input row count
+        """
+        if field_name not in self.FIELD_MODELS:
+            raise ValueError(
+                f"Unknown field: {field_name}. Valid fields: {list(self.FIELD_MODELS.keys())}"
+            )
+
+        enhance_rows = self._generator_for_model(_rows_response_model(field_name))
+        response = self._invoke(
+            enhance_rows, self._rows_messages(contents, field_name, prompt)
+        )
+
+        return self._extract_rows(field_name, response, len(contents))
+
+    def _rows_messages(
+        self, contents: list[str], field_name: str, prompt: str
+    ) -> list[BaseMessageParam]:
+        """Build the message list for a row-marshaled call."""
+        documents = "\n---\n".join(
+            f"Document {i + 1}:\n{content}" for i, content in enumerate(contents)
+        )
+        full_prompt = f"""{prompt}
+
+Apply the instruction above to each of the {len(contents)} documents below and return one result per document, in order.
+
+{documents}"""
+
+        return [
+            self._system_message(_field_system_prompt(field_name)),
+            {"role": "user", "content": full_prompt},
+        ]
+
+    def _extract_rows(
+        self, field_name: str, response: Any, expected: int
+    ) -> list[Any]:
+        """Extract per-row values from a row-marshaled response."""
+        if len(response.results) != expected:
+            raise ValueError(
+                f"Expected {expected} results, got {len(response.results)}"
+            )
+
+        return [
+            self._extract_field_value(field_name, row) for row in response.results
+        ]
+
+    async def _aenhance_window(
+        self,
+        window: list[FrameRecord],
+        enhancements: dict[str, str | dict[str, Any]],
+        skip_existing: bool,
+    ) -> tuple[list[dict[str, Any]], list[EnhancementResult]]:
+        """Enhance a window of frames, marshaling rows per field when possible.
+
+        Returns per-frame update dicts (aligned with *window*) plus the
+        EnhancementResult records for every attempted field.
+        """
+        updates: list[dict[str, Any]] = [{} for _ in window]
+        results: list[EnhancementResult] = []
+
+        for field_name, config in enhancements.items():
+            prompt = config if isinstance(config, str) else config.get("prompt", "")
+            eligible = [
+                i
+                for i, frame in enumerate(window)
+                if not (skip_existing and self._field_has_value(frame, field_name))
+            ]
+            if not eligible:
+                continue
+
+            if len(eligible) > 1:
+                try:
+                    contents = [window[i].text_content or "" for i in eligible]
+                    response = await self._ainvoke(
+                        self._generator_for_model(
+                            _rows_response_model(field_name), is_async=True
+                        ),
+                        self._rows_messages(contents, field_name, prompt),
+                    )
+                    values = self._extract_rows(field_name, response, len(contents))
+                    for i, value in zip(eligible, values):
+                        updates[i][field_name] = value
+                        results.append(EnhancementResult(field_name, value, True))
+                    continue
+                except Exception as e:
+                    logger.warning(
+                        "Row-marshaled enhancement failed, retrying per row: %s", e
+                    )
+
+            for i in eligible:
+                frame = window[i]
+                try:
+                    value = await self.aenhance_field(
+                        content=frame.text_content or "",
+                        field_name=field_name,
+                        prompt=prompt,
+                        current_metadata=self._get_frame_metadata(frame),
+                    )
+                    updates[i][field_name] = value
+                    results.append(EnhancementResult(field_name, value, True))
+                except Exception as e:
+                    results.append(EnhancementResult(field_name, None, False, str(e)))
+
+        return updates, results
+
     def enhance_dataset(
         self,
         dataset: FrameDataset,
@@ -419,26 +1131,49 @@ Return up to {max_relationships} relationships."""
         Returns:
             List of enhancement results
         """
-        from contextframe.frame import FrameRecord
+        coro = self.aenhance_dataset(
+            dataset,
+            enhancements,
+            filter=filter,
+            batch_size=batch_size,
+            skip_existing=skip_existing,
+            show_progress=show_progress,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
 
-        # Get non-blob columns for scanning
-        non_blob_columns = dataset._non_blob_columns
-        if non_blob_columns is None:
-            # If no blob columns, scan all columns
-            scanner = dataset._dataset.scanner(batch_size=batch_size)
-        else:
-            # Exclude blob columns from scan
-            scanner = dataset._dataset.scanner(
-                columns=non_blob_columns, batch_size=batch_size
-            )
+        # Called from an async context (e.g. Jupyter), where asyncio.run
+        # would raise; run the pipeline on its own loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
 
+    async def aenhance_dataset(
+        self,
+        dataset: FrameDataset,
+        enhancements: dict[str, str | dict[str, Any]],
+        filter: str | None = None,
+        batch_size: int = 10,
+        skip_existing: bool = True,
+        show_progress: bool = True,
+    ) -> list[EnhancementResult]:
+        """Async variant of :meth:`enhance_dataset`."""
+        # Fold the skip-existing predicate into the Lance filter where the
+        # schema allows, so already-enhanced rows (and whole fragments of
+        # them) are pruned during the scan instead of after it
+        if skip_existing:
+            skip_predicate = self._skip_existing_predicate(dataset, tuple(enhancements))
+            if skip_predicate:
+                filter = f"({filter}) AND ({skip_predicate})" if filter else skip_predicate
+
+        # Scan non-blob columns only; blob columns are excluded when present
+        scan_kwargs: dict[str, Any] = {"batch_size": batch_size}
+        non_blob_columns = dataset._non_blob_columns
+        if non_blob_columns is not None:
+            scan_kwargs["columns"] = non_blob_columns
         if filter:
-            scanner = scanner.filter(filter)
-
-        # Process in batches
-        results = []
-        total_processed = 0
-        rows_updated = 0
+            scan_kwargs["filter"] = filter
 
         # Get total count for progress bar
         if show_progress:
@@ -457,78 +1192,419 @@ Return up to {max_relationships} relationships."""
         else:
             pbar = None
 
-        for batch in scanner.to_batches():
-            # Process each record in the batch
-            for i in range(len(batch)):
-                # Get single row as a table
-                row_table = batch.slice(i, 1)
-                frame = FrameRecord.from_arrow(
-                    row_table, dataset_path=Path(dataset._dataset.uri)
-                )
-
-                # Track updates for this record
-                updates = {}
-
-                # Process each enhancement
-                for field_name, config in enhancements.items():
-                    # Skip if field already has value and skip_existing is True
-                    if skip_existing and self._field_has_value(frame, field_name):
-                        continue
+        results, total_processed, rows_updated = await self._arun_dataset_pipeline(
+            dataset, scan_kwargs, enhancements, skip_existing, pbar
+        )
 
-                    # Parse enhancement config
-                    prompt = (
-                        config if isinstance(config, str) else config.get("prompt", "")
-                    )
+        if pbar is not None:
+            pbar.close()
 
-                    try:
-                        # Enhance the specific field
-                        value = self.enhance_field(
-                            content=frame.text_content or "",
-                            field_name=field_name,
-                            prompt=prompt,
-                            current_metadata=self._get_frame_metadata(frame),
-                        )
+        # Log summary
+        if show_progress:
+            print(f"Enhanced {rows_updated} records out of {total_processed} processed")
 
-                        # Add to updates
-                        updates[field_name] = value
+        return results
 
-                        # Track result
-                        results.append(EnhancementResult(field_name, value, True))
+    async def _arun_dataset_pipeline(
+        self,
+        dataset: FrameDataset,
+        scan_kwargs: dict[str, Any],
+        enhancements: dict[str, str | dict[str, Any]],
+        skip_existing: bool,
+        pbar: Any = None,
+    ) -> tuple[list[EnhancementResult], int, int]:
+        """Stream scan batches through a bounded producer/consumer pipeline.
+
+        One producer task reads Arrow batches off the scanner in a worker
+        thread and feeds row-marshal windows into a bounded queue;
+        ``max_concurrency`` worker tasks pull windows and run the LLM calls,
+        so Lance I/O, record construction, and network I/O overlap instead
+        of serializing on one in-flight request.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(2, 2 * self.max_concurrency))
+        worker_count = max(1, self.max_concurrency)
+        results: list[EnhancementResult] = []
+        updated_frames: list[FrameRecord] = []
+        touched_fields: set[str] = set()
+        total_processed = 0
+        progress_pending = 0
+        dataset_path = Path(dataset._dataset.uri)
+        # One clock read and ISO formatting for the whole run; the date
+        # granularity of updated_at makes a per-row call pure overhead
+        today_iso = datetime.date.today().isoformat()
+
+        def note_progress(rows: int) -> None:
+            # Batch tqdm refreshes; per-row updates contend on its lock
+            nonlocal progress_pending
+            if pbar is None:
+                return
+            progress_pending += rows
+            if progress_pending >= _PROGRESS_EVERY:
+                pbar.update(progress_pending)
+                progress_pending = 0
+
+        async def produce() -> None:
+            nonlocal total_processed
+            iterator = self._scan_batches(dataset, scan_kwargs)
+            while True:
+                batch = await asyncio.to_thread(next, iterator, None)
+                if batch is None:
+                    break
+                total_processed += batch.num_rows
+
+                # Drop already-enhanced rows at the Arrow level before paying
+                # for Python-side record construction
+                row_indices: Any = range(batch.num_rows)
+                if skip_existing:
+                    pending = self._pending_row_indices(batch, tuple(enhancements))
+                    if pending is not None:
+                        if len(pending) < batch.num_rows:
+                            note_progress(batch.num_rows - len(pending))
+                        if not pending:
+                            continue
+                        row_indices = pending
+
+                # Decode the whole batch once, then marshal rows into windows
+                # so each field needs one LLM call per window, not per row
+                batch_dict = await asyncio.to_thread(batch.to_pydict)
+                frames = [
+                    FrameRecord.from_row_dict(
+                        {col: values[i] for col, values in batch_dict.items()},
+                        dataset_path=dataset_path,
+                    )
+                    for i in row_indices
+                ]
+                for start in range(0, len(frames), self.row_marshal_size):
+                    await queue.put(frames[start : start + self.row_marshal_size])
+            # One sentinel per worker shuts the pipeline down
+            for _ in range(worker_count):
+                await queue.put(None)
+
+        async def work() -> None:
+            while True:
+                window = await queue.get()
+                if window is None:
+                    return
+                window_updates, window_results = await self._aenhance_window(
+                    window, enhancements, skip_existing
+                )
+                results.extend(window_results)
 
-                    except Exception as e:
-                        # Log error but continue
-                        results.append(
-                            EnhancementResult(field_name, None, False, str(e))
-                        )
+                for frame, updates in zip(window, window_updates):
+                    if not updates:
+                        continue
 
-                # If we have updates, update the record in the dataset
-                if updates:
                     # Update the frame's metadata with new values
                     for field_name, value in updates.items():
                         self._update_frame_field(frame, field_name, value)
+                    touched_fields.update(updates)
 
                     # Update the updated_at timestamp
-                    frame.metadata["updated_at"] = datetime.date.today().isoformat()
+                    frame.metadata["updated_at"] = today_iso
+                    updated_frames.append(frame)
 
-                    # Use the dataset's update_record method which does delete + add
-                    try:
-                        dataset.update_record(frame)
-                        rows_updated += 1
-                    except Exception as e:
-                        print(f"Failed to update record {frame.uuid}: {e}")
-                        # Continue with other records
+                note_progress(len(window))
 
-            # Update progress
-            if pbar is not None:
-                pbar.update(len(batch))
-            total_processed += len(batch)
+        await asyncio.gather(produce(), *(work() for _ in range(worker_count)))
 
-        if pbar is not None:
-            pbar.close()
+        if pbar is not None and progress_pending:
+            pbar.update(progress_pending)
 
-        # Log summary
-        if show_progress:
-            print(f"Enhanced {rows_updated} records out of {total_processed} processed")
+        # Persist once after the gather; concurrent Lance commits would race
+        rows_updated = 0
+        if updated_frames:
+            rows_updated = await asyncio.to_thread(
+                self._flush_updates, dataset, updated_frames, sorted(touched_fields)
+            )
+
+        return results, total_processed, rows_updated
+
+    def _scan_batches(self, dataset: FrameDataset, scan_kwargs: dict[str, Any]) -> Any:
+        """Yield scan batches, decoding fragments in parallel when possible.
+
+        A plain ``scanner.to_batches()`` hands out batches from one thread,
+        so on multi-fragment datasets the Arrow decode can become the
+        bottleneck once LLM concurrency is high. Up to four fragments are
+        read concurrently in a thread pool; filter and column pushdown
+        apply per fragment exactly as on the dataset scanner. Batch order
+        follows fragment order, though the pipeline does not depend on it.
+        """
+        try:
+            fragments = dataset._dataset.get_fragments()
+        except Exception:
+            fragments = []
+        if len(fragments) <= 1:
+            yield from dataset._dataset.scanner(**scan_kwargs).to_batches()
+            return
+
+        workers = min(4, len(fragments))
+
+        def read(fragment: Any) -> list:
+            return list(fragment.to_batches(**scan_kwargs))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Submit one window of fragments at a time so decoded batches
+            # buffer for at most `workers` fragments ahead of consumption
+            for start in range(0, len(fragments), workers):
+                futures = [
+                    executor.submit(read, fragment)
+                    for fragment in fragments[start : start + workers]
+                ]
+                for future in futures:
+                    yield from future.result()
+
+    def _flush_updates(
+        self,
+        dataset: FrameDataset,
+        frames: list[FrameRecord],
+        fields: list[str],
+    ) -> int:
+        """Persist enhanced frames, preferring one merge-insert delta write.
+
+        Only the enhanced columns (plus ``uuid`` and ``updated_at``) are
+        shipped to Lance, so matched rows have just the touched columns
+        rewritten instead of paying a full delete + add round-trip per
+        record. Falls back to per-record update_record if the delta write
+        is rejected.
+        """
+        columns = ["uuid", *(f for f in fields if f != "uuid"), "updated_at"]
+        try:
+            delta = pa.concat_tables(
+                [frame.to_table().select(columns) for frame in frames]
+            )
+            (
+                dataset._dataset.merge_insert("uuid")
+                .when_matched_update_all()
+                .execute(delta)
+            )
+            return len(frames)
+        except Exception as e:
+            logger.warning(
+                "Merge-insert update failed, falling back to per-record updates: %s", e
+            )
+
+        rows_updated = 0
+        for frame in frames:
+            try:
+                dataset.update_record(frame)
+                rows_updated += 1
+            except Exception as e:
+                logger.warning("Failed to update record %s: %s", frame.uuid, e)
+                # Continue with other records
+        return rows_updated
+
+    @staticmethod
+    def _skip_existing_predicate(
+        dataset: FrameDataset, field_names: tuple[str, ...]
+    ) -> str | None:
+        """SQL predicate matching rows that still need any requested field.
+
+        Only string-typed top-level columns can be expressed safely (NULL or
+        empty string); if any requested field falls outside that, no
+        predicate is returned and the Arrow-level mask plus the per-frame
+        check handle skipping as before. A row must be scanned when any one
+        field needs enhancement, so a partial OR over a subset of fields
+        would wrongly prune rows.
+        """
+        schema = dataset._dataset.schema
+        clauses = []
+        for field_name in field_names:
+            if schema.get_field_index(field_name) == -1:
+                return None
+            field_type = schema.field(field_name).type
+            if not (
+                pa.types.is_string(field_type) or pa.types.is_large_string(field_type)
+            ):
+                return None
+            clauses.append(f"({field_name} IS NULL OR {field_name} = '')")
+        return " OR ".join(clauses) if clauses else None
+
+    @staticmethod
+    def _pending_row_indices(batch: Any, field_names: tuple[str, ...]) -> list | None:
+        """Arrow-level skip mask: indices of rows missing any requested field.
+
+        Computes the emptiness predicate with Arrow compute kernels so
+        already-enhanced rows are skipped before any Python-level record
+        construction. Returns None when a requested field cannot be checked
+        at this level (not a scanned column, or not a string/list type), in
+        which case every row is materialized and the per-frame
+        ``_field_has_value`` check decides as before.
+        """
+        mask = None
+        for field_name in field_names:
+            if field_name not in batch.schema.names:
+                return None
+            column = batch[field_name]
+            if pa.types.is_string(column.type) or pa.types.is_large_string(
+                column.type
+            ):
+                empty = pc.equal(pc.utf8_length(column), 0)
+            elif pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+                empty = pc.equal(pc.list_value_length(column), 0)
+            else:
+                return None
+            # Kleene OR so null columns (length kernels yield null) still
+            # register as needing enhancement
+            field_mask = pc.or_kleene(pc.is_null(column), empty)
+            mask = field_mask if mask is None else pc.or_kleene(mask, field_mask)
+
+        if mask is None:
+            return None
+        return pc.indices_nonzero(mask).to_pylist()
+
+    def enhance_dataset_batch(
+        self,
+        dataset: FrameDataset,
+        enhancements: dict[str, str | dict[str, Any]],
+        filter: str | None = None,
+        skip_existing: bool = True,
+        poll_interval: float = 30.0,
+        completion_window: str = "24h",
+    ) -> list[EnhancementResult]:
+        """Enhance a dataset offline through the OpenAI Batch API.
+
+        For cron-style enhancement jobs where latency does not matter, the
+        Batch API processes requests asynchronously at half the real-time
+        price. One request line is submitted per ``(record, field)`` pair,
+        the batch is polled until it reaches a terminal state, and the
+        results are written back to the dataset.
+
+        Args:
+            dataset: FrameDataset to enhance
+            enhancements: Map of field_name -> prompt or config
+            filter: Optional Lance SQL filter
+            skip_existing: Whether to skip already-enhanced fields
+            poll_interval: Seconds between batch status polls
+            completion_window: Batch API completion window (currently "24h")
+
+        Returns:
+            List of enhancement results
+
+        Raises:
+            ImportError: If the openai package is not installed
+            ValueError: If the provider is not "openai"
+            RuntimeError: If the batch job does not complete
+        """
+        if self.provider != "openai":
+            raise ValueError(
+                f"Batch enhancement requires provider='openai', got {self.provider!r}"
+            )
+        try:
+            from openai import OpenAI
+        except ImportError as e:
+            raise ImportError(
+                "Batch enhancement requires the openai package. "
+                "Install with: pip install 'contextframe[enhance]'"
+            ) from e
+
+        import io
+        import json
+        import time
+
+        client = OpenAI(**{k: v for k, v in self.kwargs.items() if k == "api_key"})
+
+        # Collect one request line per (record, field) pair
+        frames: dict[str, FrameRecord] = {}
+        lines: list[bytes] = []
+        scanner = dataset._dataset.scanner(
+            columns=dataset._non_blob_columns, filter=filter
+        )
+        dataset_path = Path(dataset._dataset.uri)
+        for batch in scanner.to_batches():
+            batch_dict = batch.to_pydict()
+            for i in range(batch.num_rows):
+                frame = FrameRecord.from_row_dict(
+                    {col: values[i] for col, values in batch_dict.items()},
+                    dataset_path=dataset_path,
+                )
+                frames[frame.uuid] = frame
+                for field_name, config in enhancements.items():
+                    if skip_existing and self._field_has_value(frame, field_name):
+                        continue
+                    prompt = (
+                        config if isinstance(config, str) else config.get("prompt", "")
+                    )
+                    body = {
+                        "model": self.model,
+                        "messages": self._field_messages(
+                            frame.text_content or "",
+                            field_name,
+                            prompt,
+                            self._get_frame_metadata(frame),
+                        ),
+                        "response_format": {
+                            "type": "json_schema",
+                            "json_schema": {
+                                "name": field_name,
+                                "schema": self._SCHEMA_CACHE[field_name],
+                            },
+                        },
+                    }
+                    lines.append(
+                        json.dumps(
+                            {
+                                "custom_id": f"{frame.uuid}:{field_name}",
+                                "method": "POST",
+                                "url": "/v1/chat/completions",
+                                "body": body,
+                            }
+                        ).encode()
+                    )
+
+        results: list[EnhancementResult] = []
+        if not lines:
+            return results
+
+        # Upload the JSONL payload and create the batch job
+        input_file = client.files.create(
+            file=("enhancements.jsonl", io.BytesIO(b"\n".join(lines))),
+            purpose="batch",
+        )
+        job = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window,
+        )
+
+        while job.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            job = client.batches.retrieve(job.id)
+
+        if job.status != "completed" or not job.output_file_id:
+            raise RuntimeError(f"Batch enhancement job ended with status {job.status}")
+
+        # Dispatch results back onto the frames, then persist per record
+        updates_by_uuid: dict[str, dict[str, Any]] = {}
+        output = client.files.content(job.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            uuid, _, field_name = entry["custom_id"].rpartition(":")
+            error = entry.get("error")
+            if error:
+                results.append(EnhancementResult(field_name, None, False, str(error)))
+                continue
+            try:
+                content = entry["response"]["body"]["choices"][0]["message"]["content"]
+                response = self.FIELD_MODELS[field_name].model_validate_json(content)
+                value = self._extract_field_value(field_name, response)
+            except Exception as e:
+                results.append(EnhancementResult(field_name, None, False, str(e)))
+                continue
+            updates_by_uuid.setdefault(uuid, {})[field_name] = value
+            results.append(EnhancementResult(field_name, value, True))
+
+        today_iso = datetime.date.today().isoformat()
+        for uuid, updates in updates_by_uuid.items():
+            frame = frames[uuid]
+            for field_name, value in updates.items():
+                self._update_frame_field(frame, field_name, value)
+            frame.metadata["updated_at"] = today_iso
+            try:
+                dataset.update_record(frame)
+            except Exception as e:
+                logger.warning("Failed to update record %s: %s", frame.uuid, e)
 
         return results
 
@@ -543,15 +1619,7 @@ Return up to {max_relationships} relationships."""
 
         This method matches the original API for compatibility.
         """
-        candidates = [
-            {
-                "title": doc.title,
-                "summary": (doc.text_content or "")[:200] + "..."
-                if doc.text_content
-                else "",
-            }
-            for doc in candidate_docs
-        ]
+        candidates = [self._candidate_payload(doc) for doc in candidate_docs]
 
         relationships = self.enhance_relationships(
             source_content=(source_doc.text_content or "")[:500],
@@ -570,6 +1638,45 @@ Return up to {max_relationships} relationships."""
 
         return relationships
 
+    def _candidate_payload(self, doc: FrameRecord) -> dict[str, str]:
+        """Build (and memoize) the title/summary payload for a candidate doc.
+
+        Scanning a dataset for relationships presents the same candidates
+        against many source documents; summarizing each candidate once keeps
+        the per-call work to a dict lookup and keeps prompts short.
+        """
+        key = (doc.uuid, len(doc.text_content or ""))
+        payload = self._candidate_payloads.get(key)
+        if payload is None:
+            if len(self._candidate_payloads) >= 4096:
+                self._candidate_payloads.clear()
+            payload = {
+                "title": doc.title,
+                "summary": self._extract_summary(doc.text_content),
+            }
+            self._candidate_payloads[key] = payload
+        return payload
+
+    @staticmethod
+    def _extract_summary(content: str | None, limit: int = 200) -> str:
+        """Cheap extractive summary: first and last sentence, bounded by limit.
+
+        Preserves topical signal from both ends of the document with fewer
+        prompt tokens than a flat prefix truncation; falls back to the prefix
+        when sentence splitting does not help.
+        """
+        if not content:
+            return ""
+        if len(content) <= limit:
+            return content
+        sentences = _SENTENCE_RE.split(content.strip())
+        summary = sentences[0]
+        if len(sentences) > 1:
+            summary = f"{sentences[0]} ... {sentences[-1]}"
+        if len(summary) > limit:
+            summary = content[:limit] + "..."
+        return summary
+
     # Helper methods
 
     def _build_prompt(
@@ -586,12 +1693,11 @@ Return up to {max_relationships} relationships."""
             "uri": metadata.get("uri", "") if metadata else "",
         }
 
-        # Simple template substitution
-        filled_prompt = prompt
-        for key, value in variables.items():
-            filled_prompt = filled_prompt.replace(f"{{{key}}}", str(value))
-
-        return filled_prompt
+        # Single-pass template substitution; unknown {placeholders} pass
+        # through untouched, matching the old replace-loop behavior
+        return _TEMPLATE_VAR_RE.sub(
+            lambda match: str(variables.get(match.group(1), match.group(0))), prompt
+        )
 
     def _field_has_value(self, frame: FrameRecord, field_name: str) -> bool:
         """Check if a field already has a value."""
@@ -630,22 +1736,9 @@ Return up to {max_relationships} relationships."""
         self, frame: FrameRecord, field_name: str, value: Any
     ) -> None:
         """Update a field on the frame."""
-        if field_name == "text_content":
-            frame.text_content = value
-        elif field_name == "vector":
-            frame.vector = value
-        elif field_name in ["raw_data", "raw_data_type"]:
-            setattr(frame, field_name, value)
-        elif field_name == "custom_metadata" and isinstance(value, dict):
-            # Convert all values to strings as required by schema
-            string_metadata = {k: str(v) for k, v in value.items()}
-            # Merge with existing custom metadata
-            existing = frame.metadata.get("custom_metadata", {})
-            if existing:
-                existing.update(string_metadata)
-                frame.metadata["custom_metadata"] = existing
-            else:
-                frame.metadata["custom_metadata"] = string_metadata
+        setter = _FIELD_SETTERS.get(field_name)
+        if setter is not None:
+            setter(frame, value)
         else:
             # Most fields go in metadata
             frame.metadata[field_name] = value
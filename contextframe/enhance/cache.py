@@ -0,0 +1,117 @@
+"""Response caching for LLM-powered enhancement calls."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+# Bump when prompt construction changes incompatibly so stale cached
+# responses are not replayed against new prompts
+PROMPT_VERSION = "1"
+
+
+class LLMCache:
+    """Cache for structured LLM responses keyed by request content.
+
+    A cache hit elides the entire HTTP round-trip and model inference, so
+    reruns of :meth:`ContextEnhancer.enhance_dataset` over unchanged
+    documents (and identical chunks repeated across documents) cost
+    nothing. Entries live in an in-memory LRU and, when *directory* is
+    given, are mirrored to disk as one JSON file per key so they survive
+    process restarts.
+
+    Keys are SHA-256 digests over the model, provider, prompt version,
+    field name, document content, and prompt, so any input change misses
+    cleanly.
+
+    Example:
+        >>> cache = LLMCache(directory="~/.contextframe/llm_cache")
+        >>> enhancer = ContextEnhancer(cache=cache)
+        >>> enhancer.enhance_dataset(dataset, {"context": "Summarize"})
+        >>> cache.stats
+        {'hits': 0, 'misses': 1, 'size': 1}
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 7 * 86400.0,
+        directory: str | Path | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of in-memory entries before LRU eviction
+            ttl: Seconds a cached response stays valid
+            directory: Optional directory for a persistent on-disk mirror
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.directory = Path(directory).expanduser() if directory else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a deterministic cache key from request components."""
+        payload = {"prompt_version": PROMPT_VERSION, **parts}
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response JSON for *key*, or None on a miss."""
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if now < expires:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        if self.directory is not None:
+            path = self.directory / f"{key}.json"
+            try:
+                if path.exists() and now - path.stat().st_mtime < self.ttl:
+                    value = path.read_text()
+                    self._remember(key, value)
+                    self.hits += 1
+                    return value
+            except OSError:
+                pass
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response JSON under *key*."""
+        self._remember(key, value)
+        if self.directory is not None:
+            try:
+                (self.directory / f"{key}.json").write_text(value)
+            except OSError:
+                pass
+
+    def _remember(self, key: str, value: str) -> None:
+        self._entries[key] = (time.time() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters plus the current in-memory entry count."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
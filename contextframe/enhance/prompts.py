@@ -4,6 +4,12 @@ These templates provide starting points that users and agents can customize
 for their specific enrichment needs.
 """
 
+import re
+import sys
+from collections.abc import Mapping
+from string import Template
+from types import MappingProxyType
+
 # Context generation prompts
 CONTEXT_PROMPTS = {
     "technical_summary": """
@@ -282,9 +288,92 @@ Return as JSON with relationship details.
 }
 
 
+# Intern template names and bodies so every consumer holds the same str
+# object per template: repeat dict lookups short-circuit on pointer
+# equality, and fork-based worker pools keep one copy in pages already
+# shared copy-on-write with the parent instead of re-allocating per child
+for _prompts in (
+    CONTEXT_PROMPTS,
+    TAG_PROMPTS,
+    METADATA_PROMPTS,
+    RELATIONSHIP_PROMPTS,
+    PURPOSE_PROMPTS,
+    BATCH_PROMPTS,
+):
+    for _name, _raw in list(_prompts.items()):
+        _prompts[sys.intern(_name)] = sys.intern(_raw)
+del _prompts, _name, _raw
+
+
+# Category dispatch built once at module scope; get_prompt_template used to
+# rebuild this dict on every call
+_CATEGORIES = {
+    "context": CONTEXT_PROMPTS,
+    "tags": TAG_PROMPTS,
+    "metadata": METADATA_PROMPTS,
+    "relationships": RELATIONSHIP_PROMPTS,
+    "purpose": PURPOSE_PROMPTS,
+    "batch": BATCH_PROMPTS,
+}
+
+# Immutable listing shared across list_available_prompts calls
+_AVAILABLE = MappingProxyType(
+    {category: tuple(prompts.keys()) for category, prompts in _CATEGORIES.items()}
+)
+
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+def _compile(raw: str) -> Template:
+    """Convert a ``{placeholder}`` template into a reusable string.Template."""
+    return Template(_PLACEHOLDER_RE.sub(r"${\1}", raw))
+
+
+# Templates compiled once at import; substitution is then a single regex
+# pass instead of str.format re-parsing the template on every call
+_COMPILED: dict[str, dict[str, Template]] = {
+    category: {name: _compile(raw) for name, raw in prompts.items()}
+    for category, prompts in _CATEGORIES.items()
+}
+
+
+def render_prompt(category: str, template_name: str, **kwargs: str) -> str:
+    """Render a prompt template with the given variables.
+
+    Prefer this over ``get_prompt_template(...).format(...)`` in hot loops:
+    the templates are precompiled at import, so rendering costs one
+    substitution pass rather than re-parsing the template per call.
+    Unknown placeholders are left in place for downstream substitution.
+
+    Args:
+        category: Category of prompt (context, tags, metadata, etc.)
+        template_name: Name of the template
+        **kwargs: Template variable values
+
+    Returns:
+        Rendered prompt string
+
+    Raises:
+        KeyError: If category or template not found
+    """
+    try:
+        templates = _COMPILED[category]
+    except KeyError:
+        raise KeyError(f"Unknown category: {category}")
+    try:
+        template = templates[template_name]
+    except KeyError:
+        raise KeyError(f"Unknown template '{template_name}' in category '{category}'")
+    return template.safe_substitute(kwargs)
+
+
 def get_prompt_template(category: str, template_name: str) -> str:
     """Get a specific prompt template.
 
+    For rendering in hot loops, prefer :func:`render_prompt`, which uses a
+    template precompiled at import instead of per-call format parsing.
+
     Args:
         category: Category of prompt (context, tags, metadata, etc.)
         template_name: Name of the template
@@ -295,35 +384,24 @@ def get_prompt_template(category: str, template_name: str) -> str:
     Raises:
         KeyError: If category or template not found
     """
-    categories = {
-        "context": CONTEXT_PROMPTS,
-        "tags": TAG_PROMPTS,
-        "metadata": METADATA_PROMPTS,
-        "relationships": RELATIONSHIP_PROMPTS,
-        "purpose": PURPOSE_PROMPTS,
-        "batch": BATCH_PROMPTS,
-    }
-
-    if category not in categories:
+    try:
+        prompts = _CATEGORIES[category]
+    except KeyError:
         raise KeyError(f"Unknown category: {category}")
 
-    prompts = categories[category]
-    if template_name not in prompts:
+    try:
+        return prompts[template_name]
+    except KeyError:
         raise KeyError(f"Unknown template '{template_name}' in category '{category}'")
 
-    return prompts[template_name]
 
+def list_available_prompts() -> Mapping[str, tuple[str, ...]]:
+    """List all available prompt templates by category.
 
-def list_available_prompts() -> dict[str, list[str]]:
-    """List all available prompt templates by category."""
-    return {
-        "context": list(CONTEXT_PROMPTS.keys()),
-        "tags": list(TAG_PROMPTS.keys()),
-        "metadata": list(METADATA_PROMPTS.keys()),
-        "relationships": list(RELATIONSHIP_PROMPTS.keys()),
-        "purpose": list(PURPOSE_PROMPTS.keys()),
-        "batch": list(BATCH_PROMPTS.keys()),
-    }
+    Returns a read-only mapping computed once at import; callers that need
+    a mutable copy should use ``dict(list_available_prompts())``.
+    """
+    return _AVAILABLE
 
 
 # Convenience function for custom prompts
@@ -341,18 +419,19 @@ def build_enhancement_prompt(
     Returns:
         Formatted prompt string
     """
-    prompt = f"{task}\n\n"
+    # Collect parts and join once; += in a loop reallocates the whole
+    # string per field
+    parts = [task, "\n\n"]
 
     if context:
-        prompt += f"Context: {context}\n\n"
+        parts += ("Context: ", context, "\n\n")
 
-    prompt += "Extract/generate the following:\n"
-    for field in fields:
-        prompt += f"- {field}\n"
+    parts.append("Extract/generate the following:\n")
+    parts.extend(f"- {field}\n" for field in fields)
 
     if examples:
-        prompt += f"\nExamples:\n{examples}\n"
+        parts += ("\nExamples:\n", examples, "\n")
 
-    prompt += "\nDocument: {content}\n\nOutput:"
+    parts.append("\nDocument: {content}\n\nOutput:")
 
-    return prompt
+    return "".join(parts)
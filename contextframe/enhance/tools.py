@@ -1,8 +1,13 @@
 """MCP-compatible tool definitions for document enhancement."""
 
+import json
+import logging
 from .base import ContextEnhancer, FrameRecord
+from .cache import LLMCache
 from typing import Any, Optional
 
+logger = logging.getLogger(__name__)
+
 # Tool definitions that MCP servers can expose
 ENHANCEMENT_TOOLS = {
     "enhance_context": {
@@ -109,6 +114,85 @@ ENHANCEMENT_TOOLS = {
 }
 
 
+# Invariant instruction blocks, hoisted so every rendered prompt starts
+# with the same bytes: provider-side prompt caches hash prefixes, so the
+# dynamic parameters must trail the boilerplate, not lead it
+_ENHANCE_CONTEXT_PREFIX = """\
+Analyze this document and write a brief context description (2-3 sentences)
+explaining its relevance for the purpose given in PARAMS. If PARAMS includes
+a current context, refine it rather than starting over.
+"""
+
+_EXTRACT_METADATA_PREFIX = """\
+Extract the metadata described by the schema in PARAMS from the document and
+return it in the format given in PARAMS.
+"""
+
+_GENERATE_TAGS_PREFIX = """\
+Generate tags for this document, honoring the maximum count and focus areas
+given in PARAMS. Return tags as a comma-separated list.
+"""
+
+_IMPROVE_TITLE_PREFIX = """\
+Generate a title for this document in the style given in PARAMS, improving on
+any current title given there. The title should be clear and informative.
+"""
+
+_FIND_RELATIONSHIPS_PREFIX = """\
+Find relationships between the source document and the candidate documents
+listed below. Consider only the relationship types given in PARAMS.
+Only include clear relationships, not vague similarities.
+
+Return as JSON array with format:
+[
+    {
+        "target_title": "Title of related document",
+        "type": "relationship type",
+        "description": "Brief explanation"
+    }
+]
+"""
+
+_PURPOSE_METADATA_PREFIX = """\
+Extract metadata relevant to the purpose given in PARAMS.
+
+Consider:
+- Key concepts and entities
+- Relevance scores or ratings
+- Specific attributes for the use case
+
+Return as JSON.
+"""
+
+
+def _stable_prompt(
+    prefix: str,
+    params: dict[str, Any],
+    body: str = "",
+    cue: str = "",
+    document: bool = True,
+) -> str:
+    """Render a tool prompt as stable prefix, sorted params, then document.
+
+    The parameters are serialized with deterministic key order so two calls
+    with the same arguments render byte-identically regardless of how the
+    kwargs were assembled. With ``document=False`` the DOCUMENT section is
+    omitted for combined calls that append the content once themselves.
+    """
+    parts = [
+        prefix,
+        "\n---\nPARAMS: ",
+        json.dumps(params, sort_keys=True, default=str),
+        "\n",
+        body,
+    ]
+    if document:
+        parts.append("---\nDOCUMENT:\n{content}\n")
+    if cue:
+        parts += ("\n", cue, "\n")
+    return "".join(parts)
+
+
 class EnhancementTools:
     """MCP-compatible tool implementations for document enhancement.
 
@@ -116,9 +200,49 @@ class EnhancementTools:
     allowing AI agents to call enhancement functions as native tools.
     """
 
-    def __init__(self, enhancer: ContextEnhancer):
-        """Initialize with a ContextEnhancer instance."""
+    def __init__(self, enhancer: ContextEnhancer, cache: LLMCache | None = None):
+        """Initialize with a ContextEnhancer instance.
+
+        Args:
+            enhancer: ContextEnhancer to run LLM calls through
+            cache: Optional :class:`LLMCache` that deduplicates tool calls
+                by (tool, content, prompt) so agents re-enhancing identical
+                or near-duplicate documents reuse earlier results instead
+                of repeating the LLM round-trip
+        """
         self.enhancer = enhancer
+        self.cache = cache
+
+    def _call(
+        self, tool_name: str, content: str, field_name: str, prompt: str
+    ) -> Any:
+        """Run enhance_field through the tool-level dedupe cache."""
+        if self.cache is None:
+            return self.enhancer.enhance_field(
+                content=content, field_name=field_name, prompt=prompt
+            )
+
+        key = self.cache.make_key(
+            tool=tool_name,
+            model=self.enhancer.model,
+            provider=self.enhancer.provider,
+            field=field_name,
+            content=content,
+            prompt=prompt,
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        value = self.enhancer.enhance_field(
+            content=content, field_name=field_name, prompt=prompt
+        )
+        try:
+            self.cache.set(key, json.dumps(value))
+        except TypeError:
+            # Non-JSON-serializable value; skip caching rather than fail
+            pass
+        return value
 
     def enhance_context(
         self, content: str, purpose: str, current_context: str | None = None
@@ -127,22 +251,14 @@ class EnhancementTools:
 
         Tool: enhance_context
         """
-        prompt = f"""
-        Analyze this document and write a brief context description (2-3 sentences)
-        explaining its relevance for: {purpose}
-        
-        {"Current context: " + current_context if current_context else ""}
-        
-        Document content:
-        {{content}}
-        
-        Context description:
-        """
-
-        return self.enhancer.enhance_field(
-            content=content, field_name="context", prompt=prompt
+        prompt = _stable_prompt(
+            _ENHANCE_CONTEXT_PREFIX,
+            {"purpose": purpose, "current_context": current_context or ""},
+            cue="Context description:",
         )
 
+        return self._call("enhance_context", content, "context", prompt)
+
     def extract_metadata(
         self, content: str, schema: str, format: str = "json"
     ) -> dict[str, Any]:
@@ -150,20 +266,13 @@ class EnhancementTools:
 
         Tool: extract_metadata
         """
-        prompt = f"""
-        Extract the following metadata from the document:
-        {schema}
-        
-        Document content:
-        {{content}}
-        
-        Return as {"JSON" if format == "json" else format}:
-        """
-
-        return self.enhancer.enhance_field(
-            content=content, field_name="custom_metadata", prompt=prompt
+        prompt = _stable_prompt(
+            _EXTRACT_METADATA_PREFIX,
+            {"schema": schema, "format": "JSON" if format == "json" else format},
         )
 
+        return self._call("extract_metadata", content, "custom_metadata", prompt)
+
     def generate_tags(
         self,
         content: str,
@@ -174,20 +283,13 @@ class EnhancementTools:
 
         Tool: generate_tags
         """
-        prompt = f"""
-        Generate up to {max_tags} tags for this document.
-        Focus on: {tag_types}
-        
-        Document content:
-        {{content}}
-        
-        Return tags as a comma-separated list:
-        """
-
-        return self.enhancer.enhance_field(
-            content=content, field_name="tags", prompt=prompt
+        prompt = _stable_prompt(
+            _GENERATE_TAGS_PREFIX,
+            {"max_tags": max_tags, "tag_types": tag_types},
         )
 
+        return self._call("generate_tags", content, "tags", prompt)
+
     def improve_title(
         self, content: str, current_title: str | None = None, style: str = "descriptive"
     ) -> str:
@@ -195,22 +297,14 @@ class EnhancementTools:
 
         Tool: improve_title
         """
-        prompt = f"""
-        {"Current title: " + current_title if current_title else "No current title."}
-        
-        Generate a {style} title for this document.
-        The title should be clear and informative.
-        
-        Document content:
-        {{content}}
-        
-        New title:
-        """
-
-        return self.enhancer.enhance_field(
-            content=content, field_name="title", prompt=prompt
+        prompt = _stable_prompt(
+            _IMPROVE_TITLE_PREFIX,
+            {"style": style, "current_title": current_title or ""},
+            cue="New title:",
         )
 
+        return self._call("improve_title", content, "title", prompt)
+
     def find_relationships(
         self,
         source_content: str,
@@ -222,40 +316,28 @@ class EnhancementTools:
 
         Tool: find_relationships
         """
+        # Sort candidates so permuted input orders render identically and
+        # keep hitting the same provider-side prompt-cache entry
+        ordered = sorted(
+            candidate_summaries,
+            key=lambda c: (c.get("title", "Untitled"), c.get("summary", "")),
+        )
         candidates_text = "\n".join(
-            [
-                f"{i + 1}. {c.get('title', 'Untitled')}: {c.get('summary', '')}"
-                for i, c in enumerate(candidate_summaries)
-            ]
+            f"{i}. {c.get('title', 'Untitled')}: {c.get('summary', '')}"
+            for i, c in enumerate(ordered, 1)
         )
 
-        prompt = f"""
-        Find relationships between the source document and candidates.
-        Relationship types to consider: {relationship_types}
-        
-        Source document:
-        Title: {source_title}
-        Content: {{content}}
-        
-        Candidate documents:
-        {candidates_text}
-        
-        Return as JSON array with format:
-        [
-            {{
-                "target_title": "Title of related document",
-                "type": "relationship type",
-                "description": "Brief explanation"
-            }}
-        ]
-        
-        Only include clear relationships, not vague similarities.
-        """
-
-        return self.enhancer.enhance_field(
-            content=source_content, field_name="relationships", prompt=prompt
+        prompt = _stable_prompt(
+            _FIND_RELATIONSHIPS_PREFIX,
+            {
+                "relationship_types": relationship_types,
+                "source_title": source_title,
+            },
+            body=f"---\nCANDIDATES:\n{candidates_text}\n",
         )
 
+        return self._call("find_relationships", source_content, "relationships", prompt)
+
     def enhance_for_purpose(
         self, content: str, purpose: str, fields: list[str] | None = None
     ) -> dict[str, Any]:
@@ -266,6 +348,35 @@ class EnhancementTools:
         if fields is None:
             fields = ["context", "tags", "custom_metadata"]
 
+        # Collapse multi-field enhancement into one structured call so the
+        # document is sent and prefilled once instead of once per field;
+        # fall back to the per-field path if the combined call fails
+        prompts = {}
+        if "context" in fields:
+            prompts["context"] = _stable_prompt(
+                _ENHANCE_CONTEXT_PREFIX,
+                {"purpose": purpose, "current_context": ""},
+                document=False,
+            )
+        if "tags" in fields:
+            prompts["tags"] = _stable_prompt(
+                _GENERATE_TAGS_PREFIX,
+                {"max_tags": 5, "tag_types": f"tags relevant to {purpose}"},
+                document=False,
+            )
+        if "custom_metadata" in fields:
+            prompts["custom_metadata"] = _stable_prompt(
+                _PURPOSE_METADATA_PREFIX, {"purpose": purpose}, document=False
+            )
+
+        if len(prompts) > 1:
+            try:
+                return self.enhancer.enhance_fields(content, prompts)
+            except Exception as e:
+                logger.warning(
+                    "Combined enhancement failed, retrying per field: %s", e
+                )
+
         results = {}
 
         if "context" in fields:
@@ -275,21 +386,10 @@ class EnhancementTools:
             results["tags"] = self.generate_tags(content, f"tags relevant to {purpose}")
 
         if "custom_metadata" in fields:
-            prompt = f"""
-            Extract metadata relevant to: {purpose}
-            
-            Consider:
-            - Key concepts and entities
-            - Relevance scores or ratings
-            - Specific attributes for the use case
-            
-            Document: {{content}}
-            
-            Return as JSON:
-            """
-
-            results["custom_metadata"] = self.enhancer.enhance_field(
-                content=content, field_name="custom_metadata", prompt=prompt
+            prompt = _stable_prompt(_PURPOSE_METADATA_PREFIX, {"purpose": purpose})
+
+            results["custom_metadata"] = self._call(
+                "enhance_for_purpose", content, "custom_metadata", prompt
             )
 
         return results
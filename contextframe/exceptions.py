@@ -5,6 +5,20 @@ This module defines custom exceptions that are raised by various components
 of the ContextFrame package.
 """
 
+import re
+
+# Compiled once: bulk validation constructs many ValidationErrors, and a
+# single alternation scan classifies the message instead of a chain of
+# substring tests per error
+_CLASSIFIER_RE = re.compile(
+    r"is not of type 'string'"
+    r"|is not valid under any of the given schemas"
+    r"|Invalid relationship type"
+    r"|is a required property"
+    r"|does not match"
+)
+_NOT_STRING_RE = re.compile(r"(\w+) is not of type 'string'")
+
 
 class ContextFrameError(Exception):
     """Base exception for all ContextFrame-related errors."""
@@ -52,32 +66,38 @@ class ValidationError(ContextFrameError):
     
     def _enhance_error_message(self, field: str, error: str) -> str:
         """Enhance error message with helpful context."""
-        # Check for common validation patterns and add helpful hints
-        if "is not of type 'string'" in error and "custom_metadata" in field:
-            # Extract the value type from the error message
-            import re
-            match = re.search(r"(\w+) is not of type 'string'", error)
-            if match:
-                value = match.group(1)
-                return (f"{error}. All custom_metadata values must be strings. "
-                       f"Convert {value} to string or wait for v0.2.0 which will support native types.")
-        
-        elif "is not valid under any of the given schemas" in error and field == "relationships":
-            return (f"{error}. Relationships must include 'relationship_type' and at least one identifier "
-                   "(target_uuid, target_uri, target_path, or target_cid).")
-        
-        elif "Invalid relationship type" in error:
+        # Classify the message in one compiled-regex scan, then dispatch
+        match = _CLASSIFIER_RE.search(error)
+        if match is None:
+            return error
+
+        kind = match.group(0)
+        if kind == "is not of type 'string'":
+            if "custom_metadata" in field:
+                # Extract the value type from the error message
+                value_match = _NOT_STRING_RE.search(error)
+                if value_match:
+                    value = value_match.group(1)
+                    return (f"{error}. All custom_metadata values must be strings. "
+                           f"Convert {value} to string or wait for v0.2.0 which will support native types.")
+
+        elif kind == "is not valid under any of the given schemas":
+            if field == "relationships":
+                return (f"{error}. Relationships must include 'relationship_type' and at least one identifier "
+                       "(target_uuid, target_uri, target_path, or target_cid).")
+
+        elif kind == "Invalid relationship type":
             return (f"{error}. Valid types are: parent, child, related, reference, contains, member_of.")
-        
-        elif "is a required property" in error:
+
+        elif kind == "is a required property":
             return f"{error}. This field must be provided for the current validation profile."
-        
-        elif "does not match" in error and "uuid" in field:
+
+        elif "uuid" in field:
             return f"{error}. UUID must be in format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx"
-        
-        elif "does not match" in error and "date" in field:
+
+        elif "date" in field:
             return f"{error}. Date must be in ISO 8601 format (YYYY-MM-DD)."
-        
+
         # Return original error if no enhancement applies
         return error
 
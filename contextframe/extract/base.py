@@ -44,8 +44,9 @@ class ExtractionResult:
         Returns:
             Dictionary suitable for FrameRecord(**kwargs)
         """
-        # Extract title from metadata or generate from source
-        metadata = self.metadata.copy()
+        # Extract title from metadata or generate from source; dict()
+        # also flattens the layered ChainMap metadata chunking produces
+        metadata = dict(self.metadata)
         title = metadata.pop("title", None)
         if not title and self.source:
             title = Path(str(self.source)).stem
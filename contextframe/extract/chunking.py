@@ -1,9 +1,104 @@
 """Text chunking functionality using semantic-text-splitter."""
 
+import bisect
+import functools
+import re
 from .base import ExtractionResult
-from collections.abc import Callable
+from collections import ChainMap, defaultdict
+from collections.abc import Callable, Iterator
 from typing import List, Literal, Optional, Tuple, Union
 
+# Map common file extensions to tree-sitter language names
+_LANGUAGE_MAP = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "rs": "rust",
+    "go": "go",
+    "cpp": "cpp",
+    "c": "c",
+    "java": "java",
+    "rb": "ruby",
+    "php": "php",
+    "html": "html",
+    "css": "css",
+    "json": "json",
+    "yaml": "yaml",
+    "yml": "yaml",
+    "toml": "toml",
+    "xml": "xml",
+    "sh": "bash",
+    "bash": "bash",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_splitter(
+    splitter_type: str,
+    chunk_size: int,
+    tokenizer_model: str | None,
+    language: str | None,
+):
+    """Build (and memoize) a splitter for the given parameters.
+
+    Construction cost is dominated by tokenizer and tree-sitter setup, so
+    repeated calls with the same parameters share one instance; the
+    splitters themselves are stateless across ``chunks()`` calls.
+    """
+    try:
+        from semantic_text_splitter import CodeSplitter, MarkdownSplitter, TextSplitter
+    except ImportError:
+        raise ImportError(
+            "semantic-text-splitter is required for text splitting. "
+            "Install with: pip install semantic-text-splitter"
+        )
+
+    if splitter_type == "code":
+        if not language:
+            raise ValueError("Language parameter is required for code splitting")
+
+        try:
+            lang_module = __import__(f"tree_sitter_{language}")
+            return CodeSplitter(lang_module.language(), chunk_size)
+        except ImportError:
+            raise ImportError(
+                f"tree-sitter-{language} is required for {language} code splitting. "
+                f"Install with: pip install tree-sitter-{language}"
+            )
+
+    # Choose between TextSplitter and MarkdownSplitter
+    SplitterClass = MarkdownSplitter if splitter_type == "markdown" else TextSplitter
+
+    # Create splitter with appropriate sizing strategy
+    if tokenizer_model:
+        if tokenizer_model.startswith(("gpt", "claude", "text-embedding")):
+            # OpenAI-style models using tiktoken
+            return SplitterClass.from_tiktoken_model(tokenizer_model, chunk_size)
+
+        # HuggingFace tokenizer
+        try:
+            from tokenizers import Tokenizer
+
+            tokenizer = Tokenizer.from_pretrained(tokenizer_model)
+            return SplitterClass.from_huggingface_tokenizer(tokenizer, chunk_size)
+        except ImportError:
+            raise ImportError(
+                f"tokenizers package is required for HuggingFace tokenizer '{tokenizer_model}'. "
+                "Install with: pip install tokenizers"
+            )
+        except Exception as e:
+            # Fallback to character-based if model not found
+            import warnings
+
+            warnings.warn(
+                f"Failed to load tokenizer '{tokenizer_model}': {e}. "
+                "Falling back to character-based splitting."
+            )
+            return SplitterClass(chunk_size)
+
+    # Character-based splitting
+    return SplitterClass(chunk_size)
+
 
 def semantic_splitter(
     texts: list[str],
@@ -39,96 +134,15 @@ def semantic_splitter(
         ImportError: If semantic-text-splitter is not installed
         ValueError: If invalid parameters are provided
     """
-    try:
-        from semantic_text_splitter import CodeSplitter, MarkdownSplitter, TextSplitter
-    except ImportError:
-        raise ImportError(
-            "semantic-text-splitter is required for text splitting. "
-            "Install with: pip install semantic-text-splitter"
-        )
-
     if chunk_overlap is None:
         chunk_overlap = 0
 
-    # Create appropriate splitter based on type
-    if splitter_type == "code":
-        if not language:
-            raise ValueError("Language parameter is required for code splitting")
-
-        # Import appropriate tree-sitter language
-        # Map common file extensions to language names if needed
-        language_map = {
-            "py": "python",
-            "js": "javascript",
-            "ts": "typescript",
-            "rs": "rust",
-            "go": "go",
-            "cpp": "cpp",
-            "c": "c",
-            "java": "java",
-            "rb": "ruby",
-            "php": "php",
-            "html": "html",
-            "css": "css",
-            "json": "json",
-            "yaml": "yaml",
-            "yml": "yaml",
-            "toml": "toml",
-            "xml": "xml",
-            "sh": "bash",
-            "bash": "bash",
-        }
-
-        # Normalize language name
-        lang_name = language_map.get(language.lower(), language.lower())
-
-        try:
-            lang_module = __import__(f"tree_sitter_{lang_name}")
-            splitter = CodeSplitter(lang_module.language(), chunk_size)
-        except ImportError:
-            raise ImportError(
-                f"tree-sitter-{lang_name} is required for {language} code splitting. "
-                f"Install with: pip install tree-sitter-{lang_name}"
-            )
-    else:
-        # Choose between TextSplitter and MarkdownSplitter
-        SplitterClass = (
-            MarkdownSplitter if splitter_type == "markdown" else TextSplitter
-        )
-
-        # Create splitter with appropriate sizing strategy
-        if tokenizer_model:
-            if tokenizer_model.startswith(("gpt", "claude", "text-embedding")):
-                # OpenAI-style models using tiktoken
-                splitter = SplitterClass.from_tiktoken_model(
-                    tokenizer_model, chunk_size
-                )
-            else:
-                # HuggingFace tokenizer
-                try:
-                    from tokenizers import Tokenizer
-
-                    tokenizer = Tokenizer.from_pretrained(tokenizer_model)
-                    splitter = SplitterClass.from_huggingface_tokenizer(
-                        tokenizer, chunk_size
-                    )
-                except ImportError:
-                    raise ImportError(
-                        f"tokenizers package is required for HuggingFace tokenizer '{tokenizer_model}'. "
-                        "Install with: pip install tokenizers"
-                    )
-                except Exception as e:
-                    # Fallback to character-based if model not found
-                    import warnings
-
-                    warnings.warn(
-                        f"Failed to load tokenizer '{tokenizer_model}': {e}. "
-                        "Falling back to character-based splitting."
-                    )
-                    splitter = SplitterClass(chunk_size)
-        else:
-            # Character-based splitting
-            splitter = SplitterClass(chunk_size)
+    # Normalize the language before the cache lookup so aliases share an
+    # instance, then reuse one splitter per parameter set
+    lang_name = (
+        _LANGUAGE_MAP.get(language.lower(), language.lower()) if language else None
+    )
+    splitter = _get_splitter(splitter_type, chunk_size, tokenizer_model, lang_name)
 
     chunks = []
 
@@ -144,6 +158,73 @@ def semantic_splitter(
     return chunks
 
 
+# Sentence and paragraph boundaries for the dependency-free splitter
+_SENT_RE = re.compile(r"(?<=[.!?])\s+|\n{2,}")
+
+
+def _fast_split(text: str, chunk_size: int, overlap: int):
+    """Greedily pack sentences into chunks of at most chunk_size characters.
+
+    Boundary offsets are computed in one compiled-regex pass; each chunk
+    then ends at the last boundary that fits, found by bisection. A chunk
+    splits mid-sentence only when a single sentence exceeds chunk_size.
+    Yields chunks one at a time so callers can stream them.
+    """
+    n = len(text)
+    if n <= chunk_size:
+        if text:
+            yield text
+        return
+
+    ends = [m.end() for m in _SENT_RE.finditer(text)]
+    if not ends or ends[-1] != n:
+        ends.append(n)
+
+    start = 0
+    while start < n:
+        limit = start + chunk_size
+        if limit >= n:
+            yield text[start:]
+            break
+        # Last boundary within the size limit, if any lies past start
+        hi = bisect.bisect_right(ends, limit)
+        lo = bisect.bisect_right(ends, start)
+        end = ends[hi - 1] if hi > lo else limit
+        yield text[start:end]
+        next_start = end - overlap
+        start = next_start if next_start > start else end
+
+
+def regex_splitter(
+    texts: list[str],
+    chunk_size: int = 512,
+    chunk_overlap: int | None = None,
+    **kwargs,
+) -> list[tuple[int, str]]:
+    """Split texts on sentence boundaries without optional dependencies.
+
+    Pure-Python fallback to :func:`semantic_splitter` for plain text: one
+    linear regex scan finds sentence and paragraph boundaries, then a
+    greedy packer emits chunks of at most ``chunk_size`` characters.
+    Keyword arguments accepted by ``semantic_splitter`` are ignored.
+
+    Args:
+        texts: List of text strings to split
+        chunk_size: Maximum size of each chunk (default: 512)
+        chunk_overlap: Number of overlapping characters between chunks
+
+    Returns:
+        List of tuples (text_index, chunk_content) where text_index
+        indicates which input text the chunk came from
+    """
+    overlap = chunk_overlap or 0
+    chunks = []
+    for idx, text in enumerate(texts):
+        for chunk in _fast_split(text, chunk_size, overlap):
+            chunks.append((idx, chunk))
+    return chunks
+
+
 def split_extraction_results(
     results: list[ExtractionResult],
     chunk_size: int = 512,
@@ -158,14 +239,18 @@ def split_extraction_results(
         results: List of ExtractionResult objects to split
         chunk_size: Maximum size of each chunk
         chunk_overlap: Number of overlapping characters between chunks
-        splitter_fn: Optional custom splitter function. If None, uses semantic_splitter.
+        splitter_fn: Optional custom splitter function. If None, uses
+                    semantic_splitter, falling back to regex_splitter for plain
+                    text when semantic-text-splitter is not installed.
                     Function should accept (texts, chunk_size, chunk_overlap, **kwargs) and
                     return List[Tuple[text_index, chunk_content]]
         splitter_type: Type of splitter - "text", "markdown", or "code"
         tokenizer_model: Optional tokenizer model name for token-based splitting
 
     Returns:
-        List of new ExtractionResult objects, one per chunk
+        List of new ExtractionResult objects, one per chunk. Chunk metadata
+        is a ChainMap layering the chunk info over the shared source
+        metadata; ``to_frame_record_kwargs`` flattens it on serialization.
     """
     if splitter_fn is None:
         splitter_fn = semantic_splitter
@@ -183,39 +268,52 @@ def split_extraction_results(
         return results
 
     # Split texts
-    chunks = splitter_fn(
-        texts,
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        splitter_type=splitter_type,
-        tokenizer_model=tokenizer_model,
-    )
+    try:
+        chunks = splitter_fn(
+            texts,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            splitter_type=splitter_type,
+            tokenizer_model=tokenizer_model,
+        )
+    except ImportError:
+        # Only the default character-based text path has a drop-in
+        # replacement; token- and code-aware splitting still needs its deps
+        if (
+            splitter_fn is not semantic_splitter
+            or splitter_type != "text"
+            or tokenizer_model
+        ):
+            raise
+        chunks = regex_splitter(
+            texts, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        )
 
     # Create new ExtractionResult objects for chunks
     chunked_results = []
 
-    # Group chunks by source
-    chunk_groups = {}
+    # Group chunks by source; defaultdict avoids a membership test per chunk
+    chunk_groups: defaultdict[int, list[str]] = defaultdict(list)
     for text_idx, chunk_content in chunks:
-        if text_idx not in chunk_groups:
-            chunk_groups[text_idx] = []
         chunk_groups[text_idx].append(chunk_content)
 
     # Create results maintaining source metadata
     for text_idx, chunk_list in chunk_groups.items():
         source_result = source_results[text_idx]
 
+        # Chunk info that is invariant across this source's chunks
+        chunk_shared = {
+            "chunk_count": len(chunk_list),
+            "chunk_size": chunk_size,
+            "chunk_overlap": chunk_overlap or 0,
+            "original_content_length": len(source_result.content),
+        }
+
         for i, chunk_content in enumerate(chunk_list):
-            # Create new metadata including chunk info
-            chunk_metadata = source_result.metadata.copy()
-            chunk_metadata.update(
-                {
-                    "chunk_index": i,
-                    "chunk_count": len(chunk_list),
-                    "chunk_size": chunk_size,
-                    "chunk_overlap": chunk_overlap or 0,
-                    "original_content_length": len(source_result.content),
-                }
+            # Layer chunk info over the source metadata instead of copying
+            # the full dict per chunk; serialization materializes it later
+            chunk_metadata = ChainMap(
+                {"chunk_index": i}, chunk_shared, source_result.metadata
             )
 
             # Create new result for chunk
@@ -280,20 +378,7 @@ class ChunkingMixin:
 
         try:
             # Detect format for splitter type if not specified
-            if splitter_type == "text" and result.format:
-                if result.format.lower() in ["markdown", "md"]:
-                    splitter_type = "markdown"
-                elif result.format.lower() in [
-                    "py",
-                    "js",
-                    "ts",
-                    "java",
-                    "cpp",
-                    "c",
-                    "go",
-                    "rust",
-                ]:
-                    splitter_type = "code"
+            splitter_type = self._resolve_splitter_type(result, splitter_type)
 
             # Split the content
             chunks = semantic_splitter(
@@ -324,6 +409,80 @@ class ChunkingMixin:
 
         return result
 
+    def iter_chunks(
+        self,
+        source,
+        chunk_size: int = 512,
+        chunk_overlap: int | None = None,
+        encoding: str = "utf-8",
+        splitter_type: Literal["text", "markdown", "code"] = "text",
+        tokenizer_model: str | None = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """Extract and yield content chunks one at a time.
+
+        Streaming counterpart to :meth:`extract_with_chunking`: chunks are
+        yielded as they are cut, so downstream embedding or indexing can
+        start on the first chunk without waiting for the full list, and
+        only one chunk is held alongside the extracted content at a time.
+        Unlike :meth:`extract_with_chunking`, splitting errors propagate to
+        the caller since there is no result object to attach warnings to.
+
+        Args:
+            source: File path or content identifier
+            chunk_size: Maximum size of each chunk
+            chunk_overlap: Number of overlapping characters between chunks
+                (used by the regex fallback only)
+            encoding: Text encoding
+            splitter_type: Type of splitter - "text", "markdown", or "code"
+            tokenizer_model: Optional tokenizer model name for token-based splitting
+            **kwargs: Additional extractor-specific options
+
+        Yields:
+            Chunk strings in document order; nothing if extraction failed
+            or produced no content
+        """
+        result = self.extract(source, encoding=encoding, **kwargs)
+
+        if not result.success or not result.content:
+            return
+
+        splitter_type = self._resolve_splitter_type(result, splitter_type)
+
+        try:
+            language = (
+                result.format.lower()
+                if splitter_type == "code" and result.format
+                else None
+            )
+            lang_name = _LANGUAGE_MAP.get(language, language) if language else None
+            splitter = _get_splitter(
+                splitter_type, chunk_size, tokenizer_model, lang_name
+            )
+        except ImportError:
+            # Same fallback gating as split_extraction_results: only the
+            # character-based text path has a dependency-free replacement
+            if splitter_type != "text" or tokenizer_model:
+                raise
+            yield from _fast_split(result.content, chunk_size, chunk_overlap or 0)
+            return
+
+        yield from splitter.chunks(result.content)
+
+    @staticmethod
+    def _resolve_splitter_type(
+        result: ExtractionResult,
+        splitter_type: Literal["text", "markdown", "code"],
+    ) -> Literal["text", "markdown", "code"]:
+        """Infer markdown or code splitting from the extracted format."""
+        if splitter_type == "text" and result.format:
+            fmt = result.format.lower()
+            if fmt in ("markdown", "md"):
+                return "markdown"
+            if fmt in ("py", "js", "ts", "java", "cpp", "c", "go", "rust"):
+                return "code"
+        return splitter_type
+
     @staticmethod
     def chunk_text(
         text: str,
@@ -212,17 +212,33 @@ class FrameRecord:
         if len(record_batch) != 1:
             raise ValueError("from_arrow expects exactly 1 row")
         tbl = record_batch.to_pydict()
+        # Unwrap the single-row column lists from pydict conversion
+        row = {
+            k: (v[0] if isinstance(v, list) and len(v) > 0 else v)
+            for k, v in tbl.items()
+        }
+        return cls.from_row_dict(row, dataset_path=dataset_path)
+
+    @classmethod
+    def from_row_dict(
+        cls, row: dict[str, Any], dataset_path: Path | None = None
+    ) -> FrameRecord:
+        """Create a FrameRecord from one row of plain Python column values.
+
+        This is the cheap path for batch scans: callers can decode a whole
+        Arrow batch once with ``to_pydict()`` and build records from the
+        resulting column dict instead of allocating a 1-row Arrow sub-table
+        per record.
+        """
         # Extract vector list<fixed_size_list<float32>> value
-        vector_list = tbl["vector"][0]
+        vector_list = row["vector"]
         vector = np.array(vector_list, dtype=np.float32)
-        text_content = tbl["text_content"][0]
+        text_content = row["text_content"]
         # Extract metadata, handling missing fields gracefully
         metadata: dict[str, Any] = {}
-        for k, v in tbl.items():
+        for k, value in row.items():
             if k in {"text_content", "vector", "raw_data", "raw_data_type"}:
                 continue
-            # Handle list values (from pydict conversion)
-            value = v[0] if isinstance(v, list) and len(v) > 0 else v
             # Don't include None values in metadata
             if value is not None:
                 metadata[k] = value
@@ -248,17 +264,11 @@ class FrameRecord:
             metadata["relationships"] = cleaned_relationships
 
         # Extract raw data fields if present
-        # Handle case where raw_data might not be in the table (e.g., excluded from scan)
-        if "raw_data" in tbl:
-            raw_data = tbl.get("raw_data", [None])[0]
-        else:
-            raw_data = None
+        # Handle case where raw_data might not be in the row (e.g., excluded from scan)
+        raw_data = row.get("raw_data")
+        raw_data_type = row.get("raw_data_type")
+
 
-        if "raw_data_type" in tbl:
-            raw_data_type = tbl.get("raw_data_type", [None])[0]
-        else:
-            raw_data_type = None
-            
         # Ensure both are None if either is None (to satisfy FrameRecord validation)
         if raw_data is None or raw_data_type is None:
             raw_data = None
@@ -607,6 +617,52 @@ class FrameRecord:
         return self.metadata["uuid"]
 
 
+def _records_to_table(records: list[FrameRecord]) -> pa.Table:
+    """Build one N-row Arrow table for a batch of records.
+
+    Constructs each canonical-schema column in a single pass instead of
+    concatenating per-record 1-row tables, which allocates ~20 tiny arrays
+    and a table per record. Output is identical to concatenating each
+    record's ``to_table()`` result.
+    """
+    schema = get_schema(embed_dim=records[0].embed_dim)
+    metas = [rec.metadata for rec in records]
+    arrays: list[pa.Array] = []
+
+    for field in schema:
+        name = field.name
+        if name == "text_content":
+            arr = pa.array([rec.text_content for rec in records], type=pa.string())
+        elif name == "vector":
+            flat = np.concatenate([rec.vector for rec in records])
+            arr = pa.FixedSizeListArray.from_arrays(
+                pa.array(flat), field.type.list_size
+            )
+        elif name == "raw_data":
+            arr = pa.array(
+                [rec.raw_data for rec in records], type=pa.large_binary()
+            )
+        elif name == "raw_data_type":
+            arr = pa.array([rec.raw_data_type for rec in records], type=pa.string())
+        elif name == "custom_metadata":
+            # Convert dicts to lists of key-value structs for Lance compatibility
+            arr = pa.array(
+                [
+                    [
+                        {"key": k, "value": v}
+                        for k, v in meta.get("custom_metadata", {}).items()
+                    ]
+                    for meta in metas
+                ],
+                type=field.type,
+            )
+        else:
+            arr = pa.array([meta.get(name) for meta in metas], type=field.type)
+        arrays.append(arr)
+
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
 # ---------------------------------------------------------------------------
 # FrameDataset wrapper
 # ---------------------------------------------------------------------------
@@ -758,18 +814,16 @@ class FrameDataset:
         ValueError
             If metadata for any of the records is invalid according to the schema.
         """
-        tbls = []
+        records = list(records)
         for rec in records:
             ok, errs = validate_metadata_with_schema(rec.metadata)
             if not ok:
                 # Add context about which record failed
                 error_msg = f"Invalid metadata in record '{rec.title}' (UUID: {rec.uuid})"
                 raise ValidationError(error_msg, errors=errs)
-            tbls.append(rec.to_table())
-        if not tbls:
+        if not records:
             return
-        combined = pa.concat_tables(tbls)
-        self._dataset.insert(combined, mode="append")
+        self._dataset.insert(_records_to_table(records), mode="append")
 
     def merge(self, table: pa.Table, *, on: str = "uuid") -> None:
         """Merge additional columns using Lance merge."""
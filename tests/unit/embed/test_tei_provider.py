@@ -1,5 +1,6 @@
 """Unit tests for TEI embedding provider."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
@@ -21,7 +22,7 @@ class TestTEIProvider:
         assert provider.model == "BAAI/bge-base-en-v1.5"
         assert provider.api_base == "http://localhost:8080"
         assert provider.timeout == 30.0
-        assert provider.max_retries == 3
+        assert provider.max_retries == 2
         assert provider.truncate is True
         assert provider.normalize is True
         
@@ -53,53 +54,76 @@ class TestTEIProvider:
             
     @patch("contextframe.embed.tei_provider.httpx.Client")
     def test_client_property(self, mock_client_class):
-        """Test client property creates client with correct settings."""
+        """Test client property creates one pooled client per endpoint."""
+        from contextframe.embed import tei_provider
+
+        tei_provider._CLIENT_CACHE.clear()
         mock_client = Mock()
         mock_client_class.return_value = mock_client
-        
+
         provider = TEIProvider(model="test", api_key="bearer-token")
         client = provider.client
-        
+
         # Verify client is created with correct parameters
-        mock_client_class.assert_called_once_with(
-            base_url="http://localhost:8080",
-            headers={"Authorization": "Bearer bearer-token"},
-            timeout=30.0,
+        assert mock_client_class.call_count == 1
+        call_kwargs = mock_client_class.call_args.kwargs
+        # base_url is pre-parsed into an httpx.URL (a sentinel under the mock)
+        assert call_kwargs["base_url"] in (
+            "http://localhost:8080",
+            httpx_mock.URL.return_value,
         )
-        
+        assert call_kwargs["headers"] == {"Authorization": "Bearer bearer-token"}
+        assert call_kwargs["timeout"] == 30.0
+
         # Verify same client is returned on subsequent calls
         client2 = provider.client
         assert client is client2
+
+        # A second provider with the same settings shares the pooled client
+        provider2 = TEIProvider(model="other", api_key="bearer-token")
+        assert provider2.client is client
         assert mock_client_class.call_count == 1
+
+        tei_provider._CLIENT_CACHE.clear()
         
     @patch("contextframe.embed.tei_provider.httpx.Client")
     def test_embed_single_text(self, mock_client_class):
         """Test embedding single text."""
         # Setup mock response
         mock_response = Mock()
-        mock_response.json.return_value = [[0.1, 0.2, 0.3]]
+        mock_response.content = b"[[0.1, 0.2, 0.3]]"
+        mock_response.headers = {"content-type": "application/json"}
         mock_response.raise_for_status = Mock()
-        
+
         mock_client = Mock()
-        mock_client.post.return_value = mock_response
+        mock_client.send.return_value = mock_response
+        mock_client.build_request.return_value = Mock(
+            url="http://localhost:8080/embed",
+            headers={
+                "Accept": "application/octet-stream",
+                "Content-Type": "application/json",
+            },
+        )
         mock_client_class.return_value = mock_client
-        
+        httpx_mock.Request.reset_mock()
+
         provider = TEIProvider(model="test-model")
         result = provider.embed("Hello world")
-        
+
         # Verify request
-        mock_client.post.assert_called_once_with(
-            "/embed",
-            json={
-                "inputs": ["Hello world"],
-                "truncate": True,
-                "normalize": True,
-            }
-        )
-        
+        mock_client.send.assert_called_once()
+        req_kwargs = httpx_mock.Request.call_args.kwargs
+        assert json.loads(req_kwargs["content"]) == {
+            "inputs": ["Hello world"],
+            "truncate": True,
+            "normalize": True,
+        }
+        assert req_kwargs["headers"]["Accept"] == "application/octet-stream"
+
         # Verify result
         assert isinstance(result, EmbeddingResult)
-        assert result.embeddings == [[0.1, 0.2, 0.3]]
+        assert result.embeddings.dtype == np.float32
+        assert np.allclose(result.embeddings, [[0.1, 0.2, 0.3]])
         assert result.model == "test-model"
         assert result.dimension == 3
         assert result.usage is None
@@ -110,61 +134,76 @@ class TestTEIProvider:
         """Test embedding multiple texts."""
         # Setup mock response
         mock_response = Mock()
-        mock_response.json.return_value = [
-            [0.1, 0.2, 0.3],
-            [0.4, 0.5, 0.6],
-            [0.7, 0.8, 0.9],
-        ]
+        mock_response.content = (
+            b"[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]]"
+        )
+        mock_response.headers = {"content-type": "application/json"}
         mock_response.raise_for_status = Mock()
         
         mock_client = Mock()
-        mock_client.post.return_value = mock_response
+        mock_client.send.return_value = mock_response
+        mock_client.build_request.return_value = Mock(
+            url="http://localhost:8080/embed",
+            headers={
+                "Accept": "application/octet-stream",
+                "Content-Type": "application/json",
+            },
+        )
         mock_client_class.return_value = mock_client
-        
+        httpx_mock.Request.reset_mock()
+
         provider = TEIProvider(model="test-model")
         result = provider.embed(["Text 1", "Text 2", "Text 3"])
-        
+
         # Verify request
-        mock_client.post.assert_called_once_with(
-            "/embed",
-            json={
-                "inputs": ["Text 1", "Text 2", "Text 3"],
-                "truncate": True,
-                "normalize": True,
-            }
-        )
+        mock_client.send.assert_called_once()
+        req_kwargs = httpx_mock.Request.call_args.kwargs
+        assert json.loads(req_kwargs["content"]) == {
+            "inputs": ["Text 1", "Text 2", "Text 3"],
+            "truncate": True,
+            "normalize": True,
+        }
         
         # Verify result
         assert len(result.embeddings) == 3
-        assert result.embeddings[0] == [0.1, 0.2, 0.3]
+        assert np.allclose(result.embeddings[0], [0.1, 0.2, 0.3])
         assert result.dimension == 3
         
     @patch("contextframe.embed.tei_provider.httpx.Client")
     def test_embed_with_kwargs(self, mock_client_class):
         """Test embedding with custom kwargs."""
         mock_response = Mock()
-        mock_response.json.return_value = [[0.1, 0.2]]
+        mock_response.content = b"[[0.1, 0.2]]"
+        mock_response.headers = {"content-type": "application/json"}
         mock_response.raise_for_status = Mock()
         
         mock_client = Mock()
-        mock_client.post.return_value = mock_response
+        mock_client.send.return_value = mock_response
+        mock_client.build_request.return_value = Mock(
+            url="http://localhost:8080/embed",
+            headers={
+                "Accept": "application/octet-stream",
+                "Content-Type": "application/json",
+            },
+        )
         mock_client_class.return_value = mock_client
-        
+        httpx_mock.Request.reset_mock()
+
         provider = TEIProvider(model="test", truncate=True, normalize=True)
         result = provider.embed("Test", truncate=False, normalize=False)
-        
+
         # Verify kwargs override defaults
-        mock_client.post.assert_called_once_with(
-            "/embed",
-            json={
-                "inputs": ["Test"],
-                "truncate": False,
-                "normalize": False,
-            }
-        )
+        mock_client.send.assert_called_once()
+        req_kwargs = httpx_mock.Request.call_args.kwargs
+        assert json.loads(req_kwargs["content"]) == {
+            "inputs": ["Test"],
+            "truncate": False,
+            "normalize": False,
+        }
         
+    @patch("contextframe.embed.tei_provider.time.sleep")
     @patch("contextframe.embed.tei_provider.httpx.Client")
-    def test_embed_retry_on_failure(self, mock_client_class):
+    def test_embed_retry_on_failure(self, mock_client_class, mock_sleep):
         """Test retry logic on failures."""
         import httpx
         
@@ -173,11 +212,22 @@ class TestTEIProvider:
         timeout_error = httpx.TimeoutException("Request timed out")
         
         mock_client = Mock()
+        mock_client.build_request.return_value = Mock(
+            url="http://localhost:8080/embed",
+            headers={
+                "Accept": "application/octet-stream",
+                "Content-Type": "application/json",
+            },
+        )
         # Fail twice, then succeed
-        mock_client.post.side_effect = [
+        mock_client.send.side_effect = [
             connect_error,
             timeout_error,
-            Mock(json=Mock(return_value=[[0.1, 0.2]]), raise_for_status=Mock())
+            Mock(
+                content=b"[[0.1, 0.2]]",
+                headers={"content-type": "application/json"},
+                raise_for_status=Mock(),
+            )
         ]
         mock_client_class.return_value = mock_client
         
@@ -185,16 +235,24 @@ class TestTEIProvider:
         result = provider.embed("Test")
         
         # Should have tried 3 times
-        assert mock_client.post.call_count == 3
-        assert result.embeddings == [[0.1, 0.2]]
+        assert mock_client.send.call_count == 3
+        assert np.allclose(result.embeddings, [[0.1, 0.2]])
         
+    @patch("contextframe.embed.tei_provider.time.sleep")
     @patch("contextframe.embed.tei_provider.httpx.Client")
-    def test_embed_max_retries_exceeded(self, mock_client_class):
+    def test_embed_max_retries_exceeded(self, mock_client_class, mock_sleep):
         """Test failure when max retries exceeded."""
         import httpx
         
         mock_client = Mock()
-        mock_client.post.side_effect = httpx.ConnectError("Connection failed")
+        mock_client.build_request.return_value = Mock(
+            url="http://localhost:8080/embed",
+            headers={
+                "Accept": "application/octet-stream",
+                "Content-Type": "application/json",
+            },
+        )
+        mock_client.send.side_effect = httpx.ConnectError("Connection failed")
         mock_client_class.return_value = mock_client
         
         provider = TEIProvider(model="test", max_retries=2)
@@ -203,7 +261,7 @@ class TestTEIProvider:
             provider.embed("Test")
             
         assert "Failed to generate embeddings with TEI after 2 attempts" in str(exc_info.value)
-        assert mock_client.post.call_count == 2
+        assert mock_client.send.call_count == 2
         
     @patch("contextframe.embed.tei_provider.httpx.Client")
     def test_embed_http_errors(self, mock_client_class):
@@ -221,7 +279,14 @@ class TestTEIProvider:
         )
         
         mock_client = Mock()
-        mock_client.post.side_effect = error_413
+        mock_client.build_request.return_value = Mock(
+            url="http://localhost:8080/embed",
+            headers={
+                "Accept": "application/octet-stream",
+                "Content-Type": "application/json",
+            },
+        )
+        mock_client.send.side_effect = error_413
         mock_client_class.return_value = mock_client
         
         provider = TEIProvider(model="test", max_retries=1)
@@ -235,12 +300,12 @@ class TestTEIProvider:
     def test_get_model_info_success(self, mock_client_class):
         """Test successful model info retrieval."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "model_id": "BAAI/bge-base-en-v1.5",
             "max_input_length": 512,
             "version": "1.7.0",
             "backend": "onnx",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         
         mock_client = Mock()
@@ -280,7 +345,7 @@ class TestTEIProvider:
     def test_health_check_success(self, mock_client_class):
         """Test successful health check."""
         mock_response = Mock()
-        mock_response.json.return_value = {"status": "ok"}
+        mock_response.content = b'{"status": "ok"}'
         mock_response.headers = {"content-type": "application/json"}
         mock_response.raise_for_status = Mock()
         
@@ -337,14 +402,17 @@ class TestTEIProvider:
             
     @patch("contextframe.embed.tei_provider.httpx.Client")
     def test_client_cleanup(self, mock_client_class):
-        """Test client cleanup on deletion."""
+        """Test cached clients are closed by the atexit hook."""
+        from contextframe.embed import tei_provider
+
+        tei_provider._CLIENT_CACHE.clear()
         mock_client = Mock()
         mock_client_class.return_value = mock_client
-        
+
         provider = TEIProvider(model="test")
         _ = provider.client  # Create client
-        
-        # Manually call __del__
-        provider.__del__()
-        
-        mock_client.close.assert_called_once()
\ No newline at end of file
+
+        tei_provider._close_all()
+
+        mock_client.close.assert_called_once()
+        assert tei_provider._CLIENT_CACHE == {}
\ No newline at end of file
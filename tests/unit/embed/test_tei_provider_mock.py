@@ -19,7 +19,7 @@ def test_tei_provider_initialization():
         assert provider.model == "test-model"
         assert provider.api_base == "http://localhost:8080"
         assert provider.timeout == 30.0
-        assert provider.max_retries == 3
+        assert provider.max_retries == 2
         assert provider.truncate is True
         assert provider.normalize is True
 